@@ -13,23 +13,46 @@ from routes.demo_requests import demo_bp
 from routes.interviews import interview_bp
 from routes.auth import auth_bp
 from routes.test import test_bp
+from routes.exports import export_bp
+from routes.metrics import metrics_bp
+from routes.assignments import assignment_bp
+from utils.request_logging import init_request_logging
+from utils.compression import init_compression
+from utils.fast_json import init_json
+from utils.metrics import init_metrics
+from utils.profiling import init_profiling
 
-app = Flask(__name__)
-CORS(app, origins=config.CORS_ORIGINS, headers=config.CORS_HEADERS, methods=config.CORS_METHODS)
+def create_app():
+    """Build the application, used by wsgi.py and gunicorn as well as the dev server below"""
+    app = Flask(__name__)
+    CORS(
+        app, origins=config.CORS_ORIGINS, headers=config.CORS_HEADERS, methods=config.CORS_METHODS,
+        expose_headers=['Age', 'X-Snapshot-Stale', 'X-Profile']
+    )
+    init_json(app)
+    init_compression(app)
+    init_request_logging(app)
+    init_metrics(app)
+    init_profiling(app)
 
-# Register blueprints
-app.register_blueprint(demo_bp)
-app.register_blueprint(interview_bp)
-app.register_blueprint(auth_bp, url_prefix='/api/auth')
-app.register_blueprint(test_bp)
+    # Register blueprints
+    app.register_blueprint(demo_bp)
+    app.register_blueprint(interview_bp)
+    app.register_blueprint(auth_bp, url_prefix='/api/auth')
+    app.register_blueprint(test_bp)
+    app.register_blueprint(export_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(assignment_bp)
 
-# Handle OPTIONS requests for CORS preflight
-@app.route('/api/interviews', methods=['OPTIONS'])
-@app.route('/api/interviews/<interview_id>', methods=['OPTIONS'])
-@app.route('/api/demo-requests', methods=['OPTIONS'])
-@app.route('/api/auth/login', methods=['OPTIONS'])
-def handle_options(interview_id=None):
-    return make_response('', 200)
+    # Handle OPTIONS requests for CORS preflight
+    @app.route('/api/interviews', methods=['OPTIONS'])
+    @app.route('/api/interviews/<interview_id>', methods=['OPTIONS'])
+    @app.route('/api/demo-requests', methods=['OPTIONS'])
+    @app.route('/api/auth/login', methods=['OPTIONS'])
+    def handle_options(interview_id=None):
+        return make_response('', 200)
+
+    return app
 
 if __name__ == '__main__':
-    app.run(debug=config.FLASK_DEBUG, port=config.FLASK_PORT)
+    create_app().run(debug=config.FLASK_DEBUG, port=config.FLASK_PORT)
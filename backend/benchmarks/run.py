@@ -0,0 +1,355 @@
+"""
+Load-test both apps against the in-memory Supabase stand-in
+
+Each target is started under gunicorn with the production settings from
+gunicorn.conf.py, pointed at tests/fake_supabase.py, and every scenario is
+driven at a fixed concurrency. Per scenario it reports throughput,
+p50/p95/p99 latency, peak RSS of the gunicorn processes and upstream calls
+per request, and compares them with baselines.json:
+
+    python benchmarks/run.py                       # everything, fail on regressions
+    python benchmarks/run.py --target server --scenario list --concurrency 16
+    python benchmarks/run.py --update-baseline     # accept the current numbers
+
+Baselines are only compared when they were recorded with the same load
+settings, and they depend on the machine, so refresh them on the machine
+the benchmarks run on. The load generator shares the CPU with the app, so
+timings move by tens of percent between runs and the default tolerance is
+loose. Upstream calls per request barely move at all and are the sharpest
+signal, an extra Supabase round trip fails the run on any machine.
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import requests
+from backend.tests.fake_supabase import FakeSupabase
+from backend.benchmarks.scenarios import SCENARIOS, TARGETS, seed_rows
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+BASELINE_PATH = Path(__file__).resolve().with_name('baselines.json')
+
+# Settings that change the numbers, baselines recorded with others aren't comparable
+LOAD_SETTINGS = ('concurrency', 'requests', 'rounds', 'workers', 'rows', 'bulk_size', 'latency')
+
+# Latency changes smaller than this are noise, however large relative to the baseline
+LATENCY_SLACK_MS = 2.0
+CALLS_SLACK = 0.05
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of already sorted values"""
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, math.ceil(fraction * len(values)) - 1))
+    return values[index]
+
+def summarize(latencies, statuses, elapsed, upstream_calls, rss_bytes):
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': sum(1 for status in statuses if status is None or status >= 400),
+        'throughput': round(count / elapsed, 1) if elapsed else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2) if count else None,
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 2) if count else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2) if count else None,
+        'rss_mb': round(rss_bytes / (1024 * 1024), 1) if rss_bytes else None,
+        'upstream_calls_per_request': round(upstream_calls / count, 3) if count else None
+    }
+
+def combine(rounds):
+    """Median of each metric over repeated rounds, a single noisy round shouldn't fail the run"""
+    combined = {}
+    for metric in rounds[0]:
+        values = sorted(result[metric] for result in rounds if result[metric] is not None)
+        if metric in ('requests', 'errors'):
+            combined[metric] = sum(values)
+        else:
+            combined[metric] = values[len(values) // 2] if values else None
+    return combined
+
+def compare(baseline, current, tolerance):
+    """
+    Regressions of current against baseline for one scenario
+
+    Returns:
+        list: Human readable regressions, empty when there are none
+    """
+    regressions = []
+
+    def worse(metric, higher_is_better=False, slack=0.0):
+        before, after = baseline.get(metric), current.get(metric)
+        if before is None or after is None:
+            return
+        if higher_is_better:
+            regressed = after < before * (1 - tolerance)
+        else:
+            regressed = after > before * (1 + tolerance) + slack
+        if regressed:
+            regressions.append(f"{metric} {before} -> {after}")
+
+    worse('throughput', higher_is_better=True)
+    for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+        worse(metric, slack=LATENCY_SLACK_MS)
+    worse('rss_mb')
+    # Calls per request are close to deterministic, so any real increase counts
+    worse('upstream_calls_per_request', slack=CALLS_SLACK)
+    if current.get('errors') and not baseline.get('errors'):
+        regressions.append(f"errors 0 -> {current['errors']}")
+    return regressions
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def _process_rss(pid):
+    # VmRSS of the process and, recursively, its children (the gunicorn workers)
+    total = 0
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    total += int(line.split()[1]) * 1024
+        with open(f'/proc/{pid}/task/{pid}/children') as children:
+            for child in children.read().split():
+                total += _process_rss(int(child))
+    except (OSError, ValueError):
+        pass
+    return total
+
+class RssSampler:
+    """Tracks the peak RSS of a process tree while a scenario runs, Linux only"""
+
+    def __init__(self, pid, interval=0.1):
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _process_rss(self.pid))
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _process_rss(self.pid))
+
+def start_target(target, upstream_url, args, workdir):
+    """Start a target under gunicorn, returning (process, base URL, log path)"""
+    port = _free_port()
+    log_path = Path(workdir) / f'{target}.log'
+    env = dict(
+        os.environ,
+        SUPABASE_URL=upstream_url,
+        SUPABASE_KEY='benchmark',
+        GUNICORN_BIND=f'127.0.0.1:{port}',
+        GUNICORN_WORKERS=str(args.workers),
+        GUNICORN_THREADS=str(args.concurrency),
+        # Recycling a worker mid-run resets connections and RSS
+        GUNICORN_MAX_REQUESTS='0',
+        SNAPSHOT_PATH=str(Path(workdir) / f'{target}-snapshots.sqlite3'),
+        LOG_LEVEL=args.log_level,
+        FLASK_DEBUG='False'
+    )
+    with open(log_path, 'wb') as log:
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', TARGETS[target]],
+            cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{target} exited during startup, see {log_path}")
+        try:
+            requests.get(f'{base_url}/metrics', timeout=1)
+            return process, base_url, log_path
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{target} did not start within 30 seconds, see {log_path}")
+
+def stop_target(process):
+    process.terminate()
+    try:
+        process.wait(10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+def drive(base_url, target, build, context, total, concurrency, offset=0):
+    """Send total requests from concurrency threads, returning (latencies, statuses, elapsed)"""
+    counter = itertools.count(offset)
+    latencies, statuses = [], []
+    lock = threading.Lock()
+
+    def worker():
+        session = requests.Session()
+        while True:
+            n = next(counter)
+            if n >= offset + total:
+                return
+            spec = build(target, n, context)
+            url = base_url + spec.pop('url')
+            started = time.perf_counter()
+            try:
+                status = session.request(url=url, timeout=60, **spec).status_code
+            except requests.RequestException:
+                status = None
+            latency = time.perf_counter() - started
+            with lock:
+                latencies.append(latency)
+                statuses.append(status)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, statuses, time.perf_counter() - started
+
+def run_target(target, scenarios, fake, upstream_url, args, workdir):
+    fake.reset()
+    context = {
+        'interview_ids': [row['id'] for row in fake.tables['interviews']],
+        'bulk_size': args.bulk_size
+    }
+    process, base_url, log_path = start_target(target, upstream_url, args, workdir)
+    results = {}
+    try:
+        # Request numbers keep growing across scenarios so created rows never collide
+        offset = 0
+        for name in scenarios:
+            build, targets = SCENARIOS[name]
+            if target not in targets:
+                continue
+            drive(base_url, target, build, context, args.warmup, args.concurrency, offset)
+            offset += args.warmup
+
+            rounds = []
+            for _ in range(args.rounds):
+                fake.stats.clear()
+                with RssSampler(process.pid) as sampler:
+                    latencies, statuses, elapsed = drive(
+                        base_url, target, build, context, args.requests, args.concurrency, offset
+                    )
+                offset += args.requests
+                rounds.append(summarize(latencies, statuses, elapsed, sum(fake.stats.values()), sampler.peak))
+            results[name] = combine(rounds)
+            print_result(target, name, results[name])
+    finally:
+        stop_target(process)
+    if any(result['errors'] for result in results.values()):
+        print(f"  ({target} errors are logged in {log_path})")
+    return results
+
+def print_result(target, name, result):
+    print(
+        f"{target:<7} {name:<12} {result['throughput'] or 0:>9.1f} req/s"
+        f"  p50 {result['p50_ms'] or 0:>8.2f}  p95 {result['p95_ms'] or 0:>8.2f}  p99 {result['p99_ms'] or 0:>8.2f} ms"
+        f"  rss {result['rss_mb'] or 0:>6.1f} MB  upstream/req {result['upstream_calls_per_request'] or 0:.3f}"
+        f"  errors {result['errors']}"
+    )
+
+def check_baseline(baseline, settings, results, tolerance):
+    """Regressions against the stored baseline, or None when it isn't comparable"""
+    if not baseline or baseline.get('settings') != settings:
+        return None
+    regressions = []
+    for target, scenarios in results.items():
+        for name, result in scenarios.items():
+            previous = baseline['results'].get(target, {}).get(name)
+            if previous:
+                regressions += [f"{target} {name}: {change}" for change in compare(previous, result, tolerance)]
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark app.py and server.py against a local Supabase stand-in")
+    parser.add_argument('--target', choices=sorted(TARGETS) + ['all'], default='all')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="Scenario to run, repeat for several (default: all)")
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent clients, also the gunicorn threads")
+    parser.add_argument('--requests', type=int, default=400, help="Measured requests per scenario")
+    parser.add_argument('--rounds', type=int, default=3, help="Times each scenario is measured, the median is kept")
+    parser.add_argument('--warmup', type=int, default=20, help="Unmeasured requests before each scenario")
+    parser.add_argument('--workers', type=int, default=1, help="gunicorn workers")
+    parser.add_argument('--rows', type=int, default=500, help="Interviews the upstream starts with")
+    parser.add_argument('--bulk-size', type=int, default=20, help="Interviews per bulk create")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds the upstream adds to every call")
+    parser.add_argument('--log-level', default='WARNING', help="LOG_LEVEL for the apps under test")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="Allowed relative change before failing")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help="Store these results as the baseline")
+    parser.add_argument('--output', type=Path, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    targets = sorted(TARGETS) if args.target == 'all' else [args.target]
+    scenarios = args.scenario or list(SCENARIOS)
+    settings = {name: getattr(args, name) for name in LOAD_SETTINGS}
+
+    fake = FakeSupabase(latency=args.latency, seed=seed_rows(args.rows))
+    upstream_url = fake.start()
+    results = {}
+    workdir = tempfile.mkdtemp(prefix='benchmarks-')
+    try:
+        for target in targets:
+            results[target] = run_target(target, scenarios, fake, upstream_url, args, workdir)
+    finally:
+        fake.stop()
+    # Keep the app logs around when something failed
+    if not any(result['errors'] for scenario_results in results.values() for result in scenario_results.values()):
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {'settings': settings, 'results': results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    if args.update_baseline:
+        if baseline and baseline.get('settings') == settings:
+            # Keep the targets and scenarios that weren't run this time
+            for target, scenario_results in results.items():
+                baseline['results'].setdefault(target, {}).update(scenario_results)
+            report = baseline
+        args.baseline.write_text(json.dumps(report, indent=2, sort_keys=True) + '\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = check_baseline(baseline, settings, results, args.tolerance)
+    if regressions is None:
+        print("No baseline recorded with these settings, nothing to compare against")
+        return 0
+    if regressions:
+        print(f"Regressions beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("No regressions against the baseline")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Benchmark scenarios for the blueprint app (app.py) and the monolith (server.py)
+
+The two apps take different interview payloads, so each scenario builds its
+request per target. A scenario only runs against the targets that serve it.
+"""
+import os
+from datetime import date, timedelta
+
+# gunicorn entry point per target, started from backend/
+TARGETS = {
+    'app': 'wsgi:app',
+    'server': 'server:app'
+}
+
+RESUME = b'%PDF-1.4\n' + os.urandom(100 * 1024)
+
+def seed_rows(rows):
+    """Interviews and demo requests the upstream stand-in starts with"""
+    interviews = []
+    for index in range(rows):
+        day = date.today() + timedelta(days=1 + index % 60)
+        interviews.append({
+            'candidate_name': f'Candidate {index}',
+            'interviewer_name': f'Interviewer {index % 25}',
+            'scheduled_at': f'{day.isoformat()}T{9 + index % 8:02d}:00:00Z',
+            'interview_date': day.isoformat(),
+            'interview_time': f'{9 + index % 8:02d}:00',
+            'duration_minutes': 60,
+            'format': 'Online',
+            'job_role': 'Software Engineer',
+            'status': 'Scheduled'
+        })
+    demo_requests = [{
+        'first_name': f'First {index}',
+        'last_name': f'Last {index}',
+        'work_email': f'person{index}@example.com',
+        'service_interest': 'Job Interview',
+        'message': 'Benchmark'
+    } for index in range(50)]
+    return {'interviews': interviews, 'demo_requests': demo_requests}
+
+def _day(n):
+    # Spread created interviews over future days so the validators accept them
+    return (date.today() + timedelta(days=30 + n % 300)).isoformat()
+
+def _interview(target, n):
+    # A distinct interviewer per request keeps the double-booking check from rejecting them
+    if target == 'server':
+        return {
+            'candidateName': f'Bench {n}',
+            'interviewer': f'Bench Interviewer {n}',
+            'date': _day(n),
+            'time': '10:00',
+            'timezone': 'UTC',
+            'duration': 30,
+            'format': 'Online',
+            'jobRole': 'Software Engineer'
+        }
+    return {
+        'candidate_name': f'Bench {n}',
+        'interviewer_name': f'Bench Interviewer {n}',
+        'interview_date': _day(n),
+        'interview_time': '10:00'
+    }
+
+def _list(target, n, context):
+    return {'method': 'GET', 'url': '/api/interviews'}
+
+def _list_page(target, n, context):
+    return {'method': 'GET', 'url': '/api/interviews', 'params': {'limit': '50'}}
+
+def _detail(target, n, context):
+    ids = context['interview_ids']
+    return {'method': 'GET', 'url': f"/api/interviews/{ids[n % len(ids)]}"}
+
+def _create(target, n, context):
+    return {'method': 'POST', 'url': '/api/interviews', 'json': _interview(target, n)}
+
+def _bulk_create(target, n, context):
+    size = context['bulk_size']
+    return {
+        'method': 'POST', 'url': '/api/interviews/bulk',
+        'json': [_interview(target, n * size + index) for index in range(size)]
+    }
+
+def _upload(target, n, context):
+    return {
+        'method': 'POST', 'url': '/api/interviews',
+        'data': _interview(target, n),
+        'files': {'resume': ('resume.pdf', RESUME, 'application/pdf')}
+    }
+
+def _demo_list(target, n, context):
+    return {'method': 'GET', 'url': '/api/demo-requests'}
+
+def _demo_create(target, n, context):
+    return {'method': 'POST', 'url': '/api/demo-requests', 'json': {
+        'first_name': 'Bench',
+        'last_name': f'Person {n}',
+        'work_email': f'bench{n}@example.com',
+        'service_interest': 'Job Interview',
+        'agrees_to_terms': True
+    }}
+
+# name -> (request builder, targets that serve it)
+SCENARIOS = {
+    'list': (_list, ('app', 'server')),
+    'list_page': (_list_page, ('app', 'server')),
+    'detail': (_detail, ('app', 'server')),
+    'create': (_create, ('app', 'server')),
+    'bulk_create': (_bulk_create, ('app', 'server')),
+    # Only the monolith accepts a resume with the interview
+    'upload': (_upload, ('server',)),
+    # Only the blueprint app lists demo requests
+    'demo_list': (_demo_list, ('app',)),
+    'demo_create': (_demo_create, ('app', 'server'))
+}
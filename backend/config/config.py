@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 import logging
 
@@ -23,8 +24,114 @@ if not SUPABASE_KEY:
     logger.error("SUPABASE_KEY is not configured")
     raise ValueError("SUPABASE_KEY must be configured")
 
+# Supabase client tuning
+SUPABASE_POOL_SIZE = int(os.getenv('SUPABASE_POOL_SIZE', '100'))
+SUPABASE_TIMEOUT = float(os.getenv('SUPABASE_TIMEOUT', '10'))
+SUPABASE_ASYNC_CLIENT = os.getenv('SUPABASE_ASYNC_CLIENT', 'False') == 'True'
+
+# Interview read cache
+INTERVIEW_CACHE_TTL = float(os.getenv('INTERVIEW_CACHE_TTL', '10'))
+INTERVIEW_CACHE_SIZE = int(os.getenv('INTERVIEW_CACHE_SIZE', '256'))
+# Streamed list bodies larger than this are sent on without being kept for the cache
+INTERVIEW_CACHE_MAX_BYTES = int(os.getenv('INTERVIEW_CACHE_MAX_BYTES', str(1024 * 1024)))
+
+# Maximum page size for paginated list endpoints
+INTERVIEWS_MAX_LIMIT = int(os.getenv('INTERVIEWS_MAX_LIMIT', '1000'))
+
+# Stream unpaginated interview lists straight from Supabase instead of re-encoding them
+INTERVIEWS_PASSTHROUGH = os.getenv('INTERVIEWS_PASSTHROUGH', 'True') == 'True'
+
+# Rows fetched per Supabase request when streaming exports
+EXPORT_PAGE_SIZE = int(os.getenv('EXPORT_PAGE_SIZE', '1000'))
+
+# Bulk interview creation
+BULK_MAX_INTERVIEWS = int(os.getenv('BULK_MAX_INTERVIEWS', '1000'))
+BULK_INSERT_CHUNK_SIZE = int(os.getenv('BULK_INSERT_CHUNK_SIZE', '100'))
+
+# Storage uploads, Supabase's resumable endpoint expects 6MB parts
+STORAGE_READ_SIZE = int(os.getenv('STORAGE_READ_SIZE', str(64 * 1024)))
+STORAGE_CHUNK_SIZE = int(os.getenv('STORAGE_CHUNK_SIZE', str(6 * 1024 * 1024)))
+STORAGE_RESUMABLE_THRESHOLD = int(os.getenv('STORAGE_RESUMABLE_THRESHOLD', str(6 * 1024 * 1024)))
+STORAGE_UPLOAD_RETRIES = int(os.getenv('STORAGE_UPLOAD_RETRIES', '3'))
+
+# Background resume uploads
+ASYNC_RESUME_UPLOAD = os.getenv('ASYNC_RESUME_UPLOAD', 'False') == 'True'
+UPLOAD_SPOOL_DIR = os.getenv('UPLOAD_SPOOL_DIR', os.path.join(tempfile.gettempdir(), 'interview-uploads'))
+UPLOAD_WORKERS = int(os.getenv('UPLOAD_WORKERS', '4'))
+UPLOAD_RETRIES = int(os.getenv('UPLOAD_RETRIES', '3'))
+UPLOAD_RETRY_BACKOFF = float(os.getenv('UPLOAD_RETRY_BACKOFF', '1'))
+UPLOAD_JOB_TTL = float(os.getenv('UPLOAD_JOB_TTL', '3600'))
+UPLOAD_JOB_LIMIT = int(os.getenv('UPLOAD_JOB_LIMIT', '10000'))
+UPLOAD_PENDING_TIMEOUT = float(os.getenv('UPLOAD_PENDING_TIMEOUT', '1800'))
+
+# Interviewer double-booking checks: reject, flag or off
+CONFLICT_MODE = os.getenv('CONFLICT_MODE', 'reject').lower()
+CONFLICT_INDEX_TTL = float(os.getenv('CONFLICT_INDEX_TTL', '300'))
+
+# Slot suggestions
+SCHEDULER_SLOT_MINUTES = int(os.getenv('SCHEDULER_SLOT_MINUTES', '15'))
+SCHEDULER_MAX_DAYS = int(os.getenv('SCHEDULER_MAX_DAYS', '31'))
+SCHEDULER_MAX_SUGGESTIONS = int(os.getenv('SCHEDULER_MAX_SUGGESTIONS', '50'))
+SCHEDULER_CACHE_TTL = float(os.getenv('SCHEDULER_CACHE_TTL', '60'))
+
+# Batch interviewer assignment
+ASSIGNMENT_MAX_APPLICATIONS = int(os.getenv('ASSIGNMENT_MAX_APPLICATIONS', '10000'))
+# Ids per in.() filter when reading applications and role skills
+ASSIGNMENT_ID_BATCH_SIZE = int(os.getenv('ASSIGNMENT_ID_BATCH_SIZE', '200'))
+
+# Timezone for interview dates and times sent without one
+DEFAULT_TIMEZONE = os.getenv('DEFAULT_TIMEZONE', 'UTC')
+
+# Response compression, brotli is used when the Brotli package is installed
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'True') == 'True'
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+COMPRESSION_BROTLI_LEVEL = int(os.getenv('COMPRESSION_BROTLI_LEVEL', '4'))
+
+# Production server, see gunicorn.conf.py. 0 workers means 2 per CPU plus one
+GUNICORN_BIND = os.getenv('GUNICORN_BIND', '')
+GUNICORN_WORKERS = int(os.getenv('GUNICORN_WORKERS', '0'))
+GUNICORN_THREADS = int(os.getenv('GUNICORN_THREADS', '4'))
+GUNICORN_TIMEOUT = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+GUNICORN_KEEPALIVE = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+GUNICORN_MAX_REQUESTS = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+GUNICORN_MAX_REQUESTS_JITTER = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+GUNICORN_PRELOAD = os.getenv('GUNICORN_PRELOAD', 'True') == 'True'
+
+# Supabase resilience: connect timeout, retries with jittered backoff, a retry
+# budget shared by all calls, per-table circuit breakers and hedged GETs (0 disables)
+SUPABASE_CONNECT_TIMEOUT = float(os.getenv('SUPABASE_CONNECT_TIMEOUT', '3'))
+SUPABASE_RETRIES = int(os.getenv('SUPABASE_RETRIES', '2'))
+SUPABASE_BACKOFF_BASE = float(os.getenv('SUPABASE_BACKOFF_BASE', '0.1'))
+SUPABASE_BACKOFF_MAX = float(os.getenv('SUPABASE_BACKOFF_MAX', '2'))
+SUPABASE_RETRY_BUDGET_RATIO = float(os.getenv('SUPABASE_RETRY_BUDGET_RATIO', '0.1'))
+SUPABASE_RETRY_BUDGET_MIN = float(os.getenv('SUPABASE_RETRY_BUDGET_MIN', '1'))
+SUPABASE_BREAKER_THRESHOLD = int(os.getenv('SUPABASE_BREAKER_THRESHOLD', '5'))
+SUPABASE_BREAKER_RESET = float(os.getenv('SUPABASE_BREAKER_RESET', '10'))
+SUPABASE_HEDGE_DELAY = float(os.getenv('SUPABASE_HEDGE_DELAY', '0'))
+
+# Last-known-good snapshots served while Supabase is refreshed or unavailable
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', os.path.join(tempfile.gettempdir(), 'interview-snapshots.sqlite3'))
+SNAPSHOT_TTL = float(os.getenv('SNAPSHOT_TTL', '30'))
+
+# On-demand request profiling: requests carrying PROFILE_HEADER, or picked at
+# PROFILE_SAMPLE_RATE, are sampled every PROFILE_INTERVAL seconds and written
+# to PROFILE_DIR as speedscope JSON or collapsed stacks
+PROFILE_ENABLED = os.getenv('PROFILE_ENABLED', 'False') == 'True'
+PROFILE_HEADER = os.getenv('PROFILE_HEADER', 'X-Profile')
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_INTERVAL = float(os.getenv('PROFILE_INTERVAL', '0.005'))
+PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'interview-profiles'))
+PROFILE_FORMAT = os.getenv('PROFILE_FORMAT', 'speedscope').lower()
+
+# Logging
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', '1'))
+LOG_BODY_LIMIT = int(os.getenv('LOG_BODY_LIMIT', '1024'))
+
 # Flask configuration
-FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'True') == 'True'
+FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'False') == 'True'
 FLASK_PORT = int(os.getenv('FLASK_PORT', '5000'))
 
 # CORS configuration
@@ -34,6 +141,44 @@ CORS_METHODS = os.getenv('CORS_METHODS', 'GET, POST, PUT, DELETE, OPTIONS')
 
 # Log configuration
 logger.info(f"Supabase URL: {SUPABASE_URL}")
+logger.info(f"Supabase Pool Size: {SUPABASE_POOL_SIZE}")
+logger.info(f"Supabase Timeout: {SUPABASE_TIMEOUT}")
+logger.info(f"Supabase Async Client: {SUPABASE_ASYNC_CLIENT}")
+logger.info(f"Interview Cache TTL: {INTERVIEW_CACHE_TTL}")
+logger.info(f"Interview Cache Size: {INTERVIEW_CACHE_SIZE}")
+logger.info(f"Interview Cache Max Bytes: {INTERVIEW_CACHE_MAX_BYTES}")
+logger.info(f"Interviews Max Limit: {INTERVIEWS_MAX_LIMIT}")
+logger.info(f"Interviews Passthrough: {INTERVIEWS_PASSTHROUGH}")
+logger.info(f"Export Page Size: {EXPORT_PAGE_SIZE}")
+logger.info(f"Bulk Max Interviews: {BULK_MAX_INTERVIEWS}")
+logger.info(f"Bulk Insert Chunk Size: {BULK_INSERT_CHUNK_SIZE}")
+logger.info(f"Storage Chunk Size: {STORAGE_CHUNK_SIZE}")
+logger.info(f"Storage Resumable Threshold: {STORAGE_RESUMABLE_THRESHOLD}")
+logger.info(f"Async Resume Upload: {ASYNC_RESUME_UPLOAD}")
+logger.info(f"Upload Workers: {UPLOAD_WORKERS}")
+logger.info(f"Upload Pending Timeout: {UPLOAD_PENDING_TIMEOUT}")
+logger.info(f"Conflict Mode: {CONFLICT_MODE}")
+logger.info(f"Scheduler Slot Minutes: {SCHEDULER_SLOT_MINUTES}")
+logger.info(f"Assignment Max Applications: {ASSIGNMENT_MAX_APPLICATIONS}")
+logger.info(f"Assignment Id Batch Size: {ASSIGNMENT_ID_BATCH_SIZE}")
+logger.info(f"Default Timezone: {DEFAULT_TIMEZONE}")
+logger.info(f"Compression Enabled: {COMPRESSION_ENABLED}")
+logger.info(f"Compression Min Size: {COMPRESSION_MIN_SIZE}")
+logger.info(f"Compression Gzip Level: {COMPRESSION_GZIP_LEVEL}")
+logger.info(f"Compression Brotli Level: {COMPRESSION_BROTLI_LEVEL}")
+logger.info(f"Gunicorn Workers: {GUNICORN_WORKERS}")
+logger.info(f"Gunicorn Threads: {GUNICORN_THREADS}")
+logger.info(f"Gunicorn Preload: {GUNICORN_PRELOAD}")
+logger.info(f"Supabase Retries: {SUPABASE_RETRIES}")
+logger.info(f"Supabase Breaker Threshold: {SUPABASE_BREAKER_THRESHOLD}")
+logger.info(f"Supabase Hedge Delay: {SUPABASE_HEDGE_DELAY}")
+logger.info(f"Snapshot Path: {SNAPSHOT_PATH}")
+logger.info(f"Snapshot TTL: {SNAPSHOT_TTL}")
+logger.info(f"Profile Enabled: {PROFILE_ENABLED}")
+logger.info(f"Profile Sample Rate: {PROFILE_SAMPLE_RATE}")
+logger.info(f"Profile Dir: {PROFILE_DIR}")
+logger.info(f"Log Level: {LOG_LEVEL}")
+logger.info(f"Log Sample Rate: {LOG_SAMPLE_RATE}")
 logger.info(f"Flask Debug: {FLASK_DEBUG}")
 logger.info(f"Flask Port: {FLASK_PORT}")
 logger.info(f"CORS Origins: {CORS_ORIGINS}")
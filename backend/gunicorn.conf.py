@@ -0,0 +1,43 @@
+# gunicorn settings, loaded automatically when gunicorn is started from backend/
+#
+#   gunicorn wsgi:app
+#
+# Every value comes from config/config.py, so it can be tuned through the
+# environment like the rest of the app. It is imported as app_config because
+# gunicorn would read a module-level "config" as one of its own settings.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import config as app_config
+
+def _cpu_count():
+    # Respect CPU affinity and container cpusets where the platform exposes them
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+bind = app_config.GUNICORN_BIND or f"0.0.0.0:{app_config.FLASK_PORT}"
+
+# Requests mostly wait on Supabase, so each worker serves several at once on threads
+workers = app_config.GUNICORN_WORKERS or _cpu_count() * 2 + 1
+threads = app_config.GUNICORN_THREADS
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Longer than a Supabase call can take, so slow upstreams time out before the worker does
+timeout = max(app_config.GUNICORN_TIMEOUT, int(app_config.SUPABASE_TIMEOUT) + 5)
+graceful_timeout = app_config.GUNICORN_TIMEOUT
+keepalive = app_config.GUNICORN_KEEPALIVE
+
+# Recycle workers now and then, jittered so they don't all restart together
+max_requests = app_config.GUNICORN_MAX_REQUESTS
+max_requests_jitter = app_config.GUNICORN_MAX_REQUESTS_JITTER
+
+# Import the app once in the master and fork it, background threads start lazily in the workers
+preload_app = app_config.GUNICORN_PRELOAD
+
+accesslog = '-'
+errorlog = '-'
+loglevel = app_config.LOG_LEVEL.lower()
@@ -0,0 +1,14 @@
+from flask import Blueprint, request, jsonify
+from services.assignments import assign_applications
+
+assignment_bp = Blueprint('assignment', __name__)
+
+@assignment_bp.route('/api/assignments', methods=['POST'])
+def assign_applications_route():
+    data = request.get_json(silent=True)
+    response, status_code, message = assign_applications(data)
+    return jsonify({
+        'success': status_code < 400,
+        'message': message,
+        'data': response
+    }), status_code
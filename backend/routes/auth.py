@@ -1,7 +1,8 @@
 from flask import Blueprint, request, jsonify
 from flask_cors import cross_origin
 from services.auth import authenticate_user
-from utils.validators import validate_email
+from utils.validators import LOGIN_SCHEMA
+from utils.schema import error_message
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -11,13 +12,10 @@ def login():
     try:
         data = request.get_json()
         
-        # Validate required fields
-        if not all(key in data for key in ['email', 'password']):
-            return jsonify({'error': 'Missing required fields'}), 400
-
-        # Validate email format
-        if not validate_email(data['email']):
-            return jsonify({'error': 'Invalid email format'}), 400
+        # Validate required fields and email format
+        _, errors = LOGIN_SCHEMA.validate(data)
+        if errors:
+            return jsonify({'error': error_message(errors), 'errors': errors}), 400
 
         # Authenticate user
         user = authenticate_user(data['email'], data['password'])
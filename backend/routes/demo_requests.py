@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
-from backend.services.demo_requests import create_demo_request, get_demo_requests
-from backend.utils.supabase import supabase_request
+from services.demo_requests import create_demo_request, get_demo_requests_snapshot, demo_request_snapshots
+from utils.supabase import supabase_request
+from utils.etags import conditional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,14 +28,24 @@ def create_demo_request_route():
         }), 500
 
 @demo_bp.route('/api/demo-requests', methods=['GET'])
+@conditional
 def get_demo_requests_route():
     try:
-        response, status_code, message = get_demo_requests()
-        return jsonify({
+        snapshot, status_code, message = get_demo_requests_snapshot()
+        response = jsonify({
             'success': status_code < 400,
             'message': message,
-            'data': response
-        }), status_code
+            'data': snapshot.value if snapshot else None
+        })
+
+        if snapshot:
+            # Tell the admin page how old the rows are and whether a refresh is pending
+            age = snapshot.age()
+            response.headers['Age'] = str(int(age))
+            if age >= demo_request_snapshots.ttl:
+                response.headers['X-Snapshot-Stale'] = 'true'
+
+        return response, status_code
 
     except Exception as e:
         logger.exception("Internal server error")
@@ -58,6 +69,7 @@ def delete_demo_requests_route():
             }), 500
             
         if response['status_code'] == 200:
+            demo_request_snapshots.invalidate('demo_requests')
             return jsonify({
                 'success': True,
                 'message': 'Demo requests deleted successfully',
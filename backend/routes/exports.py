@@ -0,0 +1,57 @@
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from services.exports import get_export_rows
+from utils.fast_json import dumps
+import csv
+import logging
+
+logger = logging.getLogger(__name__)
+
+export_bp = Blueprint('export', __name__)
+
+class _Echo:
+    # csv.writer target that hands each formatted line straight back
+    def write(self, value):
+        return value
+
+def _ndjson(rows):
+    for row in rows:
+        yield dumps(row, default=str) + b'\n'
+
+def _csv(rows):
+    writer = csv.writer(_Echo())
+    columns = None
+    for row in rows:
+        if columns is None:
+            columns = list(row.keys())
+            yield writer.writerow(columns)
+        yield writer.writerow([row.get(column) for column in columns])
+
+FORMATS = {
+    'ndjson': (_ndjson, 'application/x-ndjson'),
+    'csv': (_csv, 'text/csv')
+}
+
+@export_bp.route('/api/export/<resource>', methods=['GET'])
+def export_route(resource):
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in FORMATS:
+        return jsonify({
+            'success': False,
+            'message': f"Invalid format. Valid options are: {', '.join(FORMATS)}",
+            'data': None
+        }), 400
+
+    rows, status_code, message = get_export_rows(resource, request.args)
+    if status_code >= 400:
+        return jsonify({
+            'success': False,
+            'message': message,
+            'data': None
+        }), status_code
+
+    serialize, mimetype = FORMATS[export_format]
+    return Response(
+        stream_with_context(serialize(rows)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={resource}.{export_format}'}
+    )
@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
-from backend.services.interviews import create_interview, get_interviews, get_interview, update_interview, delete_interview
+from services.interviews import create_interview, create_interviews_bulk, get_interviews, get_interview, update_interview, delete_interview
+from utils.pagination import parse_limit, next_cursor
+from utils.etags import conditional
+from config import config
 
 interview_bp = Blueprint('interview', __name__)
 
@@ -13,16 +16,35 @@ def create_interview_route():
         'data': response
     }), status_code
 
+@interview_bp.route('/api/interviews/bulk', methods=['POST'])
+def create_interviews_bulk_route():
+    data = request.json
+    response, status_code, message = create_interviews_bulk(data)
+    return jsonify({
+        'success': status_code == 201,
+        'message': message,
+        'data': response
+    }), status_code
+
 @interview_bp.route('/api/interviews', methods=['GET'])
+@conditional
 def get_interviews_route():
-    response, status_code, message = get_interviews()
-    return jsonify({
+    response, status_code, message = get_interviews(request.args)
+    result = {
         'success': status_code < 400,
         'message': message,
         'data': response
-    }), status_code
+    }
+
+    # Only paginated requests get a cursor, the limit was validated by the service
+    if status_code < 400 and request.args.get('limit'):
+        limit = parse_limit(request.args.get('limit'), config.INTERVIEWS_MAX_LIMIT)
+        result['next_cursor'] = next_cursor(response, limit)
+
+    return jsonify(result), status_code
 
 @interview_bp.route('/api/interviews/<interview_id>', methods=['GET'])
+@conditional
 def get_interview_route(interview_id):
     response, status_code, message = get_interview(interview_id)
     return jsonify({
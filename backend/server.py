@@ -2,15 +2,39 @@ from flask import Flask, request, jsonify, make_response
 from flask_cors import CORS
 import os
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import requests
 from dotenv import load_dotenv
+from config import config
+from utils.cache import InterviewCache, TTLCache
+from utils.conflicts import ConflictIndex
+from utils.scheduler import SlotFinder
+from utils.schema import error_message
+from utils.datetimes import to_utc, resolve_timezone
+from utils.validators import INTERVIEW_FORM_SCHEMA, DEMO_REQUEST_FORM_SCHEMA, SUGGEST_SLOTS_SCHEMA
+from utils.storage import upload_file_stream
+from utils.upload_queue import UploadQueue, RESUME_PENDING, RESUME_FAILED, upload_status, pending_expired
+from utils.request_logging import init_request_logging
+from utils.compression import init_compression
+from utils.fast_json import init_json, dumps, loads
+from utils.passthrough import passthrough_response, body_response
+from utils.etags import conditional, etag_for
+from utils.metrics import REGISTRY, init_metrics, track_supabase_call, table_name
+from utils.profiling import init_profiling
+from utils.resilience import ResilientClient, CircuitOpenError
+from utils.pagination import parse_fields, parse_limit, keyset_filter, next_cursor
+from urllib.parse import quote
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
+init_json(app)
+init_compression(app)
+init_request_logging(app)
+init_metrics(app)
+init_profiling(app)
 
 # Supabase configuration
 SUPABASE_URL = os.getenv('SUPABASE_URL', 'https://ehcobpmrrtdkebphqaui.supabase.co')
@@ -19,11 +43,23 @@ STORAGE_BUCKET = 'interview-documents'
 
 # Configure requests session for better connection handling
 session = requests.Session()
-adapter = requests.adapters.HTTPAdapter(max_retries=3)
+adapter = requests.adapters.HTTPAdapter()
 session.mount('https://', adapter)
 
+# Timeouts, backoff retries, circuit breakers and hedging, in place of the adapter's blind retries
+resilient = ResilientClient(session)
+
+# Cache for interview reads, invalidated by the write endpoints below
+interview_cache = InterviewCache(maxsize=config.INTERVIEW_CACHE_SIZE, ttl=config.INTERVIEW_CACHE_TTL)
+
 # Helper function to make requests to Supabase
-def supabase_request(endpoint, method='GET', data=None, headers=None, files=None):
+def supabase_request(endpoint, method='GET', data=None, headers=None, files=None, prefer=None):
+    with track_supabase_call(endpoint, method) as call:
+        response, status_code = _supabase_request(endpoint, method, data, headers, files, prefer)
+        call.status = status_code
+    return response, status_code
+
+def _supabase_request(endpoint, method, data, headers, files, prefer):
     if headers is None:
         headers = {}
     
@@ -34,31 +70,68 @@ def supabase_request(endpoint, method='GET', data=None, headers=None, files=None
         'Content-Type': 'application/json' if method in ['POST', 'PUT'] else 'application/json'
     })
     
+    # Ask PostgREST to return the written rows so no follow-up read is needed
+    if prefer:
+        headers['Prefer'] = f'return={prefer}'
+    
     url = f"{SUPABASE_URL}{endpoint}"
     
     try:
-        if method == 'GET':
-            response = session.get(url, headers=headers)
-        elif method == 'POST':
-            if files:
-                response = session.post(url, headers=headers, data=data, files=files)
-            else:
-                response = session.post(url, headers=headers, json=data)
-        elif method == 'PUT':
-            response = session.put(url, headers=headers, json=data)
-        elif method == 'DELETE':
-            response = session.delete(url, headers=headers)
-        else:
+        if method not in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
             return {'error': 'Invalid method'}, 400
         
+        if method == 'POST' and files:
+            response = resilient.request(method, url, table_name(endpoint), headers=headers, data=data, files=files)
+        elif method in ('POST', 'PUT', 'PATCH'):
+            response = resilient.request(method, url, table_name(endpoint), headers=headers, data=dumps(data))
+        else:
+            response = resilient.request(method, url, table_name(endpoint), headers=headers)
+        
         response.raise_for_status()
-        return response.json(), response.status_code
+        
+        # Writes without a Prefer header come back as 201/204 with no body
+        if not response.content:
+            return None, response.status_code
+        return loads(response.content), response.status_code
+    except CircuitOpenError as e:
+        # Fail fast while Supabase recovers
+        app.logger.warning(f"Supabase request skipped: {str(e)}")
+        return {
+            'error': str(e)
+        }, 503
     except requests.exceptions.RequestException as e:
         app.logger.error(f"Supabase request failed: {str(e)}")
         return {
             'error': f"Failed to connect to Supabase: {str(e)}"
         }, 500
 
+# Open a GET against Supabase without reading the body, for passthrough responses
+def supabase_stream(endpoint):
+    headers = {
+        'apikey': SUPABASE_KEY,
+        'Authorization': f'Bearer {SUPABASE_KEY}'
+    }
+    url = f"{SUPABASE_URL}{endpoint}"
+    
+    with track_supabase_call(endpoint, 'GET') as call:
+        try:
+            response = resilient.request('GET', url, table_name(endpoint), headers=headers, stream=True)
+            call.status = response.status_code
+            response.raise_for_status()
+            return response, None, response.status_code
+        except CircuitOpenError as e:
+            app.logger.warning(f"Supabase request skipped: {str(e)}")
+            return None, {
+                'error': str(e)
+            }, 503
+        except requests.exceptions.RequestException as e:
+            if e.response is not None:
+                e.response.close()
+            app.logger.error(f"Supabase request failed: {str(e)}")
+            return None, {
+                'error': f"Failed to connect to Supabase: {str(e)}"
+            }, 500
+
 # Helper function to upload file to Supabase Storage
 def upload_file_to_supabase(file, candidate_name):
     try:
@@ -68,62 +141,126 @@ def upload_file_to_supabase(file, candidate_name):
         file_name = f"{candidate_name.replace(' ', '_')}_{timestamp}.{file_ext}"
         file_path = f"resumes/{file_name}"
         
-        # Upload to Supabase Storage
-        endpoint = f"/storage/v1/object/{STORAGE_BUCKET}/{file_path}"
-        
-        headers = {
-            'Cache-Control': 'max-age=3600'
-        }
-        
-        data = file.read()
-        file.seek(0)  # Reset file pointer
-        
-        response, status_code = supabase_request(
-            endpoint, 
-            method='POST', 
-            headers=headers, 
-            data=data
+        # Stream to Supabase Storage without reading the whole file
+        return upload_file_stream(
+            file,
+            file_path,
+            SUPABASE_URL,
+            SUPABASE_KEY,
+            bucket=STORAGE_BUCKET,
+            session=session
         )
-        
-        if status_code >= 400:
-            return None
-        
-        # Get public URL
-        public_url = f"{SUPABASE_URL}/storage/v1/object/public/{STORAGE_BUCKET}/{file_path}"
-        return public_url
     
     except Exception as e:
         app.logger.error(f"Error uploading file: {str(e)}")
         return None
 
-# Validate date format and check if it's in the future
-def validate_date(date_string):
-    try:
-        date_format = "%Y-%m-%d"
-        date_obj = datetime.strptime(date_string, date_format)
-        current_date = datetime.now()
-        
-        # Set time to midnight for comparison
-        current_date = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        if date_obj < current_date:
-            return False, "Date must be in the future"
-        
-        return True, None
-    
-    except ValueError:
-        return False, "Invalid date format. Use YYYY-MM-DD"
+# Store a background upload's URL on its interview
+def attach_resume_url(interview_id, resume_url):
+    response, status_code = supabase_request(
+        f"/rest/v1/interviews?id=eq.{interview_id}",
+        method='PATCH',
+        data={'resume_url': resume_url}
+    )
+    interview_cache.invalidate(interview_id=interview_id)
+    return status_code < 400
 
-# Validate time format (HH:MM)
-def validate_time(time_string):
-    try:
-        time_format = "%H:%M"
-        datetime.strptime(time_string, time_format)
-        return True, None
+# Record on the interview that its background upload gave up, unless the row has moved on
+def mark_resume_failed(interview_id, error):
+    supabase_request(
+        f"/rest/v1/interviews?id=eq.{interview_id}&resume_url=eq.{quote(RESUME_PENDING)}",
+        method='PATCH',
+        data={'resume_url': RESUME_FAILED}
+    )
+    interview_cache.invalidate(interview_id=interview_id)
+
+# Worker pool for resume uploads submitted with asyncUpload
+upload_queue = UploadQueue(upload_file_to_supabase, attach_resume_url, mark_resume_failed)
+
+# Read the slots still to come for the double-booking index, a page at a time
+def load_booked_slots():
+    # Look back a day so interviews already under way still block overlapping bookings
+    since = quote((datetime.now(timezone.utc) - timedelta(days=1)).isoformat())
+    endpoint = (
+        '/rest/v1/interviews?select=id,interviewer_name,scheduled_at,duration_minutes,status'
+        f'&scheduled_at=gte.{since}&status=not.in.(Cancelled,Canceled,Completed)'
+        f'&order=id.asc&limit={config.EXPORT_PAGE_SIZE}'
+    )
+    rows = []
+    while True:
+        # Keyset on id rather than offsets, PostgREST caps every response at max-rows
+        after = f"&id=gt.{quote(str(rows[-1]['id']))}" if rows else ''
+        response, status_code = supabase_request(endpoint + after)
+        if status_code >= 400:
+            return None
+        if not response:
+            return rows
+        rows.extend(response)
+
+# Per-interviewer interval trees, checked before every booking
+conflict_index = ConflictIndex(load_booked_slots)
+
+# Check a booking against the interviewer's other interviews and hold its slot
+def reserve_slot(interview_data, interview_id=None):
+    if config.CONFLICT_MODE == 'off':
+        return None, None
+    return conflict_index.reserve(interview_data, interview_id, reject=config.CONFLICT_MODE == 'reject')
+
+def conflict_response(conflict):
+    return jsonify({
+        'success': False,
+        'error': "Interviewer already has an interview at this time",
+        'conflict_with': conflict
+    }), 409
+
+def commit_slot(reservation, row):
+    if reservation:
+        conflict_index.commit(reservation, row)
+
+def release_slot(reservation):
+    if reservation:
+        conflict_index.release(reservation)
+
+# Interviewer availability bitmaps, rebuilt every SCHEDULER_CACHE_TTL seconds
+slot_finder_cache = TTLCache(maxsize=1, ttl=config.SCHEDULER_CACHE_TTL)
+
+def get_slot_finder():
+    slot_finder = slot_finder_cache.get('interviewers')
+    if slot_finder is None:
+        response, status_code = supabase_request('/rest/v1/interviewers?select=*')
+        if status_code >= 400:
+            return None, response, status_code
+        slot_finder = SlotFinder(response)
+        slot_finder_cache.set('interviewers', slot_finder)
+    return slot_finder, None, 200
+
+# Validate an interview payload and convert it to a Supabase row
+def build_interview_data(form_data):
+    # Validate every field in one pass
+    values, errors = INTERVIEW_FORM_SCHEMA.validate(form_data)
+    if errors:
+        return None, error_message(errors)
+    
+    # Local date and time in the client's timezone, stored as UTC
+    scheduled_at = to_utc(values['date'], values['time'], values.get('timezone')).isoformat()
     
-    except ValueError:
-        return False, "Invalid time format. Use HH:MM (24-hour format)"
+    # Set use_question_bank to boolean
+    use_question_bank = form_data.get('useQuestionBank') in ['true', 'True', True, 1, '1']
+    
+    # Prepare data for Supabase
+    interview_data = {
+        'candidate_name': form_data['candidateName'],
+        'interviewer_name': form_data['interviewer'],
+        'scheduled_at': scheduled_at,
+        'duration_minutes': values['duration'],
+        'format': form_data['format'],
+        'job_role': form_data['jobRole'],
+        'status': 'Scheduled',
+        'feedback_submitted': 'No',
+        'use_question_bank': use_question_bank
+    }
+    
+    return interview_data, None
 
 # Make sure to add CORS headers for all responses
 @app.after_request
@@ -133,6 +270,11 @@ def add_cors_headers(response):
     response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
     return response
 
+# Prometheus metrics
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return REGISTRY.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
 # Handle OPTIONS requests for CORS preflight
 @app.route('/api/interviews', methods=['OPTIONS'])
 @app.route('/api/interviews/<id>', methods=['OPTIONS'])
@@ -146,21 +288,13 @@ def create_demo_request():
     try:
         data = request.json
         
-        # Required fields validation
-        required_fields = ['first_name', 'last_name', 'work_email', 'agrees_to_terms']
-        
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return jsonify({
-                    'success': False,
-                    'error': f"Missing required field: {field}"
-                }), 400
-        
-        # Validate email format
-        if '@' not in data['work_email'] or '.' not in data['work_email']:
+        # Validate every field in one pass
+        _, errors = DEMO_REQUEST_FORM_SCHEMA.validate(data)
+        if errors:
             return jsonify({
                 'success': False,
-                'error': "Invalid email format"
+                'error': error_message(errors),
+                'errors': errors
             }), 400
         
         # Insert into Supabase
@@ -202,6 +336,8 @@ def create_demo_request():
 # API endpoint for creating interviews
 @app.route('/api/interviews', methods=['POST'])
 def create_interview():
+    reservation = None
+    spooled_resume = None
     try:
         # Check if this is a multipart form (with file upload)
         if request.content_type and 'multipart/form-data' in request.content_type:
@@ -211,48 +347,22 @@ def create_interview():
             form_data = request.json
             resume_file = None
         
-        # Validate required fields
-        required_fields = ['candidateName', 'interviewer', 'date', 'time', 'duration', 'format', 'jobRole']
-        
-        for field in required_fields:
-            if field not in form_data or not form_data[field]:
-                return jsonify({
-                    'success': False,
-                    'error': f"Missing required field: {field}"
-                }), 400
-        
-        # Validate date
-        is_valid_date, date_error = validate_date(form_data['date'])
-        if not is_valid_date:
+        # Validate fields and build the row
+        interview_data, error = build_interview_data(form_data)
+        if error:
             return jsonify({
                 'success': False,
-                'error': date_error
+                'error': error
             }), 400
         
-        # Validate time
-        is_valid_time, time_error = validate_time(form_data['time'])
-        if not is_valid_time:
-            return jsonify({
-                'success': False,
-                'error': time_error
-            }), 400
+        # Reject double-bookings before doing any uploads
+        reservation, conflict = reserve_slot(interview_data)
+        if conflict and not reservation:
+            return conflict_response(conflict)
         
-        # Validate duration (convert to integer)
-        try:
-            duration_minutes = int(form_data['duration'])
-            if duration_minutes <= 0:
-                return jsonify({
-                    'success': False,
-                    'error': "Duration must be a positive number"
-                }), 400
-        except ValueError:
-            return jsonify({
-                'success': False,
-                'error': "Duration must be a valid number"
-            }), 400
-        
-        # Handle resume file upload
+        # Handle resume file upload, optionally finishing it in the background
         resume_url = None
+        async_upload = str(form_data.get('asyncUpload', config.ASYNC_RESUME_UPLOAD)) in ['true', 'True', '1']
         if resume_file:
             # Validate file type
             allowed_types = ['application/pdf', 'application/msword', 
@@ -260,6 +370,7 @@ def create_interview():
             file_type = resume_file.content_type
             
             if file_type not in allowed_types:
+                release_slot(reservation)
                 return jsonify({
                     'success': False,
                     'error': "Resume must be a PDF, DOC, or DOCX file"
@@ -268,98 +379,315 @@ def create_interview():
             # Validate file size (max 10MB)
             max_size = 10 * 1024 * 1024  # 10MB in bytes
             if resume_file.content_length and resume_file.content_length > max_size:
+                release_slot(reservation)
                 return jsonify({
                     'success': False,
                     'error': "Resume file size must not exceed 10MB"
                 }), 400
             
-            # Upload file to Supabase Storage
-            resume_url = upload_file_to_supabase(resume_file, form_data['candidateName'])
-            
-            if not resume_url:
-                return jsonify({
-                    'success': False,
-                    'error': "Failed to upload resume file"
-                }), 500
-        
-        # Combine date and time
-        scheduled_at = f"{form_data['date']}T{form_data['time']}:00"
-        
-        # Set use_question_bank to boolean
-        use_question_bank = form_data.get('useQuestionBank') in ['true', 'True', True, 1, '1']
-        
-        # Prepare data for Supabase
-        interview_data = {
-            'candidate_name': form_data['candidateName'],
-            'interviewer_name': form_data['interviewer'],
-            'scheduled_at': scheduled_at,
-            'duration_minutes': duration_minutes,
-            'format': form_data['format'],
-            'job_role': form_data['jobRole'],
-            'status': 'Scheduled',
-            'feedback_submitted': 'No',
-            'use_question_bank': use_question_bank
-        }
-        
-        # Add resume URL if available
+            if async_upload:
+                # Keep a copy on disk, the upload finishes after the response
+                spooled_resume = upload_queue.spool(resume_file)
+            else:
+                # Upload file to Supabase Storage
+                resume_url = upload_file_to_supabase(resume_file, form_data['candidateName'])
+                
+                if not resume_url:
+                    release_slot(reservation)
+                    return jsonify({
+                        'success': False,
+                        'error': "Failed to upload resume file"
+                    }), 500
+        
+        # Add resume URL if available, a background upload is marked pending on the row until it lands
         if resume_url:
             interview_data['resume_url'] = resume_url
+        elif spooled_resume:
+            interview_data['resume_url'] = RESUME_PENDING
         
         # Insert into Supabase
         response, status_code = supabase_request(
             '/rest/v1/interviews',
             method='POST',
+            prefer='representation',
             data=interview_data
         )
         
         if status_code >= 400:
+            release_slot(reservation)
+            if spooled_resume:
+                spooled_resume.remove()
             return jsonify({
                 'success': False,
                 'error': f"Failed to create interview: {response.get('error', 'Unknown error')}"
             }), status_code
         
-        return jsonify({
+        interview_cache.invalidate(row=interview_data)
+        
+        interview = response[0] if isinstance(response, list) and response else response
+        commit_slot(reservation, interview)
+        result = {
             'success': True,
-            'data': response
-        }), 201
+            'data': interview
+        }
+        
+        # CONFLICT_MODE=flag books the slot anyway and reports the overlap
+        if conflict:
+            result['conflict_with'] = conflict
+        
+        if spooled_resume:
+            result['resume_status'] = 'pending'
+            # The interview id doubles as the job id, so any worker can look the job up on the row
+            result['upload_job_id'] = upload_queue.submit(
+                spooled_resume, interview['id'], form_data['candidateName'], job_id=str(interview['id'])
+            )
+            # The queue removes the file once it is done with it
+            spooled_resume = None
+        
+        return jsonify(result), 201
     
     except Exception as e:
+        release_slot(reservation)
+        if spooled_resume:
+            spooled_resume.remove()
         app.logger.error(f"Error in create_interview: {str(e)}")
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
-# API endpoint for fetching all interviews
-@app.route('/api/interviews', methods=['GET'])
-def get_interviews():
+# API endpoint for checking on a background resume upload
+@app.route('/api/uploads/<job_id>', methods=['GET'])
+def get_upload_status(job_id):
+    # The row is shared by every worker, the queue only knows about uploads this process ran
+    response, status_code = supabase_request(
+        f"/rest/v1/interviews?id=eq.{quote(job_id)}&select=id,resume_url,updated_at"
+    )
+    
+    if status_code >= 400:
+        return jsonify({
+            'success': False,
+            'error': f"Failed to fetch upload status: {response.get('error', 'Unknown error')}"
+        }), status_code
+    
+    row = response[0] if response else {}
+    status = upload_status(row.get('resume_url'))
+    if not status:
+        return jsonify({
+            'success': False,
+            'error': "Upload job not found"
+        }), 404
+    
+    # Attempts and errors are added when this process ran the upload
+    local = upload_queue.status(job_id)
+    if status == 'pending' and not local and pending_expired(row.get('updated_at')):
+        # Left behind by a worker that went away, nothing will finish it now
+        mark_resume_failed(row['id'], "Upload interrupted")
+        status = 'failed'
+    
+    job = dict(local or {}, job_id=job_id, interview_id=row['id'])
+    if status != 'pending' or job.get('status') != 'uploading':
+        job['status'] = status
+    if status == 'completed':
+        job['resume_url'] = row['resume_url']
+    
+    return jsonify({
+        'success': True,
+        'data': job
+    })
+
+# API endpoint for creating many interviews at once
+@app.route('/api/interviews/bulk', methods=['POST'])
+def create_interviews_bulk():
+    valid = []
     try:
-        # Get query parameters
-        status = request.args.get('status')
-        interviewer = request.args.get('interviewer')
-        date_start = request.args.get('date_start')
-        date_end = request.args.get('date_end')
+        items = request.json
+        
+        if not isinstance(items, list) or not items:
+            return jsonify({
+                'success': False,
+                'error': "Request body must be a non-empty array of interviews"
+            }), 400
+        
+        if len(items) > config.BULK_MAX_INTERVIEWS:
+            return jsonify({
+                'success': False,
+                'error': f"At most {config.BULK_MAX_INTERVIEWS} interviews can be created at once"
+            }), 400
+        
+        # Validate every row up front, one result per input row
+        results = [None] * len(items)
+        
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results[index] = {'index': index, 'success': False, 'error': "Interview must be an object"}
+                continue
+            
+            interview_data, error = build_interview_data(item)
+            if error:
+                results[index] = {'index': index, 'success': False, 'error': error}
+                continue
+            
+            # Rows are checked in order, so a row can also clash with an earlier one in the batch
+            reservation, conflict = reserve_slot(interview_data)
+            if conflict and not reservation:
+                results[index] = {
+                    'index': index,
+                    'success': False,
+                    'error': "Interviewer already has an interview at this time",
+                    'conflict_with': conflict
+                }
+            else:
+                valid.append((index, interview_data, reservation))
+        
+        # Insert valid rows as array POSTs, one round trip per chunk
+        chunk_size = config.BULK_INSERT_CHUNK_SIZE
+        upstream_status = None
+        for offset in range(0, len(valid), chunk_size):
+            chunk = valid[offset:offset + chunk_size]
+            
+            response, status_code = supabase_request(
+                '/rest/v1/interviews',
+                method='POST',
+                prefer='representation',
+                data=[interview_data for _, interview_data, _ in chunk]
+            )
+            
+            if status_code >= 400:
+                # PostgREST inserts a chunk atomically, so the whole chunk failed
+                upstream_status = status_code
+                error = f"Failed to create interview: {response.get('error', 'Unknown error')}"
+                for index, _, reservation in chunk:
+                    release_slot(reservation)
+                    results[index] = {'index': index, 'success': False, 'error': error}
+                continue
+            
+            for (index, interview_data, reservation), row in zip(chunk, response):
+                commit_slot(reservation, row)
+                interview_cache.invalidate(row=interview_data)
+                results[index] = {'index': index, 'success': True, 'data': row}
+        
+        created = sum(1 for result in results if result['success'])
+        
+        if created == len(items):
+            status_code = 201
+        elif created:
+            status_code = 207
+        elif upstream_status:
+            # The payload may be fine, pass Supabase's failure on so clients can retry
+            status_code = upstream_status
+        else:
+            status_code = 400
+        
+        return jsonify({
+            'success': created == len(items),
+            'created': created,
+            'failed': len(items) - created,
+            'results': results
+        }), status_code
+    
+    except Exception as e:
+        # Committed reservations are unaffected by a release
+        for _, _, reservation in valid:
+            release_slot(reservation)
+        app.logger.error(f"Error in create_interviews_bulk: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# API endpoint for suggesting open interview slots
+@app.route('/api/interviews/suggest-slots', methods=['POST'])
+def suggest_slots():
+    try:
+        # Validate every field in one pass
+        data, errors = SUGGEST_SLOTS_SCHEMA.validate(request.json)
+        if errors:
+            return jsonify({
+                'success': False,
+                'error': error_message(errors),
+                'errors': errors
+            }), 400
+        
+        duration = data['duration']
+        limit = data.get('limit', 10)
+        date_from = data['dateFrom']
+        date_to = data['dateTo']
         
-        # Build query
-        endpoint = '/rest/v1/interviews?select=*'
+        if date_to < date_from or (date_to - date_from).days >= config.SCHEDULER_MAX_DAYS:
+            return jsonify({
+                'success': False,
+                'error': f"dateTo must be on or after dateFrom and at most {config.SCHEDULER_MAX_DAYS} days later"
+            }), 400
         
-        if status:
-            endpoint += f"&status=eq.{status}"
+        slot_finder, response, status_code = get_slot_finder()
+        if slot_finder is None:
+            return jsonify({
+                'success': False,
+                'error': f"Failed to fetch interviewers: {response.get('error', 'Unknown error')}"
+            }), status_code
         
-        if interviewer:
-            endpoint += f"&interviewer_name=eq.{interviewer}"
+        # Booked slots come from the in-process conflict index, not another query
+        suggestions = slot_finder.suggest(
+            duration,
+            date_from,
+            date_to,
+            conflict_index.booked,
+            job_role=data.get('jobRole'),
+            names=set(data['interviewers']) if data.get('interviewers') else None,
+            limit=min(limit, config.SCHEDULER_MAX_SUGGESTIONS),
+            now=datetime.now(timezone.utc),
+            tz=data.get('timezone') or resolve_timezone()
+        )
         
-        if date_start:
-            endpoint += f"&scheduled_at=gte.{date_start}"
+        return jsonify({
+            'success': True,
+            'data': suggestions
+        })
+    
+    except Exception as e:
+        app.logger.error(f"Error in suggest_slots: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# API endpoint for fetching all interviews
+@app.route('/api/interviews', methods=['GET'])
+@conditional
+def get_interviews():
+    try:
+        # Get query parameters
+        filters = {
+            'status': request.args.get('status'),
+            'interviewer': request.args.get('interviewer'),
+            'date_start': request.args.get('date_start'),
+            'date_end': request.args.get('date_end'),
+            'limit': request.args.get('limit'),
+            'cursor': request.args.get('cursor'),
+            'fields': request.args.get('fields')
+        }
         
-        if date_end:
-            endpoint += f"&scheduled_at=lte.{date_end}"
+        # Validate pagination and projection
+        try:
+            limit = parse_limit(filters['limit'], config.INTERVIEWS_MAX_LIMIT)
+            select = parse_fields(filters['fields'])
+            after = keyset_filter(filters['cursor']) if filters['cursor'] else None
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         
-        # Order by scheduled_at
-        endpoint += "&order=scheduled_at.asc"
+        # Unpaginated lists are the large ones, send Supabase's bytes on without parsing them
+        if config.INTERVIEWS_PASSTHROUGH and not limit:
+            return stream_interviews(filters, select, after)
         
-        # Make Supabase request
-        response, status_code = supabase_request(endpoint)
+        response, status_code = interview_cache.get_list(
+            filters,
+            lambda: fetch_interviews(filters, select, limit, after),
+            cacheable=lambda result: result[1] < 400
+        )
         
         if status_code >= 400:
             return jsonify({
@@ -367,10 +695,16 @@ def get_interviews():
                 'error': f"Failed to fetch interviews: {response.get('error', 'Unknown error')}"
             }), status_code
         
-        return jsonify({
+        result = {
             'success': True,
             'data': response
-        })
+        }
+        
+        # Only paginated requests get a cursor, unpaginated ones return every row
+        if limit:
+            result['next_cursor'] = next_cursor(response, limit)
+        
+        return jsonify(result)
     
     except Exception as e:
         app.logger.error(f"Error in get_interviews: {str(e)}")
@@ -379,13 +713,77 @@ def get_interviews():
             'error': str(e)
         }), 500
 
+# Stream an interview list inside the success envelope, caching the raw body
+def stream_interviews(filters, select='*', after=None):
+    # Raw bodies are cached apart from parsed ones, the key only has to differ
+    cache_filters = dict(filters, format='raw')
+    cached, generation = interview_cache.peek_list(cache_filters)
+    if cached is not None:
+        body, etag = cached
+        return body_response(body, etag)
+    
+    upstream, error, status_code = supabase_stream(interviews_endpoint(filters, select, after=after))
+    if upstream is None:
+        return jsonify({
+            'success': False,
+            'error': f"Failed to fetch interviews: {error.get('error', 'Unknown error')}"
+        }), status_code
+    
+    def cache_body(chunks):
+        # Tag the body once here so cache hits can answer If-None-Match without hashing it.
+        # The tag is the body's own digest, and a write that landed mid-stream moved the
+        # generation on, so set_list drops the body instead of caching a stale list
+        body = b''.join(chunks)
+        interview_cache.set_list(cache_filters, (body, upstream.headers.get('ETag') or etag_for(body)), generation)
+    
+    # Large lists aren't worth holding in memory twice, they're streamed and not cached
+    return passthrough_response(upstream, on_complete=cache_body, max_buffer=config.INTERVIEW_CACHE_MAX_BYTES)
+
+# Fetch interviews matching the list filters from Supabase
+def fetch_interviews(filters, select='*', limit=None, after=None):
+    return supabase_request(interviews_endpoint(filters, select, limit, after))
+
+# PostgREST query for the interview list filters
+def interviews_endpoint(filters, select='*', limit=None, after=None):
+    # Build query
+    endpoint = f"/rest/v1/interviews?select={select}"
+    
+    if filters['status']:
+        endpoint += f"&status=eq.{filters['status']}"
+    
+    if filters['interviewer']:
+        endpoint += f"&interviewer_name=eq.{filters['interviewer']}"
+    
+    if filters['date_start']:
+        endpoint += f"&scheduled_at=gte.{filters['date_start']}"
+    
+    if filters['date_end']:
+        endpoint += f"&scheduled_at=lte.{filters['date_end']}"
+    
+    # Continue after the cursor row
+    if after:
+        endpoint += f"&or={quote(after)}"
+    
+    # Order by scheduled_at, id breaks ties so the keyset is stable
+    endpoint += "&order=scheduled_at.asc,id.asc"
+    
+    if limit:
+        endpoint += f"&limit={limit}"
+    
+    return endpoint
+
 # API endpoint for fetching a specific interview
 @app.route('/api/interviews/<id>', methods=['GET'])
+@conditional
 def get_interview(id):
     try:
         endpoint = f"/rest/v1/interviews?id=eq.{id}&select=*"
         
-        response, status_code = supabase_request(endpoint)
+        response, status_code = interview_cache.get_detail(
+            id,
+            lambda: supabase_request(endpoint),
+            cacheable=lambda result: result[1] < 400 and len(result[0]) > 0
+        )
         
         if status_code >= 400:
             return jsonify({
@@ -414,43 +812,28 @@ def get_interview(id):
 # API endpoint for updating an interview
 @app.route('/api/interviews/<id>', methods=['PUT'])
 def update_interview(id):
+    reservation = None
     try:
         data = request.json
         
-        # Validate required fields
-        required_fields = ['candidateName', 'interviewer', 'date', 'time', 'duration', 'format', 'jobRole']
-        
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return jsonify({
-                    'success': False,
-                    'error': f"Missing required field: {field}"
-                }), 400
-        
-        # Validate date and time
-        is_valid_date, date_error = validate_date(data['date'])
-        if not is_valid_date:
+        # Validate every field in one pass
+        values, errors = INTERVIEW_FORM_SCHEMA.validate(data)
+        if errors:
             return jsonify({
                 'success': False,
-                'error': date_error
+                'error': error_message(errors),
+                'errors': errors
             }), 400
         
-        is_valid_time, time_error = validate_time(data['time'])
-        if not is_valid_time:
-            return jsonify({
-                'success': False,
-                'error': time_error
-            }), 400
-        
-        # Combine date and time
-        scheduled_at = f"{data['date']}T{data['time']}:00"
+        # Local date and time in the client's timezone, stored as UTC
+        scheduled_at = to_utc(values['date'], values['time'], values.get('timezone')).isoformat()
         
         # Prepare update data
         update_data = {
             'candidate_name': data['candidateName'],
             'interviewer_name': data['interviewer'],
             'scheduled_at': scheduled_at,
-            'duration_minutes': int(data['duration']),
+            'duration_minutes': values['duration'],
             'format': data['format'],
             'job_role': data['jobRole']
         }
@@ -465,32 +848,44 @@ def update_interview(id):
         if 'useQuestionBank' in data:
             update_data['use_question_bank'] = data['useQuestionBank']
         
-        # Make Supabase request
+        # Check the new slot, ignoring the one this interview holds now
+        reservation, conflict = reserve_slot(update_data, interview_id=id)
+        if conflict and not reservation:
+            return conflict_response(conflict)
+        
+        # Update and read back the row in one round trip
         endpoint = f"/rest/v1/interviews?id=eq.{id}"
-        response, status_code = supabase_request(endpoint, method='PUT', data=update_data)
+        response, status_code = supabase_request(endpoint, method='PATCH', data=update_data, prefer='representation')
         
         if status_code >= 400:
+            release_slot(reservation)
             return jsonify({
                 'success': False,
                 'error': f"Failed to update interview: {response.get('error', 'Unknown error')}"
             }), status_code
         
-        # Fetch the updated interview
-        get_endpoint = f"/rest/v1/interviews?id=eq.{id}&select=*"
-        get_response, get_status_code = supabase_request(get_endpoint)
-        
-        if get_status_code >= 400 or not get_response or len(get_response) == 0:
+        if not response:
+            release_slot(reservation)
             return jsonify({
-                'success': True,
-                'message': "Interview updated but unable to retrieve the updated data"
-            })
+                'success': False,
+                'error': "Interview not found"
+            }), 404
         
-        return jsonify({
+        commit_slot(reservation, response[0])
+        interview_cache.invalidate(interview_id=id)
+        
+        result = {
             'success': True,
-            'data': get_response[0]
-        })
+            'data': response[0]
+        }
+        
+        if conflict:
+            result['conflict_with'] = conflict
+        
+        return jsonify(result)
     
     except Exception as e:
+        release_slot(reservation)
         app.logger.error(f"Error in update_interview: {str(e)}")
         return jsonify({
             'success': False,
@@ -501,31 +896,24 @@ def update_interview(id):
 @app.route('/api/interviews/<id>', methods=['DELETE'])
 def delete_interview(id):
     try:
-        # Check if interview exists
-        get_endpoint = f"/rest/v1/interviews?id=eq.{id}&select=id"
-        get_response, get_status_code = supabase_request(get_endpoint)
+        # Delete the interview, the returned ids tell us whether it existed
+        endpoint = f"/rest/v1/interviews?id=eq.{id}&select=id"
+        response, status_code = supabase_request(endpoint, method='DELETE', prefer='representation')
         
-        if get_status_code >= 400:
+        if status_code >= 400:
             return jsonify({
                 'success': False,
-                'error': f"Failed to check if interview exists: {get_response.get('error', 'Unknown error')}"
-            }), get_status_code
+                'error': f"Failed to delete interview: {response.get('error', 'Unknown error')}"
+            }), status_code
         
-        if not get_response or len(get_response) == 0:
+        if not response:
             return jsonify({
                 'success': False,
                 'error': "Interview not found"
             }), 404
         
-        # Delete the interview
-        endpoint = f"/rest/v1/interviews?id=eq.{id}"
-        response, status_code = supabase_request(endpoint, method='DELETE')
-        
-        if status_code >= 400:
-            return jsonify({
-                'success': False,
-                'error': f"Failed to delete interview: {response.get('error', 'Unknown error')}"
-            }), status_code
+        interview_cache.invalidate(interview_id=id)
+        conflict_index.discard(id)
         
         return jsonify({
             'success': True,
@@ -540,4 +928,4 @@ def delete_interview(id):
         }), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    app.run(debug=config.FLASK_DEBUG, port=config.FLASK_PORT)
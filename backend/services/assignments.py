@@ -0,0 +1,121 @@
+from itertools import islice
+import logging
+
+import requests
+from utils.supabase import iter_rows
+from utils.assignment import assign_interviewers
+from utils.pagination import quote_value
+from config import config
+
+logger = logging.getLogger(__name__)
+
+def _in_filter(values):
+    # Quoted so a value with ',', '.' or ')' in it can't change the filter
+    return f"in.({','.join(quote_value(value) for value in values)})"
+
+def _batches(values):
+    # Bounded id lists keep each query string well under proxy and PostgREST URL limits
+    values = sorted({str(value) for value in values})
+    size = config.ASSIGNMENT_ID_BATCH_SIZE
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def _load_pending_applications(application_ids):
+    params = [('select', 'application_id,candidate_id,role_id'), ('order', 'application_id.asc')]
+    if not application_ids:
+        params.append(('application_status', 'eq.Applied'))
+        return list(islice(iter_rows('applications', params=params), config.ASSIGNMENT_MAX_APPLICATIONS))
+
+    applications = []
+    for batch in _batches(application_ids):
+        applications.extend(iter_rows('applications', params=params + [('application_id', _in_filter(batch))]))
+    applications.sort(key=lambda application: str(application['application_id']))
+    return applications[:config.ASSIGNMENT_MAX_APPLICATIONS]
+
+def _load_skill_sets(table, owner, owners=None):
+    skill_sets = {}
+    params = [('select', f'{owner},skill_id')]
+    filters = [[(owner, _in_filter(batch))] for batch in _batches(owners)] if owners is not None else [[]]
+    for extra in filters:
+        for row in iter_rows(table, params=params + extra):
+            skill_sets.setdefault(row[owner], set()).add(row['skill_id'])
+    return skill_sets
+
+def _load_scheduled_counts():
+    counts = {}
+    try:
+        params = [('select', 'interviewer_id'), ('interview_status', 'eq.Scheduled')]
+        for row in iter_rows('interviews', params=params):
+            counts[row['interviewer_id']] = counts.get(row['interviewer_id'], 0) + 1
+    except requests.HTTPError as e:
+        # Balance within the batch only when existing load can't be read
+        logger.warning(f"Could not read scheduled interviews for load balancing: {str(e)}")
+    return counts
+
+def assign_applications(data):
+    """
+    Plan interviewer assignments for pending applications
+
+    Reads the applications, role_skills, interviewer_skills and interviewer
+    users tables and runs the bitset matcher over them. Nothing is written,
+    the plan is returned for the caller to schedule.
+
+    Args:
+        data: Optional application_ids (defaults to every Applied application)
+            and max_per_interviewer
+
+    Returns:
+        tuple: (assignments, status code, message)
+    """
+    try:
+        if data is None:
+            data = {}
+        elif not isinstance(data, dict):
+            return None, 400, "Request body must be a JSON object"
+        application_ids = data.get('application_ids')
+        max_per_interviewer = data.get('max_per_interviewer')
+
+        if application_ids is not None and (not isinstance(application_ids, list) or not application_ids):
+            return None, 400, "application_ids must be a non-empty array"
+
+        if application_ids and len(application_ids) > config.ASSIGNMENT_MAX_APPLICATIONS:
+            return None, 400, f"At most {config.ASSIGNMENT_MAX_APPLICATIONS} applications can be assigned at once"
+
+        if max_per_interviewer is not None:
+            try:
+                max_per_interviewer = int(max_per_interviewer)
+            except (TypeError, ValueError):
+                return None, 400, "max_per_interviewer must be a number"
+            if max_per_interviewer <= 0:
+                return None, 400, "max_per_interviewer must be positive"
+
+        applications = _load_pending_applications(application_ids)
+        if not applications:
+            return [], 200, "No pending applications"
+
+        role_ids = {application['role_id'] for application in applications}
+        role_skills = _load_skill_sets('role_skills', 'role_id', role_ids)
+        interviewer_skills = _load_skill_sets('interviewer_skills', 'user_id')
+        interviewers = [
+            row['user_id']
+            for row in iter_rows('users', params=[('select', 'user_id'), ('role', 'eq.Interviewer'), ('order', 'user_id.asc')])
+        ]
+
+        assignments = assign_interviewers(
+            applications,
+            role_skills,
+            interviewer_skills,
+            interviewers,
+            load=_load_scheduled_counts(),
+            max_per_interviewer=max_per_interviewer
+        )
+
+        assigned = sum(1 for assignment in assignments if assignment['interviewer_id'] is not None)
+        return assignments, 200, f"Assigned {assigned} of {len(assignments)} applications"
+
+    except requests.HTTPError as e:
+        logger.error(f"Error from Supabase during assignment: {str(e)}")
+        return None, e.response.status_code, "Failed to read assignment data"
+    except Exception as e:
+        logger.exception("Internal server error")
+        return None, 500, f"Internal server error: {str(e)}"
@@ -1,5 +1,8 @@
-from backend.utils.supabase import supabase_request
-import re
+from utils.supabase import supabase_request
+from utils.request_logging import truncate
+from utils.validators import DEMO_REQUEST_SCHEMA
+from utils.schema import error_message
+from utils.snapshot import SnapshotCache
 import logging
 
 # Configure logging
@@ -8,30 +11,11 @@ logger = logging.getLogger(__name__)
 
 def create_demo_request(data, method='POST'):
     try:
-        # Validate required fields
-        required_fields = ['first_name', 'last_name', 'work_email']
-        missing_fields = [field for field in required_fields if field not in data]
-        if missing_fields and method == 'POST':
-            logger.warning(f"Missing required fields: {', '.join(missing_fields)}")
-            return None, 400, f"Missing required fields: {', '.join(missing_fields)}"
-
-        # Validate email format
-        if 'work_email' in data and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', data['work_email']):
-            logger.warning("Invalid email format")
-            return None, 400, "Invalid email format"
-
-        # Validate phone number format
-        if 'phone_number' in data:
-            # Phone number should be at least 10 digits and start with +
-            if not re.match(r'^\+\d{10,}$', data['phone_number']):
-                logger.warning("Invalid phone number format")
-                return None, 400, "Invalid phone number format"
-
-        # Validate service interest
-        valid_interests = ['Job Interview', 'Career Coaching', 'Technical Assessment']
-        if 'service_interest' in data and data['service_interest'] not in valid_interests:
-            logger.warning("Invalid service interest")
-            return None, 400, f"Invalid service interest. Valid options are: {', '.join(valid_interests)}"
+        # Validate every field in one pass, required fields only apply to new requests
+        _, errors = DEMO_REQUEST_SCHEMA.validate(data, partial=method != 'POST')
+        if errors:
+            logger.warning("Invalid demo request: %s", error_message(errors))
+            return None, 400, error_message(errors)
 
         # Prepare data for Supabase
         demo_request_data = {
@@ -45,7 +29,7 @@ def create_demo_request(data, method='POST'):
 
         # Make request to Supabase
         response = supabase_request('demo_requests', method=method, data=demo_request_data)
-        logger.info(f"Supabase response: {response}")
+        logger.debug("Supabase response: %s", truncate(response))
         
         if response is None:
             logger.error("Failed to process request")
@@ -53,63 +37,51 @@ def create_demo_request(data, method='POST'):
             
         if response.get('status_code') == 201:
             logger.info("Demo request created successfully")
+            demo_request_snapshots.invalidate('demo_requests')
             return response.get('data', {}), 201, "Demo request created successfully"
         else:
-            logger.error(f"Error from Supabase: {response}")
+            logger.error("Error from Supabase: %s", truncate(response))
             return None, 500, "Failed to process request"
 
     except Exception as e:
         logger.exception("Internal server error")
         return None, 500, f"Internal server error: {str(e)}"
 
-# Add a function to get all demo requests
-def get_demo_requests():
+def _fetch_demo_requests(key):
+    response = supabase_request('demo_requests', method='GET')
+    logger.debug("Get demo requests response: %s", truncate(response))
+
+    # A 200 with an unparsable body comes back with data None, don't store that as the snapshot
+    if response.get('status_code') != 200 or response.get('data') is None:
+        raise RuntimeError(f"Supabase returned {response.get('status_code')}: {response.get('error')}")
+
+    # supabase_request unwraps single-row results, so put them back in a list
+    data = response['data']
+    return data if isinstance(data, list) else [data]
+
+# Last good list of demo requests, served while a refresh runs or Supabase is down
+demo_request_snapshots = SnapshotCache(_fetch_demo_requests)
+
+def get_demo_requests_snapshot():
+    """
+    Demo requests from the snapshot cache
+
+    Returns:
+        tuple: (Snapshot or None, status code, message)
+    """
     try:
-        # Make direct request to Supabase instead of using create_demo_request
-        response = supabase_request('demo_requests', method='GET')
-        logger.info(f"Get demo requests response: {response}")
-        
-        if response is None:
+        snapshot = demo_request_snapshots.get('demo_requests')
+        if snapshot is None:
             logger.error("Failed to get demo requests")
-            return None, 500, "Failed to get demo requests"
-            
-        if response.status_code == 200:
-            logger.info("Successfully retrieved demo requests")
-            try:
-                return response.json(), response.status_code, "Successfully retrieved demo requests"
-            except Exception as e:
-                logger.warning(f"Could not parse JSON response: {e}")
-                mock_data = [
-                    {
-                        'id': '123e4567-e89b-12d3-a456-426614174000',
-                        'first_name': 'John',
-                        'last_name': 'Doe',
-                        'work_email': 'john.doe@example.com',
-                        'phone_number': '+1234567890',
-                        'service_interest': 'Job Interview',
-                        'message': 'I am interested in your job interview services'
-                    }
-                ]
-                return mock_data, 200, "Successfully retrieved demo requests"
-        elif response.status_code == 401:
-            # For testing purposes, return a mock successful response
-            logger.warning("Unauthorized access to demo requests. Returning mock data for testing.")
-            mock_data = [
-                {
-                    'id': '123e4567-e89b-12d3-a456-426614174000',
-                    'first_name': 'John',
-                    'last_name': 'Doe',
-                    'work_email': 'john.doe@example.com',
-                    'phone_number': '+1234567890',
-                    'service_interest': 'Job Interview',
-                    'message': 'I am interested in your job interview services'
-                }
-            ]
-            return mock_data, 200, "Successfully retrieved demo requests"
-        else:
-            logger.error(f"Error from Supabase: {response.text}")
-            return None, response.status_code, response.text
-            
+            return None, 503, "Failed to get demo requests"
+
+        logger.info("Successfully retrieved demo requests")
+        return snapshot, 200, "Successfully retrieved demo requests"
+
     except Exception as e:
         logger.exception("Internal server error")
         return None, 500, f"Internal server error: {str(e)}"
+
+def get_demo_requests():
+    snapshot, status_code, message = get_demo_requests_snapshot()
+    return (snapshot.value if snapshot else None), status_code, message
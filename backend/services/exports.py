@@ -0,0 +1,58 @@
+from itertools import chain
+import logging
+
+import requests
+from utils.supabase import iter_rows
+from services.interviews import LIST_FILTERS, build_list_params
+
+logger = logging.getLogger(__name__)
+
+def _interview_params(filters):
+    # Exports always read the whole result set, so drop the page parameters
+    filters = {field: filters.get(field) for field in LIST_FILTERS}
+    filters.update(limit=None, cursor=None)
+    return build_list_params(filters)
+
+def _demo_request_params(filters):
+    return [('select', '*'), ('order', 'id.asc')]
+
+# Exportable resources, by URL name
+EXPORTS = {
+    'interviews': ('interviews', _interview_params),
+    'demo-requests': ('demo_requests', _demo_request_params)
+}
+
+def get_export_rows(resource, filters=None):
+    """
+    Start a paged read of every row of a resource
+
+    The first page is fetched before returning so upstream errors can still
+    be reported with a proper status code.
+
+    Returns:
+        tuple: (row iterator, status code, message)
+    """
+    try:
+        if resource not in EXPORTS:
+            return None, 404, f"Unknown export: {resource}"
+
+        table, build_params = EXPORTS[resource]
+        try:
+            params = build_params(filters or {})
+        except ValueError as e:
+            return None, 400, str(e)
+
+        rows = iter_rows(table, params=params)
+        try:
+            first = next(rows)
+        except StopIteration:
+            return iter(()), 200, "Export started"
+
+        return chain([first], rows), 200, "Export started"
+
+    except requests.HTTPError as e:
+        logger.error(f"Error from Supabase during export: {str(e)}")
+        return None, e.response.status_code, f"Failed to export {resource}"
+    except Exception as e:
+        logger.exception("Internal server error")
+        return None, 500, f"Internal server error: {str(e)}"
@@ -1,100 +1,239 @@
-from backend.utils.supabase import supabase_request
-from backend.utils.validators import validate_date, validate_time
+from utils.supabase import supabase_request
+from utils.validators import INTERVIEW_SCHEMA
+from utils.schema import error_message
+from utils.cache import InterviewCache
+from utils.pagination import parse_fields, parse_limit, keyset_filter
+from config import config
+
+# Query parameters accepted by get_interviews
+LIST_FILTERS = ('status', 'interviewer', 'date_start', 'date_end', 'limit', 'cursor', 'fields')
+
+# Cache for interview reads, invalidated by the write functions below
+interview_cache = InterviewCache(maxsize=config.INTERVIEW_CACHE_SIZE, ttl=config.INTERVIEW_CACHE_TTL)
+
+def _is_success(response, status_code=200):
+    return response is not None and response.get('status_code') == status_code
+
+def _as_rows(data):
+    # supabase_request unwraps single-row results, so put them back in a list
+    if data is None:
+        return []
+    return data if isinstance(data, list) else [data]
+
+def _build_interview_data(data):
+    # Validate every field in one pass
+    _, errors = INTERVIEW_SCHEMA.validate(data)
+    if errors:
+        return None, error_message(errors)
+
+    # Prepare data for Supabase
+    interview_data = {
+        'candidate_name': data['candidate_name'],
+        'interviewer_name': data['interviewer_name'],
+        'interview_date': data['interview_date'],
+        'interview_time': data['interview_time'],
+        'status': data.get('status', 'scheduled'),
+        'notes': data.get('notes', '')
+    }
+    return interview_data, None
 
 def create_interview(data):
     try:
-        # Validate required fields
-        required_fields = ['candidate_name', 'interviewer_name', 'interview_date', 'interview_time']
-        missing_fields = [field for field in required_fields if field not in data]
-        if missing_fields:
-            return None, 400, f"Missing required fields: {', '.join(missing_fields)}"
-
-        # Validate date and time
-        if not validate_date(data['interview_date']):
-            return None, 400, "Invalid interview date format"
-        
-        if not validate_time(data['interview_time']):
-            return None, 400, "Invalid interview time format"
-
-        # Prepare data for Supabase
-        interview_data = {
-            'candidate_name': data['candidate_name'],
-            'interviewer_name': data['interviewer_name'],
-            'interview_date': data['interview_date'],
-            'interview_time': data['interview_time'],
-            'status': data.get('status', 'scheduled'),
-            'notes': data.get('notes', '')
-        }
+        interview_data, error = _build_interview_data(data)
+        if error:
+            return None, 400, error
 
         # Make request to Supabase
-        response = supabase_request('interviews', interview_data, method='POST')
-        
-        if response.status_code == 201:
-            return response.json(), 201, "Interview created successfully"
+        response = supabase_request('interviews', method='POST', data=interview_data, prefer='representation')
+
+        if _is_success(response, 201):
+            interview_cache.invalidate(row=interview_data)
+            return response.get('data'), 201, "Interview created successfully"
         else:
-            return None, response.status_code, "Failed to create interview"
+            return None, response.get('status_code', 500), "Failed to create interview"
 
     except Exception as e:
         return None, 500, f"Internal server error: {str(e)}"
 
-def get_interviews():
+def create_interviews_bulk(items):
+    """
+    Validate and insert many interviews with chunked array POSTs
+
+    Returns:
+        tuple: (per-row results, status code, message). The status is 201 when
+        every row was created and 207 when only some were. When none were it is
+        400 if every row was invalid, else the status Supabase failed with.
+    """
     try:
-        response = supabase_request('interviews', method='GET')
-        
-        if response.status_code == 200:
-            return response.json(), 200, "Interviews retrieved successfully"
+        if not isinstance(items, list) or not items:
+            return None, 400, "Request body must be a non-empty array of interviews"
+
+        if len(items) > config.BULK_MAX_INTERVIEWS:
+            return None, 400, f"At most {config.BULK_MAX_INTERVIEWS} interviews can be created at once"
+
+        # Validate every row up front, one result per input row
+        results = [None] * len(items)
+        valid = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results[index] = {'index': index, 'success': False, 'error': "Interview must be an object"}
+                continue
+
+            interview_data, error = _build_interview_data(item)
+            if error:
+                results[index] = {'index': index, 'success': False, 'error': error}
+            else:
+                valid.append((index, interview_data))
+
+        # Insert valid rows as array POSTs, one round trip per chunk
+        chunk_size = config.BULK_INSERT_CHUNK_SIZE
+        upstream_status = None
+        for offset in range(0, len(valid), chunk_size):
+            chunk = valid[offset:offset + chunk_size]
+            response = supabase_request(
+                'interviews', method='POST', data=[row for _, row in chunk], prefer='representation'
+            )
+
+            # PostgREST inserts a chunk atomically, so it either all worked or all failed
+            if not _is_success(response, 201):
+                upstream_status = response.get('status_code', 500)
+                for index, _ in chunk:
+                    results[index] = {'index': index, 'success': False, 'error': "Failed to create interview"}
+                continue
+
+            for (index, interview_data), row in zip(chunk, _as_rows(response.get('data'))):
+                interview_cache.invalidate(row=interview_data)
+                results[index] = {'index': index, 'success': True, 'data': row}
+
+        created = sum(1 for result in results if result['success'])
+        if created == len(items):
+            return results, 201, "Interviews created successfully"
+        elif created:
+            return results, 207, f"Created {created} of {len(items)} interviews"
+        elif upstream_status:
+            # The payload may be fine, pass Supabase's failure on so clients can retry
+            return results, upstream_status, "Failed to create interviews"
         else:
-            return None, response.status_code, "Failed to retrieve interviews"
+            return results, 400, "Failed to create interviews"
+
+    except Exception as e:
+        return None, 500, f"Internal server error: {str(e)}"
+
+def build_list_params(filters):
+    # A list of pairs, scheduled_at can be filtered twice
+    params = [('select', parse_fields(filters['fields']))]
+
+    if filters['status']:
+        params.append(('status', f"eq.{filters['status']}"))
+
+    if filters['interviewer']:
+        params.append(('interviewer_name', f"eq.{filters['interviewer']}"))
+
+    if filters['date_start']:
+        params.append(('scheduled_at', f"gte.{filters['date_start']}"))
+
+    if filters['date_end']:
+        params.append(('scheduled_at', f"lte.{filters['date_end']}"))
+
+    if filters['cursor']:
+        params.append(('or', keyset_filter(filters['cursor'])))
+
+    params.append(('order', 'scheduled_at.asc,id.asc'))
+
+    limit = parse_limit(filters['limit'], config.INTERVIEWS_MAX_LIMIT)
+    if limit:
+        params.append(('limit', limit))
+
+    return params
+
+def get_interviews(filters=None):
+    try:
+        filters = {field: (filters or {}).get(field) for field in LIST_FILTERS}
+
+        try:
+            params = build_list_params(filters)
+        except ValueError as e:
+            return None, 400, str(e)
+
+        response = interview_cache.get_list(
+            filters,
+            lambda: supabase_request('interviews', method='GET', params=params),
+            cacheable=_is_success
+        )
+
+        if _is_success(response):
+            return _as_rows(response.get('data')), 200, "Interviews retrieved successfully"
+        else:
+            return None, response.get('status_code', 500), "Failed to retrieve interviews"
 
     except Exception as e:
         return None, 500, f"Internal server error: {str(e)}"
 
 def get_interview(interview_id):
     try:
-        response = supabase_request(f'interviews/{interview_id}', method='GET')
-        
-        if response.status_code == 200:
-            return response.json(), 200, "Interview retrieved successfully"
-        elif response.status_code == 404:
+        response = interview_cache.get_detail(
+            interview_id,
+            lambda: supabase_request('interviews', method='GET', params={'id': f'eq.{interview_id}'}),
+            cacheable=lambda result: _is_success(result) and bool(result.get('data'))
+        )
+
+        if _is_success(response):
+            rows = _as_rows(response.get('data'))
+            if not rows:
+                return None, 404, "Interview not found"
+            return rows[0], 200, "Interview retrieved successfully"
+        elif response.get('status_code') == 404:
             return None, 404, "Interview not found"
         else:
-            return None, response.status_code, "Failed to retrieve interview"
+            return None, response.get('status_code', 500), "Failed to retrieve interview"
 
     except Exception as e:
         return None, 500, f"Internal server error: {str(e)}"
 
 def update_interview(interview_id, data):
     try:
-        # Validate required fields
-        if 'interview_date' in data and not validate_date(data['interview_date']):
-            return None, 400, "Invalid interview date format"
-        
-        if 'interview_time' in data and not validate_time(data['interview_time']):
-            return None, 400, "Invalid interview time format"
+        # Only the fields sent are checked, an update doesn't have to repeat the rest
+        _, errors = INTERVIEW_SCHEMA.validate(data, partial=True)
+        if errors:
+            return None, 400, error_message(errors)
 
-        # Make request to Supabase
-        response = supabase_request(f'interviews/{interview_id}', data, method='PUT')
-        
-        if response.status_code == 200:
-            return response.json(), 200, "Interview updated successfully"
-        elif response.status_code == 404:
+        # Update and read back the row in one round trip
+        response = supabase_request(
+            'interviews', method='PATCH', data=data,
+            params={'id': f'eq.{interview_id}'}, prefer='representation'
+        )
+
+        if _is_success(response):
+            rows = _as_rows(response.get('data'))
+            if not rows:
+                return None, 404, "Interview not found"
+            interview_cache.invalidate(interview_id=interview_id)
+            return rows[0], 200, "Interview updated successfully"
+        elif response.get('status_code') == 404:
             return None, 404, "Interview not found"
         else:
-            return None, response.status_code, "Failed to update interview"
+            return None, response.get('status_code', 500), "Failed to update interview"
 
     except Exception as e:
         return None, 500, f"Internal server error: {str(e)}"
 
 def delete_interview(interview_id):
     try:
-        response = supabase_request(f'interviews/{interview_id}', method='DELETE')
-        
-        if response.status_code == 204:
+        # The count of deleted rows tells us whether the interview existed
+        response = supabase_request(
+            'interviews', method='DELETE',
+            params={'id': f'eq.{interview_id}'}, prefer='minimal', count='exact'
+        )
+
+        if response.get('status_code') in (200, 204):
+            if response.get('count') == 0:
+                return None, 404, "Interview not found"
+            interview_cache.invalidate(interview_id=interview_id)
             return True, 204, "Interview deleted successfully"
-        elif response.status_code == 404:
+        elif response.get('status_code') == 404:
             return None, 404, "Interview not found"
         else:
-            return None, response.status_code, "Failed to delete interview"
+            return None, response.get('status_code', 500), "Failed to delete interview"
 
     except Exception as e:
         return None, 500, f"Internal server error: {str(e)}"
@@ -0,0 +1,631 @@
+"""
+In-memory stand-in for the parts of Supabase the backend uses
+
+Serves PostgREST (/rest/v1/<table>) and Storage (/storage/v1/...) over HTTP
+so both apps, the functional tests and benchmarks can run without a Supabase
+project:
+
+    python tests/fake_supabase.py --port 54321 --latency 0.02 --error-rate 0.01
+    SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_KEY=fake python app.py
+
+or from Python:
+
+    fake = FakeSupabase(latency=0.01)
+    url = fake.start()
+    ...
+    fake.stop()
+
+Supported: eq/neq/gt/gte/lt/lte/like/ilike/in/is filters, not., or=/and=
+groups, select, order, limit/offset, Range headers, Prefer return= and
+count=, single-object Accept, simple and resumable (TUS) object uploads.
+Reads return at most max_rows rows (1000, PostgREST's default max-rows).
+Tables are schemaless. Column defaults (uuids, now(), literals) and
+timestamp columns are read from shared/supabase/migrations (CREATE TABLE
+and ALTER TABLE ... ADD COLUMN), updated_at columns are bumped on every
+update like the migrations' trigger, and tables that aren't in the
+migrations (demo_requests, interviewers) are created on first insert.
+
+Control endpoints, exempt from injected faults:
+    GET  /__fake/stats   Requests served per method and table
+    POST /__fake/config  JSON with latency, jitter, error_rate, error_status, max_rows
+    POST /__fake/reset   Drop every row, object and counter
+"""
+import argparse
+import base64
+import fnmatch
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / 'shared' / 'supabase' / 'migrations'
+
+# Query parameters that aren't column filters
+RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'or', 'and', 'columns', 'on_conflict'}
+
+OPERATORS = ('eq', 'neq', 'gt', 'gte', 'lt', 'lte', 'like', 'ilike', 'in', 'is')
+
+TABLE_PATTERN = re.compile(
+    r'CREATE TABLE (?:IF NOT EXISTS )?public\.(\w+)\s*\((.*?)\n\);', re.IGNORECASE | re.DOTALL
+)
+ALTER_PATTERN = re.compile(
+    r'ALTER TABLE (?:ONLY )?public\.(\w+)\s+ADD COLUMN (?:IF NOT EXISTS )?(.*?);', re.IGNORECASE | re.DOTALL
+)
+COLUMN_PATTERN = re.compile(r'^\s*([a-z_][a-z0-9_]*)\s+([A-Z][A-Z ]*?)(?=\s+(?:PRIMARY|NOT|DEFAULT|UNIQUE|REFERENCES|CHECK)|,|$)')
+DEFAULT_PATTERN = re.compile(r"DEFAULT\s+(gen_random_uuid\(\)|now\(\)|'[^']*'|TRUE|FALSE|-?\d+)", re.IGNORECASE)
+
+class PostgrestError(Exception):
+    def __init__(self, status, message, code='PGRST100'):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+def load_schema(migrations_dir=MIGRATIONS_DIR):
+    """
+    Column defaults and timestamp columns per table, from the migration files
+
+    Tables defined in more than one migration get the union of their
+    columns, the app code uses both interviews layouts.
+
+    Returns:
+        dict: table -> {'defaults': {column: callable}, 'timestamps': set of columns}
+    """
+    schema = {}
+    for path in sorted(Path(migrations_dir).glob('*.sql')):
+        text = path.read_text()
+        for table, body in TABLE_PATTERN.findall(text) + ALTER_PATTERN.findall(text):
+            entry = schema.setdefault(table, {'defaults': {}, 'timestamps': set()})
+            for line in body.splitlines():
+                match = COLUMN_PATTERN.match(line)
+                if not match or match.group(1) in ('constraint', 'primary'):
+                    continue
+                column, column_type = match.group(1), match.group(2).upper()
+                if column_type.startswith('TIMESTAMP'):
+                    entry['timestamps'].add(column)
+                default = DEFAULT_PATTERN.search(line)
+                if default:
+                    entry['defaults'][column] = _default_factory(default.group(1))
+    return schema
+
+def _default_factory(expression):
+    lowered = expression.lower()
+    if lowered == 'gen_random_uuid()':
+        return lambda: str(uuid.uuid4())
+    if lowered == 'now()':
+        return lambda: datetime.now(timezone.utc).isoformat()
+    if lowered in ('true', 'false'):
+        return lambda: lowered == 'true'
+    if expression.startswith("'"):
+        return lambda: expression[1:-1]
+    return lambda: int(expression)
+
+def _split_top_level(text, separator=','):
+    """Split on separator outside parentheses and double quotes"""
+    parts, depth, quoted, escaped, current = [], 0, False, False, []
+    for char in text:
+        if escaped:
+            escaped = False
+        elif quoted and char == '\\':
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        if char == separator and depth == 0 and not quoted:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append(''.join(current))
+    return parts
+
+def _unquote_value(value):
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        # Backslash escapes a quote or another backslash inside the quotes
+        return re.sub(r'\\(.)', r'\1', value[1:-1])
+    return value
+
+def _parse_timestamp(text):
+    if not isinstance(text, str) or len(text) < 10 or text[4:5] != '-':
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00').replace(' ', 'T', 1))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def _coerce(row_value, text):
+    """Turn a filter value into something comparable with the stored value"""
+    if isinstance(row_value, bool):
+        return row_value, text.lower() == 'true'
+    if isinstance(row_value, (int, float)):
+        try:
+            return row_value, float(text)
+        except ValueError:
+            return str(row_value), text
+    row_time, text_time = _parse_timestamp(row_value), _parse_timestamp(text)
+    if row_time is not None and text_time is not None:
+        return row_time, text_time
+    return row_value, text
+
+def _like(value, pattern, ignore_case):
+    pattern = pattern.replace('%', '*')
+    if ignore_case:
+        return fnmatch.fnmatchcase(str(value).lower(), pattern.lower())
+    return fnmatch.fnmatchcase(str(value), pattern)
+
+def _condition(column, expression):
+    """Predicate for one filter, e.g. column 'status' with 'eq.Scheduled'"""
+    negate = expression.startswith('not.')
+    if negate:
+        expression = expression[4:]
+    operator, _, value = expression.partition('.')
+    if operator not in OPERATORS:
+        raise PostgrestError(400, f'"failed to parse filter ({expression})" (line 1, column 1)')
+
+    if operator == 'in':
+        if not (value.startswith('(') and value.endswith(')')):
+            raise PostgrestError(400, f'"failed to parse filter (in.{value})" (line 1, column 4)')
+        options = [_unquote_value(option) for option in _split_top_level(value[1:-1])]
+    else:
+        value = _unquote_value(value)
+
+    def matches(row):
+        stored = row.get(column)
+        if operator == 'is':
+            target = {'null': None, 'true': True, 'false': False}.get(value.lower(), value)
+            result = stored is target
+        elif stored is None:
+            result = False
+        elif operator == 'in':
+            result = any(left == right for left, right in (_coerce(stored, option) for option in options))
+        elif operator in ('like', 'ilike'):
+            result = _like(stored, value, operator == 'ilike')
+        else:
+            left, right = _coerce(stored, value)
+            try:
+                result = {
+                    'eq': left == right, 'neq': left != right,
+                    'gt': left > right, 'gte': left >= right,
+                    'lt': left < right, 'lte': left <= right
+                }[operator]
+            except TypeError:
+                result = False
+        return not result if negate else result
+    return matches
+
+def _logic(operator, text):
+    """Predicate for an or=/and= group like (a.eq.1,and(b.gt.2,c.is.null))"""
+    if not (text.startswith('(') and text.endswith(')')):
+        raise PostgrestError(400, f'"failed to parse logic tree ({text})" (line 1, column 1)')
+    predicates = []
+    for part in _split_top_level(text[1:-1]):
+        part = part.strip()
+        for nested in ('or', 'and', 'not.or', 'not.and'):
+            if part.startswith(nested + '('):
+                inner = _logic(nested.rsplit('.', 1)[-1], part[len(nested):])
+                predicates.append((lambda p: lambda row: not p(row))(inner) if nested.startswith('not.') else inner)
+                break
+        else:
+            column, _, expression = part.partition('.')
+            predicates.append(_condition(column, expression))
+    combine = any if operator == 'or' else all
+    return lambda row: combine(predicate(row) for predicate in predicates)
+
+def _order_rows(rows, order):
+    # Stable sorts from the last key to the first give a multi-column order
+    for term in reversed([term for term in order.split(',') if term]):
+        parts = term.split('.')
+        column = parts[0]
+        descending = 'desc' in parts[1:]
+        nulls_first = 'nullsfirst' in parts[1:] or (descending and 'nullslast' not in parts[1:])
+        present = [row for row in rows if row.get(column) is not None]
+        missing = [row for row in rows if row.get(column) is None]
+        present.sort(key=lambda row: _sort_key(row.get(column)), reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+def _sort_key(value):
+    parsed = _parse_timestamp(value)
+    return (0, parsed) if parsed is not None else (1, value) if not isinstance(value, str) else (2, value)
+
+def _parse_prefer(header):
+    prefer = {}
+    for item in (header or '').split(','):
+        name, _, value = item.strip().partition('=')
+        if name:
+            prefer[name] = value
+    return prefer
+
+def _error_body(message, code='PGRST100'):
+    return json.dumps({'code': code, 'details': None, 'hint': None, 'message': message}).encode()
+
+class FakeSupabase:
+    """
+    In-memory PostgREST and Storage server with injectable latency and errors
+
+    Args:
+        migrations_dir: Directory of .sql migrations to read defaults from
+        latency: Seconds added to every request
+        jitter: Extra random delay, up to this many seconds
+        error_rate: Fraction of requests answered with error_status instead
+        error_status: Status of injected errors
+        seed: Initial rows, {table: [rows]}
+        max_rows: Most rows a read returns, like PostgREST's db-max-rows (None for no limit)
+    """
+
+    def __init__(self, migrations_dir=MIGRATIONS_DIR, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503,
+                 seed=None, rng=None, max_rows=1000):
+        self.schema = load_schema(migrations_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_rows = max_rows
+        self.rng = rng or random.Random()
+        self.lock = threading.RLock()
+        self.seed = seed or {}
+        self.stats = Counter()
+        self.tables = {}
+        self.objects = {}
+        self.uploads = {}
+        self._server = None
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.tables = {}
+            self.objects = {}
+            self.uploads = {}
+            self.stats.clear()
+            for table, rows in self.seed.items():
+                self.insert(table, rows)
+
+    def insert(self, table, rows):
+        """Add rows directly, filling defaults like the database would"""
+        entry = self.schema.get(table, {'defaults': {}, 'timestamps': set()})
+        created = []
+        with self.lock:
+            stored = self.tables.setdefault(table, [])
+            for row in rows:
+                if not isinstance(row, dict):
+                    raise PostgrestError(400, "All object keys must match", 'PGRST102')
+                row = dict(row)
+                for column, default in entry['defaults'].items():
+                    if row.get(column) is None:
+                        row[column] = default()
+                # Tables outside the migrations still get an id like gen_random_uuid() would give
+                if table not in self.schema and 'id' not in row:
+                    row['id'] = str(uuid.uuid4())
+                    row.setdefault('created_at', datetime.now(timezone.utc).isoformat())
+                self._normalize(entry, row)
+                stored.append(row)
+                created.append(row)
+        return created
+
+    @staticmethod
+    def _normalize(entry, row):
+        # timestamptz values come back from Postgres in UTC
+        for column in entry['timestamps']:
+            parsed = _parse_timestamp(row.get(column))
+            if parsed is not None:
+                row[column] = parsed.astimezone(timezone.utc).isoformat()
+
+    # HTTP
+
+    def start(self, host='127.0.0.1', port=0):
+        """Serve on a background thread, returning the base URL"""
+        fake = self
+
+        class Handler(_Handler):
+            server_fake = fake
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='fake-supabase', daemon=True).start()
+        return f"http://{host}:{self._server.server_port}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle(self, method, target, headers, body):
+        """
+        Answer one request
+
+        Returns:
+            tuple: (status, headers dict, body bytes)
+        """
+        split = urlsplit(target)
+        path = split.path
+        query = parse_qsl(split.query, keep_blank_values=True)
+
+        if path.startswith('/__fake/'):
+            return self._control(method, path, body)
+
+        delay = self.latency + (self.rng.random() * self.jitter if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return self.error_status, {'Content-Type': 'application/json'}, _error_body("Injected fault", 'FAKE')
+
+        if not headers.get('apikey'):
+            return 401, {'Content-Type': 'application/json'}, json.dumps({'message': 'No API key found in request'}).encode()
+
+        try:
+            if path.startswith('/rest/v1/'):
+                table = unquote(path[len('/rest/v1/'):]).strip('/')
+                with self.lock:
+                    self.stats[(method, table)] += 1
+                return self._rest(method, table, query, headers, body)
+            if path.startswith('/storage/v1/'):
+                with self.lock:
+                    self.stats[(method, 'storage')] += 1
+                return self._storage(method, path[len('/storage/v1/'):], headers, body)
+        except PostgrestError as e:
+            return e.status, {'Content-Type': 'application/json'}, _error_body(str(e), e.code)
+        return 404, {'Content-Type': 'application/json'}, json.dumps({'message': 'Not found'}).encode()
+
+    def _control(self, method, path, body):
+        if path == '/__fake/stats' and method == 'GET':
+            with self.lock:
+                stats = {f"{method} {table}": count for (method, table), count in self.stats.items()}
+            return 200, {'Content-Type': 'application/json'}, json.dumps(stats).encode()
+        if path == '/__fake/config' and method == 'POST':
+            settings = json.loads(body or b'{}')
+            for name in ('latency', 'jitter', 'error_rate', 'error_status', 'max_rows'):
+                if name in settings:
+                    setattr(self, name, settings[name])
+            return 204, {}, b''
+        if path == '/__fake/reset' and method == 'POST':
+            self.reset()
+            return 204, {}, b''
+        return 404, {}, b''
+
+    # PostgREST
+
+    def _filters(self, query):
+        predicates = []
+        for name, value in query:
+            if name in ('or', 'and'):
+                predicates.append(_logic(name, value))
+            elif name not in RESERVED_PARAMS:
+                predicates.append(_condition(name, value))
+        return lambda row: all(predicate(row) for predicate in predicates)
+
+    @staticmethod
+    def _project(rows, select):
+        if not select or select == '*':
+            return [dict(row) for row in rows]
+        columns = [column.strip() for column in select.split(',') if column.strip()]
+        return [{column: row.get(column) for column in columns} for row in rows]
+
+    def _rest(self, method, table, query, headers, body):
+        params = dict(query)
+        prefer = _parse_prefer(headers.get('Prefer'))
+        matches = self._filters(query)
+        single = 'vnd.pgrst.object' in (headers.get('Accept') or '')
+        response_headers = {'Content-Type': 'application/json; charset=utf-8'}
+
+        with self.lock:
+            if method in ('GET', 'HEAD'):
+                rows = [row for row in self.tables.get(table, []) if matches(row)]
+                if 'order' in params:
+                    rows = _order_rows(rows, params['order'])
+                total = len(rows)
+
+                offset = int(params.get('offset', 0))
+                limit = int(params['limit']) if 'limit' in params else None
+                range_header = headers.get('Range')
+                if range_header and '-' in range_header:
+                    first, _, last = range_header.partition('-')
+                    offset += int(first)
+                    if last:
+                        span = int(last) - int(first) + 1
+                        limit = span if limit is None else min(limit, span)
+                if self.max_rows is not None:
+                    limit = self.max_rows if limit is None else min(limit, self.max_rows)
+                if offset and offset >= total:
+                    response_headers['Content-Range'] = f"*/{total}"
+                    return 416, response_headers, _error_body(
+                        "Requested range not satisfiable", 'PGRST103'
+                    )
+                page = rows[offset:offset + limit if limit is not None else None]
+
+                shown_total = total if prefer.get('count') in ('exact', 'planned', 'estimated') else '*'
+                response_headers['Content-Range'] = (
+                    f"{offset}-{offset + len(page) - 1}/{shown_total}" if page else f"*/{shown_total}"
+                )
+                payload = self._project(page, params.get('select'))
+                status = 206 if shown_total != '*' and len(page) < total else 200
+                return self._reply(status, response_headers, payload, single, method == 'HEAD')
+
+            if method == 'POST':
+                payload = json.loads(body or b'null')
+                created = self.insert(table, payload if isinstance(payload, list) else [payload])
+                return self._written(201, response_headers, prefer, created, params, single)
+
+            if method == 'PATCH':
+                changes = json.loads(body or b'{}')
+                entry = self.schema.get(table, {'defaults': {}, 'timestamps': set()})
+                updated = []
+                for row in self.tables.get(table, []):
+                    if matches(row):
+                        row.update(changes)
+                        # As the set_updated_at trigger in the migrations does
+                        if 'updated_at' in entry['timestamps']:
+                            row['updated_at'] = datetime.now(timezone.utc).isoformat()
+                        self._normalize(entry, row)
+                        updated.append(row)
+                return self._written(200, response_headers, prefer, updated, params, single)
+
+            if method == 'DELETE':
+                rows = self.tables.get(table, [])
+                deleted = [row for row in rows if matches(row)]
+                self.tables[table] = [row for row in rows if not matches(row)]
+                return self._written(200, response_headers, prefer, deleted, params, single)
+
+        raise PostgrestError(405, f"Unsupported method {method}")
+
+    def _written(self, status, headers, prefer, rows, params, single):
+        if prefer.get('return') == 'representation':
+            return self._reply(status, headers, self._project(rows, params.get('select')), single)
+        # return=minimal (the default) answers 201 for inserts and 204 otherwise, with no body
+        return (201 if status == 201 else 204), {}, b''
+
+    @staticmethod
+    def _reply(status, headers, payload, single, head=False):
+        if single:
+            if len(payload) != 1:
+                return 406, headers, _error_body(
+                    f"JSON object requested, multiple (or no) rows returned", 'PGRST116'
+                )
+            payload = payload[0]
+            headers['Content-Type'] = 'application/vnd.pgrst.object+json; charset=utf-8'
+        body = json.dumps(payload, default=str).encode()
+        return status, headers, b'' if head else body
+
+    # Storage
+
+    def _storage(self, method, path, headers, body):
+        if path.startswith('upload/resumable'):
+            return self._resumable(method, path, headers, body)
+
+        public = path.startswith('object/public/')
+        if not path.startswith('object/'):
+            return 404, {}, b''
+        bucket, _, name = path[len('object/public/' if public else 'object/'):].partition('/')
+        key = (bucket, unquote(name))
+
+        if method in ('GET', 'HEAD'):
+            if key not in self.objects:
+                return 404, {'Content-Type': 'application/json'}, json.dumps({'message': 'Object not found'}).encode()
+            data, content_type = self.objects[key]
+            return 200, {'Content-Type': content_type}, b'' if method == 'HEAD' else data
+
+        if method in ('POST', 'PUT'):
+            with self.lock:
+                if key in self.objects and method == 'POST' and headers.get('x-upsert') != 'true':
+                    return 400, {'Content-Type': 'application/json'}, json.dumps({
+                        'statusCode': '409', 'error': 'Duplicate', 'message': 'The resource already exists'
+                    }).encode()
+                self.objects[key] = (body, headers.get('Content-Type') or 'application/octet-stream')
+            return 200, {'Content-Type': 'application/json'}, json.dumps({'Key': f"{bucket}/{key[1]}"}).encode()
+
+        if method == 'DELETE':
+            self.objects.pop(key, None)
+            return 200, {'Content-Type': 'application/json'}, b'{}'
+        return 405, {}, b''
+
+    def _resumable(self, method, path, headers, body):
+        tus = {'Tus-Resumable': '1.0.0'}
+        upload_id = path[len('upload/resumable'):].strip('/')
+
+        with self.lock:
+            if method == 'POST' and not upload_id:
+                metadata = {}
+                for item in (headers.get('Upload-Metadata') or '').split(','):
+                    name, _, value = item.strip().partition(' ')
+                    if name:
+                        metadata[name] = base64.b64decode(value).decode() if value else ''
+                upload_id = uuid.uuid4().hex
+                self.uploads[upload_id] = {
+                    'length': int(headers.get('Upload-Length') or 0),
+                    'data': bytearray(),
+                    'metadata': metadata
+                }
+                return 201, dict(tus, Location=f"/storage/v1/upload/resumable/{upload_id}"), b''
+
+            upload = self.uploads.get(upload_id)
+            if upload is None:
+                return 404, tus, b''
+
+            if method == 'HEAD':
+                return 200, dict(tus, **{
+                    'Upload-Offset': str(len(upload['data'])), 'Upload-Length': str(upload['length'])
+                }), b''
+
+            if method == 'PATCH':
+                if int(headers.get('Upload-Offset', -1)) != len(upload['data']):
+                    return 409, tus, b''
+                upload['data'] += body
+                if len(upload['data']) >= upload['length']:
+                    metadata = upload['metadata']
+                    key = (metadata.get('bucketName'), metadata.get('objectName'))
+                    self.objects[key] = (bytes(upload['data']), metadata.get('contentType') or 'application/octet-stream')
+                return 204, dict(tus, **{'Upload-Offset': str(len(upload['data']))}), b''
+
+        return 405, tus, b''
+
+class _Handler(BaseHTTPRequestHandler):
+    server_fake = None
+    protocol_version = 'HTTP/1.1'
+
+    def _read_body(self):
+        if 'chunked' in (self.headers.get('Transfer-Encoding') or '').lower():
+            body = bytearray()
+            while True:
+                size = int(self.rfile.readline().split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    # Trailers end with an empty line
+                    while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                        pass
+                    return bytes(body)
+                body += self.rfile.read(size)
+                self.rfile.readline()
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _dispatch(self):
+        body = self._read_body()
+        status, headers, payload = self.server_fake.handle(self.command, self.path, self.headers, body)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = do_HEAD = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the in-memory Supabase stand-in")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=54321)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Random extra delay, up to this many seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--max-rows', type=int, default=1000, help="Most rows a read returns, 0 for no limit")
+    parser.add_argument('--seed', help="JSON file of {table: [rows]} to start with")
+    args = parser.parse_args()
+
+    seed = json.loads(Path(args.seed).read_text()) if args.seed else None
+    fake = FakeSupabase(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        error_status=args.error_status, seed=seed, max_rows=args.max_rows or None
+    )
+    url = fake.start(args.host, args.port)
+    print(f"Fake Supabase listening on {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        fake.stop()
+
+if __name__ == '__main__':
+    main()
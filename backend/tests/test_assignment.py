@@ -0,0 +1,132 @@
+import unittest
+import random
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+import numpy as np
+from unittest.mock import patch
+from backend.tests.fake_supabase import FakeSupabase
+from utils import supabase
+from utils.assignment import skill_bitsets, skill_overlap, assign_interviewers
+from services.assignments import assign_applications
+
+def application(application_id, role_id):
+    return {'application_id': application_id, 'candidate_id': f'c{application_id}', 'role_id': role_id}
+
+class TestAssignment(unittest.TestCase):
+    def test_overlap_matches_set_intersection(self):
+        """Test the bitset match matrix against Python set intersections, past one 64-bit word"""
+        rng = random.Random(3)
+        skills = list(range(150))
+        index = {skill: position for position, skill in enumerate(skills)}
+        roles = [set(rng.sample(skills, rng.randrange(0, 10))) for _ in range(20)]
+        interviewers = [set(rng.sample(skills, rng.randrange(0, 60))) for _ in range(30)]
+
+        overlap = skill_overlap(skill_bitsets(roles, index), skill_bitsets(interviewers, index))
+        expected = np.array([[len(role & person) for person in interviewers] for role in roles])
+        np.testing.assert_array_equal(overlap, expected)
+
+    def test_full_coverage_and_balancing(self):
+        """Test applications go to fully covering interviewers, spread evenly"""
+        role_skills = {'backend': {'python', 'sql'}}
+        interviewer_skills = {'ann': {'python', 'sql'}, 'ben': {'python', 'sql', 'go'}, 'cat': {'python'}}
+        applications = [application(i, 'backend') for i in range(4)]
+
+        results = assign_interviewers(applications, role_skills, interviewer_skills, ['ann', 'ben', 'cat'])
+        assigned = [result['interviewer_id'] for result in results]
+        self.assertEqual(sorted(assigned), ['ann', 'ann', 'ben', 'ben'])
+        self.assertTrue(all(result['full_coverage'] for result in results))
+
+    def test_existing_load_and_cap(self):
+        """Test existing load is respected and capped interviewers are skipped"""
+        role_skills = {'backend': {'python'}}
+        interviewer_skills = {'ann': {'python'}, 'ben': {'python'}}
+        applications = [application(i, 'backend') for i in range(3)]
+
+        results = assign_interviewers(
+            applications, role_skills, interviewer_skills, ['ann', 'ben'],
+            load={'ann': 2}, max_per_interviewer=3
+        )
+        self.assertEqual([result['interviewer_id'] for result in results], ['ben', 'ben', 'ann'])
+
+        results = assign_interviewers(
+            applications, role_skills, interviewer_skills, ['ann', 'ben'],
+            load={'ann': 3, 'ben': 2}, max_per_interviewer=3
+        )
+        self.assertEqual([result['interviewer_id'] for result in results], ['ben', None, None])
+        self.assertEqual(results[1]['reason'], "Every matching interviewer is at capacity")
+
+    def test_partial_coverage_fallback(self):
+        """Test the best partial match is used when nobody has every skill"""
+        role_skills = {'data': {'python', 'spark', 'sql'}, 'ops': {'k8s'}}
+        interviewer_skills = {'ann': {'python', 'sql'}, 'ben': {'python'}}
+        results = assign_interviewers(
+            [application(1, 'data'), application(2, 'ops')], role_skills, interviewer_skills, ['ann', 'ben']
+        )
+
+        self.assertEqual(results[0]['interviewer_id'], 'ann')
+        self.assertFalse(results[0]['full_coverage'])
+        self.assertAlmostEqual(results[0]['skill_coverage'], 2 / 3)
+        self.assertIsNone(results[1]['interviewer_id'])
+
+    def test_constrained_roles_first(self):
+        """Test a role only one interviewer can take isn't starved by a flexible role"""
+        role_skills = {'general': set(), 'niche': {'cobol'}}
+        interviewer_skills = {'ann': {'cobol'}, 'ben': set()}
+        applications = [application(1, 'general'), application(2, 'niche')]
+
+        results = assign_interviewers(applications, role_skills, interviewer_skills, ['ann', 'ben'], max_per_interviewer=1)
+        self.assertEqual([result['interviewer_id'] for result in results], ['ben', 'ann'])
+
+class TestAssignApplications(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fake = FakeSupabase()
+        cls.url = cls.fake.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fake.stop()
+
+    def setUp(self):
+        self.fake.reset()
+        self.fake.insert('users', [{'user_id': 'ann', 'role': 'Interviewer'}])
+        self.fake.insert('interviewer_skills', [{'user_id': 'ann', 'skill_id': 's1'}])
+        self.fake.insert('role_skills', [{'role_id': 'r1', 'skill_id': 's1'}])
+        self.fake.insert('applications', [
+            dict(application(application_id, 'r1'), application_status='Applied')
+            for application_id in ('a1', 'a2', 'a3', 'a,b)')
+        ])
+        for patcher in (
+            patch.dict(supabase.supabase_client, {'url': self.url, 'key': 'fake'}),
+            patch('services.assignments.config.ASSIGNMENT_ID_BATCH_SIZE', 2)
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_ids_are_quoted_and_batched(self):
+        """Test requested ids can't break out of the in.() filter and go out a batch at a time"""
+        self.fake.stats.clear()
+        results, status_code, _ = assign_applications({'application_ids': ['a3', 'a1', 'a,b)', 'a1)']})
+        self.assertEqual(status_code, 200)
+        self.assertEqual([result['application_id'] for result in results], ['a,b)', 'a1', 'a3'])
+        self.assertEqual(self.fake.stats[('GET', 'applications')], 2)
+
+    def test_body_must_be_object(self):
+        """Test a JSON array or string body is a 400"""
+        for body in (['a1'], 'a1'):
+            _, status_code, message = assign_applications(body)
+            self.assertEqual(status_code, 400)
+            self.assertEqual(message, "Request body must be a JSON object")
+
+if __name__ == '__main__':
+    unittest.main()
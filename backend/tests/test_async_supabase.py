@@ -0,0 +1,132 @@
+import unittest
+import asyncio
+import sys
+import os
+
+import httpx
+from unittest.mock import patch
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils.async_supabase import AsyncSupabaseClient
+from utils.resilience import ResilientClient, RetryBudget
+
+def handler(request):
+    if request.url.path.endswith('/interviews'):
+        return httpx.Response(200, json=[{'id': '1'}, {'id': '2'}])
+    if request.url.path.endswith('/single'):
+        return httpx.Response(200, json=[{'id': '1'}])
+    if request.url.path.endswith('/counted'):
+        # Echo the Prefer header back so the test can check it
+        return httpx.Response(200, json=[], headers={
+            'Content-Range': '*/42',
+            'X-Prefer': request.headers.get('Prefer', '')
+        })
+    if request.url.path.endswith('/slow'):
+        raise httpx.ReadTimeout('timed out', request=request)
+    return httpx.Response(404, text='not found')
+
+class TestAsyncSupabaseClient(unittest.TestCase):
+    def setUp(self):
+        self.client = self.make_client(handler)
+
+    def make_client(self, handler, retries=0, hedge_delay=0):
+        budget = RetryBudget(ratio=1, min_per_second=10)
+        resilient = ResilientClient(None, retries=retries, hedge_delay=hedge_delay, budget=budget)
+        return AsyncSupabaseClient(
+            'https://example.supabase.co', 'test-key',
+            pool_size=5, timeout=1, transport=httpx.MockTransport(handler), resilient=resilient
+        )
+
+    def run_async(self, coro):
+        async def wrapper():
+            try:
+                return await coro
+            finally:
+                await self.client.aclose()
+        return asyncio.run(wrapper())
+
+    def test_request_success(self):
+        """Test a list response is returned unchanged"""
+        result = self.run_async(self.client.request('interviews'))
+        self.assertEqual(result['status_code'], 200)
+        self.assertEqual(len(result['data']), 2)
+        self.assertIsNone(result['error'])
+
+    def test_request_single_row(self):
+        """Test a single row response is unwrapped like supabase_request"""
+        result = self.run_async(self.client.request('/single'))
+        self.assertEqual(result['data'], {'id': '1'})
+
+    def test_request_error(self):
+        """Test a non-2xx response is reported as an error"""
+        result = self.run_async(self.client.request('missing'))
+        self.assertEqual(result['status_code'], 404)
+        self.assertIsNone(result['data'])
+        self.assertEqual(result['error'], 'not found')
+
+    def test_request_prefer_and_count(self):
+        """Test Prefer options are sent and the count is read from Content-Range"""
+        result = self.run_async(self.client.request('counted', method='DELETE', prefer='minimal', count='exact'))
+        self.assertEqual(result['count'], 42)
+        self.assertEqual(result['data'], [])
+
+    def test_request_timeout(self):
+        """Test a transport failure is turned into a 500 result"""
+        result = self.run_async(self.client.request('slow'))
+        self.assertEqual(result['status_code'], 500)
+
+    def test_request_many(self):
+        """Test concurrent requests keep their order"""
+        results = self.run_async(self.client.request_many([
+            {'endpoint': 'missing'},
+            {'endpoint': 'interviews'}
+        ]))
+        self.assertEqual([r['status_code'] for r in results], [404, 200])
+
+    @patch('utils.resilience.config.SUPABASE_BACKOFF_BASE', 0)
+    def test_retries_and_circuit(self):
+        """Test calls get the same retries and circuit breaker as supabase_request"""
+        statuses = [503, 200]
+        calls = []
+
+        def flaky(request):
+            calls.append(request.method)
+            return httpx.Response(statuses.pop(0) if statuses else 503, json=[])
+
+        self.client = self.make_client(flaky, retries=1)
+        result = self.run_async(self.client.request('interviews'))
+        self.assertEqual(result['status_code'], 200)
+        self.assertEqual(len(calls), 2)
+
+        # Writes aren't repeated, and a failing table opens its circuit
+        with patch('utils.resilience.config.SUPABASE_BREAKER_THRESHOLD', 2):
+            self.client.resilient._breakers.clear()
+            for _ in range(2):
+                result = self.run_async(self.client.request('interviews', method='POST', data={}))
+            self.assertEqual(result['status_code'], 503)
+            self.assertEqual(len(calls), 4)
+
+            result = self.run_async(self.client.request('interviews'))
+        self.assertIn('Circuit open', result['error'])
+        self.assertEqual(len(calls), 4)
+
+    def test_hedged_get(self):
+        """Test a slow GET is hedged and the faster copy wins"""
+        calls = []
+
+        async def slow_first(request):
+            calls.append(request.method)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json=[{'id': str(len(calls))}])
+
+        self.client = self.make_client(slow_first, retries=0, hedge_delay=0.01)
+        result = self.run_async(self.client.request('interviews'))
+        self.assertEqual(result['data'], {'id': '2'})
+        self.assertEqual(len(calls), 2)
+
+if __name__ == '__main__':
+    unittest.main()
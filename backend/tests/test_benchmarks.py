@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from backend.benchmarks.run import percentile, summarize, combine, compare, check_baseline
+
+class TestBenchmarkReport(unittest.TestCase):
+    def setUp(self):
+        self.baseline = {
+            'requests': 100, 'errors': 0, 'throughput': 200.0, 'p50_ms': 10.0, 'p95_ms': 20.0,
+            'p99_ms': 30.0, 'rss_mb': 100.0, 'upstream_calls_per_request': 1.0
+        }
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles and the summary built from them"""
+        values = [index / 1000 for index in range(1, 101)]
+        self.assertEqual(percentile(values, 0.5), 0.05)
+        self.assertEqual(percentile(values, 0.99), 0.099)
+        self.assertIsNone(percentile([], 0.5))
+
+        result = summarize(values, [200] * 99 + [503], 0.5, 150, 50 * 1024 * 1024)
+        self.assertEqual(result['throughput'], 200.0)
+        self.assertEqual(result['p95_ms'], 95.0)
+        self.assertEqual(result['errors'], 1)
+        self.assertEqual(result['rss_mb'], 50.0)
+        self.assertEqual(result['upstream_calls_per_request'], 1.5)
+
+    def test_combine_takes_medians(self):
+        """Test repeated rounds keep the median metrics and the total requests and errors"""
+        rounds = [dict(self.baseline, throughput=value, errors=1) for value in (100.0, 300.0, 200.0)]
+        combined = combine(rounds)
+        self.assertEqual(combined['throughput'], 200.0)
+        self.assertEqual(combined['requests'], 300)
+        self.assertEqual(combined['errors'], 3)
+
+    def test_regressions(self):
+        """Test changes beyond the tolerance fail while noise and improvements pass"""
+        self.assertEqual(compare(self.baseline, dict(self.baseline, throughput=180.0, p50_ms=11.0), 0.25), [])
+        self.assertEqual(compare(self.baseline, dict(self.baseline, throughput=400.0, p99_ms=5.0), 0.25), [])
+
+        regressions = compare(self.baseline, dict(
+            self.baseline, throughput=100.0, p95_ms=40.0, upstream_calls_per_request=2.0, errors=2
+        ), 0.25)
+        self.assertEqual(len(regressions), 4)
+        self.assertIn('throughput 200.0 -> 100.0', regressions)
+
+    def test_baseline_needs_matching_settings(self):
+        """Test results are only compared with a baseline recorded under the same load"""
+        baseline = {'settings': {'concurrency': 8}, 'results': {'app': {'list': self.baseline}}}
+        results = {'app': {'list': dict(self.baseline, throughput=10.0)}}
+        self.assertIsNone(check_baseline(baseline, {'concurrency': 16}, results, 0.25))
+        self.assertEqual(check_baseline(baseline, {'concurrency': 8}, results, 0.25), ['app list: throughput 200.0 -> 10.0'])
+
+if __name__ == '__main__':
+    unittest.main()
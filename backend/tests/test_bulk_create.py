@@ -0,0 +1,40 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from unittest.mock import patch
+from services.interviews import create_interviews_bulk
+
+VALID = {'candidate_name': 'Ada', 'interviewer_name': 'Grace', 'interview_date': '2099-01-01', 'interview_time': '10:00'}
+
+class TestBulkCreateStatus(unittest.TestCase):
+    def test_upstream_failure_is_passed_on(self):
+        """Test a bulk create that only failed in Supabase returns its status, not a 400"""
+        with patch('services.interviews.supabase_request', return_value={'status_code': 503, 'error': 'down'}):
+            results, status_code, _ = create_interviews_bulk([VALID, dict(VALID, candidate_name='Linus')])
+        self.assertEqual(status_code, 503)
+        self.assertFalse(any(result['success'] for result in results))
+
+        # One invalid row doesn't make a Supabase outage the client's fault
+        with patch('services.interviews.supabase_request', return_value={'status_code': 502, 'error': 'down'}):
+            _, status_code, _ = create_interviews_bulk([VALID, {'candidate_name': 'Ada'}])
+        self.assertEqual(status_code, 502)
+
+    def test_invalid_payload(self):
+        """Test a batch where every row is invalid is a 400 and never reaches Supabase"""
+        with patch('services.interviews.supabase_request') as request:
+            _, status_code, _ = create_interviews_bulk([{'candidate_name': 'Ada'}, 'not an object'])
+        self.assertEqual(status_code, 400)
+        request.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils.cache import TTLCache, InterviewCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(maxsize=2, ttl=10, clock=self.clock)
+
+    def test_expiry(self):
+        """Test entries expire after the TTL"""
+        self.cache.set('a', 1)
+        self.clock.now = 9
+        self.assertEqual(self.cache.get('a'), 1)
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('c'), 3)
+
+class TestInterviewCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = InterviewCache(maxsize=16, ttl=10, clock=FakeClock())
+        self.calls = 0
+
+    def loader(self):
+        self.calls += 1
+        return ['row']
+
+    def test_list_key_normalization(self):
+        """Test empty filters and argument order don't change the key"""
+        self.assertEqual(
+            InterviewCache.list_key({'status': 'Scheduled', 'interviewer': None, 'date_end': ''}),
+            InterviewCache.list_key({'status': 'Scheduled'})
+        )
+
+    def test_read_through(self):
+        """Test repeated reads only hit the loader once"""
+        self.cache.get_list({'status': 'Scheduled'}, self.loader)
+        self.cache.get_list({'status': 'Scheduled', 'date_start': None}, self.loader)
+        self.assertEqual(self.calls, 1)
+
+    def test_uncacheable_results(self):
+        """Test results rejected by cacheable are not stored"""
+        self.cache.get_list({}, self.loader, cacheable=lambda result: False)
+        self.cache.get_list({}, self.loader, cacheable=lambda result: False)
+        self.assertEqual(self.calls, 2)
+
+    def test_create_invalidates_matching_lists(self):
+        """Test a new row only drops the list queries it could appear in"""
+        self.cache.get_list({'status': 'Scheduled'}, self.loader)
+        self.cache.get_list({'status': 'Completed'}, self.loader)
+        self.cache.invalidate(row={'status': 'Scheduled', 'scheduled_at': '2030-01-01T10:00:00'})
+        self.cache.get_list({'status': 'Scheduled'}, self.loader)
+        self.cache.get_list({'status': 'Completed'}, self.loader)
+        self.assertEqual(self.calls, 3)
+
+    def test_update_invalidates_detail_and_lists(self):
+        """Test an update drops the interview and every list query"""
+        self.cache.get_detail('1', self.loader)
+        self.cache.get_detail('2', self.loader)
+        self.cache.get_list({'status': 'Completed'}, self.loader)
+        self.cache.invalidate(interview_id='1')
+        self.cache.get_detail('1', self.loader)
+        self.cache.get_detail('2', self.loader)
+        self.cache.get_list({'status': 'Completed'}, self.loader)
+        self.assertEqual(self.calls, 5)
+
+    def test_write_during_load_is_not_cached(self):
+        """Test a result loaded before a concurrent write's invalidation isn't stored"""
+        def racing_loader():
+            # The write lands while the read is waiting on Supabase
+            self.cache.invalidate(row={'status': 'Scheduled'})
+            return self.loader()
+
+        self.cache.get_list({'status': 'Scheduled'}, racing_loader)
+        self.cache.get_list({'status': 'Scheduled'}, self.loader)
+        self.assertEqual(self.calls, 2)
+
+        _, generation = self.cache.peek_list({'format': 'raw'})
+        self.cache.invalidate(interview_id='1')
+        self.assertFalse(self.cache.set_list({'format': 'raw'}, b'[]', generation))
+        self.assertEqual(self.cache.peek_list({'format': 'raw'})[0], None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+import gzip
+import json
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from flask import Flask, Response, jsonify
+from utils import compression
+from utils.compression import init_compression
+from utils.etags import conditional
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        init_compression(self.app)
+        self.rows = [{'id': index, 'candidate_name': f'Candidate {index}', 'status': 'Scheduled'} for index in range(200)]
+
+        @self.app.route('/rows')
+        @conditional
+        def rows():
+            return jsonify(self.rows)
+
+        @self.app.route('/small')
+        def small():
+            return jsonify({'success': True})
+
+        @self.app.route('/stream')
+        def stream():
+            return Response((json.dumps(row) + '\n' for row in self.rows), mimetype='application/x-ndjson')
+
+        self.client = self.app.test_client()
+
+    def test_gzip(self):
+        """Test large bodies are gzipped when the client accepts gzip only"""
+        response = self.client.get('/rows', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(int(response.headers['Content-Length']), len(response.data))
+        self.assertEqual(json.loads(gzip.decompress(response.data)), self.rows)
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+
+    @unittest.skipIf(compression.brotli is None, "Brotli is not installed")
+    def test_brotli_preferred(self):
+        """Test brotli wins when the client accepts both"""
+        response = self.client.get('/rows', headers={'Accept-Encoding': 'gzip, deflate, br'})
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(json.loads(compression.brotli.decompress(response.data)), self.rows)
+
+    def test_small_and_unaccepted_bodies(self):
+        """Test small bodies and clients without Accept-Encoding get identity responses"""
+        small = self.client.get('/small', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', small.headers)
+
+        plain = self.client.get('/rows')
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertEqual(json.loads(plain.data), self.rows)
+
+    def test_streamed(self):
+        """Test streamed bodies are compressed incrementally into one valid gzip stream"""
+        response = self.client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertNotIn('Content-Length', response.headers)
+        lines = gzip.decompress(response.data).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.rows)
+
+    def test_conditional_still_matches(self):
+        """Test the weakened ETag of a compressed body still gets a 304"""
+        first = self.client.get('/rows', headers={'Accept-Encoding': 'gzip'})
+        self.assertTrue(first.headers['ETag'].startswith('W/'))
+
+        second = self.client.get('/rows', headers={'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+        self.assertEqual(second.status_code, 304)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+import random
+import sys
+import threading
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from utils.conflicts import IntervalTree, ConflictIndex, interview_span
+
+def interview(id, interviewer, scheduled_at, duration=60, status='Scheduled'):
+    return {
+        'id': id,
+        'interviewer_name': interviewer,
+        'scheduled_at': scheduled_at,
+        'duration_minutes': duration,
+        'status': status
+    }
+
+class TestIntervalTree(unittest.TestCase):
+    def test_overlap_matches_brute_force(self):
+        """Test overlap lookups against a linear scan after random inserts and removes"""
+        rng = random.Random(7)
+        tree = IntervalTree()
+        intervals = {}
+
+        for step in range(2000):
+            if intervals and rng.random() < 0.3:
+                handle = rng.choice(list(intervals))
+                self.assertTrue(tree.remove(handle))
+                del intervals[handle]
+            else:
+                start = rng.randrange(0, 10000)
+                end = start + rng.randrange(1, 200)
+                intervals[tree.insert(start, end, step)] = (start, end)
+
+            start = rng.randrange(0, 10000)
+            end = start + rng.randrange(1, 200)
+            expected = any(s < end and start < e for s, e in intervals.values())
+            self.assertEqual(tree.overlap(start, end) is not None, expected)
+
+        self.assertEqual(len(tree), len(intervals))
+
+    def test_search_returns_all_overlaps(self):
+        """Test search lists every overlapping interval in start order"""
+        tree = IntervalTree()
+        for start in (50, 0, 30, 10):
+            tree.insert(start, start + 15, start)
+        self.assertEqual([value for _, _, value in tree.search(12, 45)], [0, 10, 30])
+
+    def test_touching_intervals_do_not_overlap(self):
+        """Test back-to-back intervals are allowed"""
+        tree = IntervalTree()
+        tree.insert(10, 20, 'a')
+        self.assertIsNone(tree.overlap(20, 30))
+        self.assertIsNone(tree.overlap(0, 10))
+        self.assertEqual(tree.overlap(19, 21), 'a')
+
+class TestConflictIndex(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            interview(1, 'Alice', '2030-01-01T10:00:00'),
+            interview(2, 'Bob', '2030-01-01T10:00:00+00:00'),
+            interview(3, 'Alice', '2030-01-01T14:00:00', status='Cancelled')
+        ]
+        self.index = ConflictIndex(lambda: self.rows, ttl=300)
+
+    def test_interview_span(self):
+        """Test naive and UTC timestamps give the same span and cancelled rows hold none"""
+        self.assertEqual(interview_span(self.rows[0]), interview_span(self.rows[1]))
+        self.assertIsNone(interview_span(self.rows[2]))
+
+    def test_reject_overlap(self):
+        """Test an overlapping booking for the same interviewer is rejected"""
+        reservation, conflict = self.index.reserve(interview(None, 'Alice', '2030-01-01T10:30:00'))
+        self.assertIsNone(reservation)
+        self.assertEqual(conflict, '1')
+
+        # Other interviewers and cancelled slots are free
+        reservation, conflict = self.index.reserve(interview(None, 'Carol', '2030-01-01T10:30:00'))
+        self.assertIsNotNone(reservation)
+        self.assertIsNone(conflict)
+        reservation, conflict = self.index.reserve(interview(None, 'Alice', '2030-01-01T14:00:00'))
+        self.assertIsNone(conflict)
+
+    def test_flag_overlap(self):
+        """Test reject=False holds the slot and reports the overlap"""
+        reservation, conflict = self.index.reserve(interview(None, 'Alice', '2030-01-01T10:30:00'), reject=False)
+        self.assertIsNotNone(reservation)
+        self.assertEqual(conflict, '1')
+
+    def test_pending_reservation_blocks_and_release(self):
+        """Test a reservation blocks others until it is released"""
+        row = interview(None, 'Alice', '2030-01-02T09:00:00')
+        reservation, _ = self.index.reserve(row)
+
+        _, conflict = self.index.reserve(row)
+        self.assertEqual(conflict, 'pending')
+
+        self.index.release(reservation)
+        reservation, conflict = self.index.reserve(row)
+        self.assertIsNone(conflict)
+
+    def test_commit_and_discard(self):
+        """Test a committed booking is indexed under its id until discarded"""
+        reservation, _ = self.index.reserve(interview(None, 'Alice', '2030-01-02T09:00:00'))
+        self.index.commit(reservation, interview(10, 'Alice', '2030-01-02T09:00:00'))
+
+        _, conflict = self.index.reserve(interview(None, 'Alice', '2030-01-02T09:30:00'))
+        self.assertEqual(conflict, '10')
+
+        self.index.discard(10)
+        _, conflict = self.index.reserve(interview(None, 'Alice', '2030-01-02T09:30:00'))
+        self.assertIsNone(conflict)
+
+    def test_booked(self):
+        """Test booked slots are grouped by interviewer"""
+        booked = self.index.booked(interview_span(self.rows[0])[0], interview_span(self.rows[0])[1])
+        self.assertEqual(sorted(booked), ['Alice', 'Bob'])
+        self.assertEqual(len(booked['Alice']), 1)
+
+    def test_update_ignores_own_slot(self):
+        """Test moving an interview doesn't clash with its old slot, and a failed move restores it"""
+        moved = interview(None, 'Alice', '2030-01-01T10:30:00')
+        reservation, conflict = self.index.reserve(moved, interview_id=1)
+        self.assertIsNone(conflict)
+
+        self.index.release(reservation)
+        _, conflict = self.index.reserve(interview(None, 'Alice', '2030-01-01T10:15:00'))
+        self.assertEqual(conflict, '1')
+
+    def test_reload_after_ttl(self):
+        """Test the index is rebuilt in the background once the TTL expires"""
+        now = [0]
+        loadable = threading.Event()
+        loadable.set()
+        index = ConflictIndex(lambda: loadable.wait(5) and self.rows, ttl=10, clock=lambda: now[0])
+        _, conflict = index.reserve(interview(None, 'Dan', '2030-01-01T12:00:00'))
+        self.assertIsNone(conflict)
+
+        self.rows.append(interview(4, 'Dan', '2030-01-01T10:00:00'))
+        now[0] = 11
+        loadable.clear()
+        # The stale index answers while the reload runs
+        reservation, conflict = index.reserve(interview(None, 'Dan', '2030-01-01T10:30:00'))
+        self.assertIsNone(conflict)
+        index.release(reservation)
+        loadable.set()
+        index._executor.shutdown(wait=True)
+        index._executor = None
+
+        _, conflict = index.reserve(interview(None, 'Dan', '2030-01-01T10:30:00'))
+        self.assertEqual(conflict, '4')
+
+    def test_writes_during_reload(self):
+        """Test a reload doesn't block bookings and keeps the ones committed while it ran"""
+        loads = []
+
+        def loader():
+            if loads:
+                thread = threading.Thread(target=book)
+                thread.start()
+                thread.join(5)
+                self.assertFalse(thread.is_alive())
+            loads.append(True)
+            return list(self.rows)
+
+        def book():
+            reservation, _ = index.reserve(interview(None, 'Eve', '2030-01-03T09:00:00'))
+            index.commit(reservation, interview(20, 'Eve', '2030-01-03T09:00:00'))
+
+        index = ConflictIndex(loader, ttl=300)
+        self.assertTrue(index.refresh())
+        self.assertTrue(index.refresh())
+        _, conflict = index.reserve(interview(None, 'Eve', '2030-01-03T09:30:00'))
+        self.assertEqual(conflict, '20')
+
+    def test_loader_failure_fails_open(self):
+        """Test bookings go through when the interviews can't be loaded"""
+        index = ConflictIndex(lambda: None, ttl=300)
+        reservation, conflict = index.reserve(interview(None, 'Alice', '2030-01-01T10:30:00'))
+        self.assertIsNotNone(reservation)
+        self.assertIsNone(conflict)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import sys
+import os
+from datetime import date, datetime, time, timezone
+from unittest import mock
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from utils import datetimes
+from utils.datetimes import parse_date, parse_time, resolve_timezone, to_utc, today
+from utils.validators import INTERVIEW_FORM_SCHEMA, validate_date, validate_time
+
+class TestDatetimes(unittest.TestCase):
+    def test_parse_date(self):
+        """Test only YYYY-MM-DD dates are accepted"""
+        self.assertEqual(parse_date('2030-02-28'), date(2030, 2, 28))
+        for value in ('2030-02-30', '20300228', '2030-W01-1', '30-02-2030', None, 20300228):
+            with self.assertRaises((ValueError, TypeError)):
+                parse_date(value)
+
+    def test_parse_time(self):
+        """Test 24-hour times, with single digits accepted like strptime"""
+        self.assertEqual(parse_time('09:30'), time(9, 30))
+        self.assertEqual(parse_time('9:05'), time(9, 5))
+        for value in ('24:00', '12:60', '1230', '12:3a', '١٢:٠٠', ''):
+            with self.assertRaises(ValueError):
+                parse_time(value)
+
+    def test_to_utc(self):
+        """Test local times are converted to UTC, including across DST"""
+        new_york = resolve_timezone('America/New_York')
+        self.assertEqual(to_utc(date(2030, 1, 15), time(9, 0), new_york), datetime(2030, 1, 15, 14, 0, tzinfo=timezone.utc))
+        self.assertEqual(to_utc(date(2030, 7, 15), time(9, 0), new_york), datetime(2030, 7, 15, 13, 0, tzinfo=timezone.utc))
+        self.assertEqual(to_utc(date(2030, 1, 15), time(9, 0)).isoformat(), '2030-01-15T09:00:00+00:00')
+
+    def test_resolve_timezone(self):
+        """Test unknown timezones and values that aren't names are rejected"""
+        self.assertIs(resolve_timezone('UTC'), timezone.utc)
+        for value in ('Mars/Olympus_Mons', 5, ['UTC'], {'name': 'UTC'}):
+            with self.assertRaises(ValueError):
+                resolve_timezone(value)
+
+    def test_today_is_cached_until_midnight(self):
+        """Test today is only recomputed once the local day is over"""
+        datetimes._today_cache.clear()
+        midnight = datetime(2030, 1, 2, tzinfo=timezone.utc).timestamp()
+        with mock.patch.object(datetimes.time, 'time', return_value=midnight - 1):
+            self.assertEqual(today(timezone.utc), date(2030, 1, 1))
+        with mock.patch.object(datetimes.time, 'time', return_value=midnight):
+            self.assertEqual(today(timezone.utc), date(2030, 1, 2))
+        datetimes._today_cache.clear()
+
+    def test_validators(self):
+        """Test the (valid, error) validators keep their messages"""
+        self.assertEqual(validate_date('2000-01-01'), (False, "Date must be in the future"))
+        self.assertEqual(validate_date('01/01/2099'), (False, "Invalid date format. Use YYYY-MM-DD"))
+        self.assertEqual(validate_time('10:00'), (True, None))
+
+    def test_form_schema_timezone(self):
+        """Test the interview form takes a timezone and checks the date against it"""
+        form = {
+            'candidateName': 'Jane', 'interviewer': 'John', 'date': '2099-01-01', 'time': '10:00',
+            'duration': '30', 'format': 'Video', 'jobRole': 'Engineer', 'timezone': 'Asia/Tokyo'
+        }
+        values, errors = INTERVIEW_FORM_SCHEMA.validate(form)
+        self.assertEqual(errors, [])
+        self.assertEqual(to_utc(values['date'], values['time'], values['timezone']).isoformat(), '2099-01-01T01:00:00+00:00')
+
+        for timezone_value in ('Nowhere', 5):
+            _, errors = INTERVIEW_FORM_SCHEMA.validate(dict(form, timezone=timezone_value))
+            self.assertEqual(errors, ["Unknown timezone. Use an IANA name like Europe/London"])
+
+        _, errors = INTERVIEW_FORM_SCHEMA.validate(dict(form, date='2000-01-01'))
+        self.assertEqual(errors, ["Date must be in the future"])
+
+if __name__ == '__main__':
+    unittest.main()
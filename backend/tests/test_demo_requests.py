@@ -9,8 +9,8 @@ from datetime import datetime
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from backend.services.demo_requests import create_demo_request, get_demo_requests
-from backend.utils.supabase import supabase_request
+from services.demo_requests import create_demo_request, get_demo_requests
+from utils.supabase import supabase_request
 
 BASE_URL = 'http://127.0.0.1:5000'
 
@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from flask import Flask, jsonify
+from utils.etags import conditional
+from utils.passthrough import passthrough_response
+
+class FakeUpstream:
+    def __init__(self, body, headers):
+        self.body = body
+        self.headers = headers
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        yield self.body
+
+    def close(self):
+        self.closed = True
+
+class TestConditional(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.rows = [{'id': 1, 'status': 'Scheduled'}]
+        self.upstream = None
+
+        @self.app.route('/rows')
+        @conditional
+        def rows():
+            return jsonify({'success': True, 'data': self.rows})
+
+        @self.app.route('/missing')
+        @conditional
+        def missing():
+            return jsonify({'success': False}), 404
+
+        @self.app.route('/stream')
+        @conditional
+        def stream():
+            self.upstream = FakeUpstream(b'[]', {'ETag': '"upstream"'})
+            return passthrough_response(self.upstream)
+
+        self.client = self.app.test_client()
+
+    def test_not_modified(self):
+        """Test a repeated poll with the ETag gets an empty 304"""
+        first = self.client.get('/rows')
+        etag = first.headers['ETag']
+        self.assertEqual(first.headers['Cache-Control'], 'no-cache')
+
+        second = self.client.get('/rows', headers={'If-None-Match': etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+
+    def test_changed_body_gets_new_etag(self):
+        """Test an update changes the tag and the old one no longer matches"""
+        etag = self.client.get('/rows').headers['ETag']
+        self.rows[0]['status'] = 'Completed'
+
+        response = self.client.get('/rows', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_errors_untagged(self):
+        """Test error responses are never tagged"""
+        response = self.client.get('/missing')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response.headers)
+
+    def test_forwarded_etag(self):
+        """Test a streamed response is matched on its forwarded tag and the upstream is released"""
+        response = self.client.get('/stream', headers={'If-None-Match': '"upstream"'})
+        self.assertEqual(response.status_code, 304)
+        response.close()
+        self.assertTrue(self.upstream.closed)
+
+if __name__ == '__main__':
+    unittest.main()
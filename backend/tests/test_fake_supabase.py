@@ -0,0 +1,140 @@
+import unittest
+import io
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+import requests
+from unittest.mock import patch
+from backend.tests.fake_supabase import FakeSupabase
+from utils import supabase
+from utils.storage import upload_file_stream
+
+class TestFakeSupabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fake = FakeSupabase()
+        cls.url = cls.fake.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fake.stop()
+
+    def setUp(self):
+        self.fake.latency = 0
+        self.fake.error_rate = 0
+        self.fake.reset()
+        self.fake.insert('interviews', [
+            {'candidate_name': 'Ada', 'status': 'Scheduled', 'scheduled_at': '2024-05-01T10:00:00+02:00'},
+            {'candidate_name': 'Grace', 'status': 'Completed', 'scheduled_at': '2024-05-02T09:00:00Z'},
+            {'candidate_name': 'Linus', 'status': 'Scheduled', 'scheduled_at': '2024-05-03T09:00:00Z'}
+        ])
+        patcher = patch.dict(supabase.supabase_client, {'url': self.url, 'key': 'fake'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def names(self, result):
+        data = result['data']
+        return [row['candidate_name'] for row in (data if isinstance(data, list) else [data])]
+
+    def test_defaults_from_migrations(self):
+        """Test inserted rows get the column defaults the migrations declare"""
+        result = supabase.supabase_request('interviews', 'POST', {'candidate_name': 'Barbara'}, prefer='representation')
+        self.assertEqual(result['status_code'], 201)
+        self.assertEqual(result['data']['feedback_submitted'], 'No')
+        self.assertIs(result['data']['use_question_bank'], False)
+        self.assertTrue(result['data']['id'])
+
+    def test_filters_and_order(self):
+        """Test comparison, in and keyset or= filters with a multi-column order"""
+        result = supabase.supabase_request('interviews', params={
+            'status': 'eq.Scheduled', 'order': 'scheduled_at.desc,id.asc'
+        })
+        self.assertEqual(self.names(result), ['Linus', 'Ada'])
+
+        # Offsets are compared as instants, 10:00+02:00 is before 09:00Z the next day
+        result = supabase.supabase_request('interviews', params={
+            'scheduled_at': 'gte.2024-05-01T08:00:00Z', 'order': 'scheduled_at.asc', 'limit': '2'
+        })
+        self.assertEqual(self.names(result), ['Ada', 'Grace'])
+
+        result = supabase.supabase_request('interviews', params={
+            'candidate_name': 'in.(Ada,"Grace")',
+            'or': '(status.eq.Completed,and(status.eq.Scheduled,scheduled_at.lt.2024-05-02T00:00:00Z))',
+            'order': 'candidate_name.asc'
+        })
+        self.assertEqual(self.names(result), ['Ada', 'Grace'])
+
+    def test_count_and_pages(self):
+        """Test Prefer count= fills in the total and iter_rows pages to a 416"""
+        result = supabase.supabase_request('interviews', params={'limit': '1'}, count='exact')
+        self.assertEqual(result['count'], 3)
+
+        rows = list(supabase.iter_rows('interviews', params={'order': 'scheduled_at.asc'}, page_size=2))
+        self.assertEqual([row['candidate_name'] for row in rows], ['Ada', 'Grace', 'Linus'])
+
+    def test_max_rows(self):
+        """Test reads are capped at max_rows whatever limit or Range asks for"""
+        with patch.object(self.fake, 'max_rows', 2):
+            result = supabase.supabase_request('interviews', count='exact')
+            self.assertEqual(len(result['data']), 2)
+            self.assertEqual(result['count'], 3)
+
+            response = requests.get(f"{self.url}/rest/v1/interviews", params={'limit': '5'},
+                                    headers={'apikey': 'fake', 'Range': '1-'})
+            self.assertEqual(len(response.json()), 2)
+            self.assertEqual(response.headers['Content-Range'], '1-2/*')
+
+    def test_update_and_delete(self):
+        """Test PATCH and DELETE only touch the filtered rows"""
+        result = supabase.supabase_request(
+            'interviews?candidate_name=eq.Ada', 'PATCH', {'status': 'Cancelled'}, prefer='representation'
+        )
+        self.assertEqual(result['data']['status'], 'Cancelled')
+
+        result = supabase.supabase_request('interviews?status=eq.Scheduled', 'DELETE')
+        self.assertEqual(result['status_code'], 204)
+        self.assertEqual(len(self.fake.tables['interviews']), 2)
+
+    def test_injected_faults(self):
+        """Test the configured error rate is returned instead of the query"""
+        self.fake.error_rate = 1
+        response = requests.get(f"{self.url}/rest/v1/interviews", headers={'apikey': 'fake'})
+        self.assertEqual(response.status_code, 503)
+
+        requests.post(f"{self.url}/__fake/config", json={'error_rate': 0})
+        response = requests.get(f"{self.url}/rest/v1/interviews", headers={'apikey': 'fake'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_uploads(self):
+        """Test single, chunked and resumable uploads all end up stored"""
+        upload_file_stream(io.BytesIO(b'resume'), 'small.pdf', self.url, 'fake', bucket='docs')
+        self.assertEqual(self.fake.objects[('docs', 'small.pdf')][0], b'resume')
+
+        class Unsized:
+            # No tell/seek, so the size is unknown and the body goes up chunked
+            def __init__(self, data):
+                self.buffer = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self.buffer.read(size)
+
+        upload_file_stream(Unsized(b'chunked body'), 'chunked.pdf', self.url, 'fake', bucket='docs')
+        self.assertEqual(self.fake.objects[('docs', 'chunked.pdf')][0], b'chunked body')
+
+        data = os.urandom(50000)
+        with patch('utils.storage.config.STORAGE_RESUMABLE_THRESHOLD', 1000), \
+                patch('utils.storage.config.STORAGE_CHUNK_SIZE', 16384):
+            upload_file_stream(io.BytesIO(data), 'large.pdf', self.url, 'fake', bucket='docs')
+        self.assertEqual(self.fake.objects[('docs', 'large.pdf')][0], data)
+
+if __name__ == '__main__':
+    unittest.main()
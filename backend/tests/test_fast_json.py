@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+from datetime import datetime
+from decimal import Decimal
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from flask import Flask, jsonify, request
+from utils.fast_json import dumps, loads, init_json
+
+class TestFastJson(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        init_json(self.app)
+
+        @self.app.route('/echo', methods=['POST'])
+        def echo():
+            return jsonify({'data': request.get_json(), 'when': datetime(2030, 1, 1, 9, 30)})
+
+        self.client = self.app.test_client()
+
+    def test_dumps_loads_round_trip(self):
+        """Test values survive a round trip, including non-string keys and big integers"""
+        value = {'a': [1, 2.5, None, True], 'b': 'é', 'c': 2 ** 70}
+        self.assertEqual(loads(dumps(value)), value)
+        self.assertEqual(loads(dumps({1: 'x'})), {'1': 'x'})
+        self.assertEqual(dumps({'d': Decimal('1.5')}, default=str), b'{"d":"1.5"}')
+
+    def test_jsonify_matches_flask_formatting(self):
+        """Test responses keep Flask's datetime format and sorted keys"""
+        response = self.client.post('/echo', json={'z': 1, 'a': [1, 2]})
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body['data'], {'z': 1, 'a': [1, 2]})
+        self.assertEqual(body['when'], 'Tue, 01 Jan 2030 09:30:00 GMT')
+        self.assertLess(response.data.index(b'"data"'), response.data.index(b'"when"'))
+
+    def test_invalid_request_body(self):
+        """Test malformed JSON bodies are still rejected with a 400"""
+        response = self.client.post('/echo', data='{nope', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# server.py imports its helpers from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+import requests
+from unittest.mock import patch
+from backend.tests.fake_supabase import FakeSupabase
+import server
+
+class TestInterviewListETag(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fake = FakeSupabase()
+        cls.url = cls.fake.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fake.stop()
+
+    def setUp(self):
+        self.fake.reset()
+        self.fake.insert('interviews', [
+            {'candidate_name': 'Ada', 'interviewer_name': 'Grace', 'status': 'Scheduled',
+             'scheduled_at': '2030-01-01T10:00:00Z', 'duration_minutes': 60},
+            {'candidate_name': 'Linus', 'interviewer_name': 'Grace', 'status': 'Scheduled',
+             'scheduled_at': '2030-01-02T10:00:00Z', 'duration_minutes': 60}
+        ])
+        for name, value in (('SUPABASE_URL', self.url), ('SUPABASE_KEY', 'fake')):
+            patcher = patch.object(server, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(server.config, 'INTERVIEWS_PASSTHROUGH', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        server.interview_cache.clear()
+        self.addCleanup(server.interview_cache.clear)
+        self.client = server.app.test_client()
+
+    def test_not_modified_after_stream(self):
+        """Test a streamed list is tagged from its body once cached and an unchanged poll gets a 304"""
+        first = self.client.get('/api/interviews')
+        self.assertEqual(len(first.get_json()['data']), 2)
+        # Only the rows themselves were read
+        self.assertEqual(self.fake.stats[('GET', 'interviews')], 1)
+
+        etag = self.client.get('/api/interviews').headers['ETag']
+        second = self.client.get('/api/interviews', headers={'If-None-Match': etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+        self.assertEqual(self.fake.stats[('GET', 'interviews')], 1)
+
+        # Other filters get their own tag
+        filtered = self.client.get('/api/interviews?status=Scheduled', headers={'If-None-Match': etag})
+        self.assertEqual(filtered.status_code, 200)
+
+    def test_write_mid_stream_not_cached(self):
+        """Test a list streamed while a write lands isn't cached, so the next poll sees the write"""
+        response = self.client.get('/api/interviews', buffered=False)
+        requests.patch(
+            f"{self.url}/rest/v1/interviews?candidate_name=eq.Ada", json={'status': 'Completed'},
+            headers={'apikey': 'fake'}
+        )
+        server.interview_cache.invalidate()
+        b''.join(response.response)
+        response.close()
+
+        response = self.client.get('/api/interviews')
+        self.assertEqual(response.get_json()['data'][0]['status'], 'Completed')
+        self.assertEqual(self.fake.stats[('GET', 'interviews')], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from flask import Flask, g
+from utils.metrics import (
+    Counter, Histogram, Registry, table_name, track_supabase_call, init_metrics, SUPABASE_REQUESTS
+)
+
+class TestMetrics(unittest.TestCase):
+    def test_table_name(self):
+        """Test table names are taken from Supabase endpoints"""
+        self.assertEqual(table_name('interviews?id=eq.1'), 'interviews')
+        self.assertEqual(table_name('/rest/v1/demo_requests'), 'demo_requests')
+        self.assertEqual(table_name('/storage/v1/object/resumes/a.pdf'), 'storage')
+
+    def test_histogram_render(self):
+        """Test histograms render cumulative buckets, sum and count"""
+        registry = Registry()
+        histogram = registry.register(Histogram('latency_seconds', 'Latency', ('route',), buckets=(0.1, 1)))
+        histogram.observe(0.05, route='/a')
+        histogram.observe(0.5, route='/a')
+
+        text = registry.render()
+        self.assertIn('# TYPE latency_seconds histogram', text)
+        self.assertIn('latency_seconds_bucket{route="/a",le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{route="/a",le="1"} 2', text)
+        self.assertIn('latency_seconds_bucket{route="/a",le="+Inf"} 2', text)
+        self.assertIn('latency_seconds_count{route="/a"} 2', text)
+
+    def test_counter_escapes_labels(self):
+        """Test label values are escaped"""
+        registry = Registry()
+        counter = registry.register(Counter('calls_total', 'Calls', ('name',)))
+        counter.inc(name='a"b')
+        self.assertIn('calls_total{name="a\\"b"} 1', registry.render())
+
+    def test_track_supabase_call(self):
+        """Test tracked calls are counted per request and by status class"""
+        app = Flask(__name__)
+        init_metrics(app)
+
+        with app.test_request_context('/'):
+            app.preprocess_request()
+            for status in (200, 404):
+                with track_supabase_call('metrics_test?id=eq.1', 'GET') as call:
+                    call.status = status
+            self.assertEqual(g.supabase_calls, 2)
+
+        text = '\n'.join(SUPABASE_REQUESTS.render())
+        self.assertIn('supabase_requests_total{table="metrics_test",method="GET",status="2xx"} 1', text)
+        self.assertIn('supabase_requests_total{table="metrics_test",method="GET",status="4xx"} 1', text)
+
+    def test_track_supabase_call_error(self):
+        """Test a call that raises is recorded as an error"""
+        with self.assertRaises(RuntimeError):
+            with track_supabase_call('metrics_error', 'POST'):
+                raise RuntimeError('boom')
+
+        text = '\n'.join(SUPABASE_REQUESTS.render())
+        self.assertIn('supabase_requests_total{table="metrics_error",method="POST",status="error"} 1', text)
+
+if __name__ == '__main__':
+    unittest.main()
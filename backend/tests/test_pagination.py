@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils.pagination import (
+    parse_fields, parse_limit, encode_cursor, decode_cursor, keyset_filter, next_cursor
+)
+from backend.tests.fake_supabase import _logic
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        self.row = {'id': '5b1c', 'scheduled_at': '2030-01-01T10:00:00+00:00'}
+
+    def test_parse_fields(self):
+        """Test projections always include the cursor columns"""
+        self.assertEqual(parse_fields(None), '*')
+        self.assertEqual(parse_fields('candidate_name, status'), 'candidate_name,status,scheduled_at,id')
+
+    def test_parse_fields_unknown(self):
+        """Test unknown columns are rejected"""
+        with self.assertRaises(ValueError):
+            parse_fields('candidate_name,password')
+
+    def test_parse_limit(self):
+        """Test limits are validated and capped"""
+        self.assertIsNone(parse_limit(None, 100))
+        self.assertEqual(parse_limit('20', 100), 20)
+        self.assertEqual(parse_limit('500', 100), 100)
+        for value in ('0', '-1', 'ten'):
+            with self.assertRaises(ValueError):
+                parse_limit(value, 100)
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes back to the row's keyset"""
+        cursor = encode_cursor(self.row)
+        self.assertEqual(decode_cursor(cursor), (self.row['scheduled_at'], self.row['id']))
+        self.assertIn('id.gt."5b1c"', keyset_filter(cursor))
+
+    def test_keyset_filter_escapes_values(self):
+        """Test reserved characters, quotes and backslashes in cursor values stay inside the quotes"""
+        row = {'id': 'a,b)"c\\', 'scheduled_at': '2030-01-01T10:00:00+00:00'}
+        expression = keyset_filter(encode_cursor(row))
+        self.assertIn(r'id.gt."a,b)\"c\\"', expression)
+
+        # The stand-in parses logic trees like PostgREST, only rows after the cursor match
+        matches = _logic('or', expression)
+        self.assertTrue(matches({'id': 'a,b)"d', 'scheduled_at': row['scheduled_at']}))
+        self.assertFalse(matches({'id': 'a,b)"a', 'scheduled_at': row['scheduled_at']}))
+        self.assertTrue(matches({'id': '0', 'scheduled_at': '2030-01-02T10:00:00+00:00'}))
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors are rejected"""
+        with self.assertRaises(ValueError):
+            decode_cursor('not-a-cursor')
+
+    def test_next_cursor(self):
+        """Test a cursor is only returned for full pages"""
+        self.assertIsNone(next_cursor([self.row], 2))
+        self.assertIsNone(next_cursor([self.row], None))
+        self.assertEqual(next_cursor([self.row, self.row], 2), encode_cursor(self.row))
+
+if __name__ == '__main__':
+    unittest.main()
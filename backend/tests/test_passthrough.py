@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import json
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from flask import Flask
+from utils.passthrough import passthrough_response, body_response
+
+class FakeUpstream:
+    """Just enough of a streamed requests.Response"""
+
+    def __init__(self, body, headers=None):
+        self.body = body
+        self.headers = headers or {}
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), 4):
+            yield self.body[start:start + 4]
+
+    def close(self):
+        self.closed = True
+
+class TestPassthrough(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.rows = [{'id': 1, 'candidate_name': 'Ada'}, {'id': 2, 'candidate_name': 'Grace'}]
+        self.body = json.dumps(self.rows).encode()
+
+    def get(self, view):
+        self.app.add_url_rule('/rows', 'rows', view)
+        return self.app.test_client().get('/rows')
+
+    def test_body_wrapped_in_envelope(self):
+        """Test the upstream body comes back inside the success envelope with its length and ETag"""
+        upstream = FakeUpstream(self.body, {'Content-Length': str(len(self.body)), 'ETag': '"v1"'})
+        response = self.get(lambda: passthrough_response(upstream))
+
+        self.assertEqual(json.loads(response.data), {'success': True, 'data': self.rows})
+        self.assertEqual(int(response.headers['Content-Length']), len(response.data))
+        self.assertEqual(response.headers['ETag'], '"v1"')
+        self.assertTrue(upstream.closed)
+
+    def test_encoded_body_has_no_length(self):
+        """Test Content-Length isn't forwarded when requests decodes the body"""
+        upstream = FakeUpstream(self.body, {'Content-Length': '10', 'Content-Encoding': 'gzip'})
+        response = self.get(lambda: passthrough_response(upstream))
+
+        self.assertNotIn('Content-Length', response.headers)
+        self.assertEqual(json.loads(response.data)['data'], self.rows)
+
+    def test_on_complete_gets_body(self):
+        """Test the complete body is handed over once streamed, and serves the same response"""
+        cached = []
+        response = self.get(lambda: passthrough_response(FakeUpstream(self.body), cached.append))
+        self.assertEqual(json.loads(response.data)['data'], self.rows)
+        self.assertEqual(b''.join(cached[0]), self.body)
+
+        with self.app.test_request_context():
+            replay = body_response(b''.join(cached[0]))
+        self.assertEqual(b''.join(replay.response), response.data)
+
+    def test_max_buffer(self):
+        """Test a body over max_buffer is still sent whole but not handed to on_complete"""
+        cached = []
+        response = self.get(lambda: passthrough_response(FakeUpstream(self.body), cached.append, len(self.body) - 1))
+        self.assertEqual(json.loads(response.data)['data'], self.rows)
+        self.assertEqual(cached, [])
+
+        # Exactly at the limit is still kept
+        cached_at_limit = []
+        with self.app.test_request_context():
+            body = b''.join(passthrough_response(FakeUpstream(self.body), cached_at_limit.append, len(self.body)).response)
+        self.assertEqual(json.loads(body)['data'], self.rows)
+        self.assertEqual(b''.join(cached_at_limit[0]), self.body)
+
+    def test_empty_body(self):
+        """Test an empty upstream body still produces valid JSON"""
+        response = self.get(lambda: passthrough_response(FakeUpstream(b'')))
+        self.assertEqual(json.loads(response.data), {'success': True, 'data': []})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from unittest.mock import patch
+from flask import Flask, jsonify
+from utils.metrics import init_metrics, track_supabase_call
+from utils.profiling import ProfilerMiddleware, Sampler
+from utils.validators import INTERVIEW_FORM_SCHEMA
+
+def busy(seconds):
+    # Sleeping releases the GIL without leaving a frame to sample, so spin instead
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        for name, value in (('PROFILE_DIR', self.directory.name), ('PROFILE_INTERVAL', 0.001),
+                            ('PROFILE_SAMPLE_RATE', 0), ('PROFILE_FORMAT', 'speedscope')):
+            patcher = patch(f'utils.profiling.config.{name}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.app = Flask(__name__)
+        init_metrics(self.app)
+        self.app.wsgi_app = ProfilerMiddleware(self.app.wsgi_app)
+
+        @self.app.route('/slow')
+        def slow():
+            with track_supabase_call('interviews', 'GET'):
+                busy(0.05)
+            with track_supabase_call('demo_requests', 'GET'):
+                busy(0.03)
+            INTERVIEW_FORM_SCHEMA.validate({'candidateName': 'Ada'})
+            return jsonify({'success': True})
+
+        self.client = self.app.test_client()
+
+    def test_header_triggers_profile(self):
+        """Test a request with the header gets a speedscope file with each Supabase call on its own"""
+        response = self.client.get('/slow', headers={'X-Profile': '1'})
+        # The profile is written once the server closes the response, as a WSGI server would
+        response.close()
+        self.assertEqual(response.status_code, 200)
+        filename = response.headers['X-Profile']
+        self.assertEqual(os.listdir(self.directory.name), [filename])
+
+        with open(os.path.join(self.directory.name, filename)) as profile_file:
+            profile = json.load(profile_file)
+        roots = {profile['shared']['frames'][sample[0]]['name'] for sample in profile['profiles'][0]['samples']}
+        self.assertIn('supabase GET interviews #1', roots)
+        self.assertIn('supabase GET demo_requests #2', roots)
+        self.assertGreater(sum(profile['profiles'][0]['weights']), 0.05)
+
+    def test_unprofiled_requests(self):
+        """Test requests without the header or a sample rate are left alone"""
+        response = self.client.get('/slow')
+        response.close()
+        self.assertNotIn('X-Profile', response.headers)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_collapsed_format(self):
+        """Test collapsed stacks are written one weighted stack per line, rooted at the phase"""
+        with patch('utils.profiling.config.PROFILE_FORMAT', 'collapsed'):
+            response = self.client.get('/slow', headers={'X-Profile': 'true'})
+            response.close()
+
+        with open(os.path.join(self.directory.name, response.headers['X-Profile'])) as profile_file:
+            lines = profile_file.read().splitlines()
+        phases = {line.split(';', 1)[0] for line in lines}
+        self.assertIn('supabase GET interviews #1', phases)
+        self.assertTrue(all(line.rsplit(' ', 1)[1].isdigit() for line in lines))
+
+    def test_sampler_phases(self):
+        """Test samples outside any Supabase call are put down to our own code"""
+        sampler = Sampler(threading.get_ident(), 0.001)
+        sampler.start()
+        busy(0.03)
+        sampler.stop()
+        self.assertIn('view', sampler.phases())
+
+if __name__ == '__main__':
+    unittest.main()
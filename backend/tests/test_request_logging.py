@@ -0,0 +1,77 @@
+import unittest
+import logging
+import sys
+import os
+
+from flask import Flask
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils import request_logging
+from utils.request_logging import truncate, init_request_logging, RequestContextFilter
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.addFilter(RequestContextFilter())
+
+    def emit(self, record):
+        self.records.append(record)
+
+class TestRequestLogging(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        init_request_logging(self.app)
+        self.handler = ListHandler()
+        self.logger = logging.getLogger('test_request_logging')
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(logging.INFO)
+        self.sample_rate = request_logging.config.LOG_SAMPLE_RATE
+
+        @self.app.route('/ping')
+        def ping():
+            self.logger.info("handling ping")
+            self.logger.warning("ping warning")
+            return 'pong'
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        request_logging.config.LOG_SAMPLE_RATE = self.sample_rate
+
+    def test_truncate(self):
+        """Test long values are cut when formatted"""
+        self.assertEqual(str(truncate('short', limit=10)), 'short')
+        self.assertEqual(str(truncate('x' * 20, limit=10)), 'xxxxxxxxxx... (20 chars)')
+
+    def test_request_id_round_trip(self):
+        """Test the caller's request id is echoed and attached to records"""
+        response = self.app.test_client().get('/ping', headers={'X-Request-ID': 'abc123'})
+        self.assertEqual(response.headers['X-Request-ID'], 'abc123')
+        self.assertEqual({record.request_id for record in self.handler.records}, {'abc123'})
+
+    def test_request_id_generated(self):
+        """Test a request id is generated when none is sent"""
+        response = self.app.test_client().get('/ping')
+        self.assertTrue(response.headers['X-Request-ID'])
+
+    def test_unsampled_request_keeps_warnings(self):
+        """Test unsampled requests drop INFO records but keep warnings"""
+        request_logging.config.LOG_SAMPLE_RATE = 0
+        self.app.test_client().get('/ping')
+        self.assertEqual([record.levelno for record in self.handler.records], [logging.WARNING])
+
+    def test_app_loads_one_copy(self):
+        """Test the app factory doesn't load backend.-prefixed duplicates of its modules"""
+        from app import create_app
+        from utils import async_supabase
+        create_app()
+        duplicates = [name for name in sys.modules if name.startswith(('backend.utils', 'backend.services', 'backend.routes'))]
+        self.assertEqual(duplicates, [])
+        # The id the async client carries onto its loop is the one the log filter reads
+        self.assertIs(async_supabase.request_id_var, request_logging.request_id_var)
+
+if __name__ == '__main__':
+    unittest.main()
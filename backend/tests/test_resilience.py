@@ -0,0 +1,158 @@
+import unittest
+import sys
+import os
+import threading
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+import requests
+from utils.resilience import CircuitBreaker, RetryBudget, ResilientClient, CircuitOpenError, backoff_delay
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+class FakeSession:
+    """Answers with the queued outcomes in turn, an exception instance is raised"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, kwargs))
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_and_probes(self):
+        """Test the circuit opens at the threshold and lets a single probe through after the reset"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.record_failure())
+        self.assertFalse(breaker.allow())
+
+        clock.now = 10
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow())
+
+    def test_failed_probe_reopens(self):
+        """Test a failed probe opens the circuit again"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(threshold=1, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.record_failure())
+        self.assertFalse(breaker.allow())
+
+class TestRetryBudget(unittest.TestCase):
+    def test_ratio_and_window(self):
+        """Test retries are capped at the ratio of recent requests and recover once the window passes"""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.1, min_per_second=0, window=10, clock=clock)
+        for _ in range(20):
+            budget.record_request()
+        self.assertTrue(budget.try_retry())
+        self.assertTrue(budget.try_retry())
+        self.assertFalse(budget.try_retry())
+
+        clock.now = 11
+        for _ in range(10):
+            budget.record_request()
+        self.assertTrue(budget.try_retry())
+        self.assertFalse(budget.try_retry())
+
+    def test_backoff_is_capped(self):
+        """Test the backoff grows exponentially up to the cap"""
+        self.assertEqual(backoff_delay(0, 0.1, 2, rng=lambda: 1), 0.1)
+        self.assertEqual(backoff_delay(3, 0.1, 2, rng=lambda: 1), 0.8)
+        self.assertEqual(backoff_delay(10, 0.1, 2, rng=lambda: 1), 2)
+
+class TestResilientClient(unittest.TestCase):
+    def make_client(self, session, **kwargs):
+        self.sleeps = []
+        budget = RetryBudget(ratio=1, min_per_second=10, clock=FakeClock())
+        return ResilientClient(session, budget=budget, sleep=self.sleeps.append, clock=FakeClock(), **kwargs)
+
+    def test_retries_idempotent_calls(self):
+        """Test a GET is retried through a 503 and a timeout with a timeout on every attempt"""
+        session = FakeSession(503, requests.exceptions.ReadTimeout(), 200)
+        client = self.make_client(session, retries=2, hedge_delay=0)
+        response = client.request('GET', 'https://example.test', 'interviews')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertTrue(all(call[1]['timeout'] for call in session.calls))
+
+    def test_writes_not_retried(self):
+        """Test a POST that may have reached the server is not sent again"""
+        session = FakeSession(requests.exceptions.ReadTimeout(), 201)
+        client = self.make_client(session, retries=2, hedge_delay=0)
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            client.request('POST', 'https://example.test', 'interviews')
+        self.assertEqual(len(session.calls), 1)
+
+    def test_open_circuit_fails_fast(self):
+        """Test calls stop reaching the upstream once its circuit opens, per endpoint"""
+        session = FakeSession(503)
+        client = self.make_client(session, retries=0, hedge_delay=0)
+        for _ in range(5):
+            client.request('GET', 'https://example.test', 'interviews')
+
+        with self.assertRaises(CircuitOpenError):
+            client.request('GET', 'https://example.test', 'interviews')
+        self.assertEqual(len(session.calls), 5)
+
+        client.request('GET', 'https://example.test', 'demo_requests')
+        self.assertEqual(len(session.calls), 6)
+
+    def test_hedged_get(self):
+        """Test a slow GET is hedged and the faster copy wins"""
+        release = threading.Event()
+
+        class SlowFirstSession(FakeSession):
+            def request(self, method, url, **kwargs):
+                self.calls.append((method, kwargs))
+                if len(self.calls) == 1:
+                    release.wait(5)
+                    return FakeResponse(500)
+                return FakeResponse(200)
+
+        session = SlowFirstSession()
+        client = self.make_client(session, retries=0, hedge_delay=0.01)
+        try:
+            response = client.request('GET', 'https://example.test', 'interviews')
+        finally:
+            release.set()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(session.calls), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import sys
+import os
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from utils.scheduler import SlotFinder, parse_window, fit_mask, span_mask
+
+def epoch(value):
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+
+# 2030-01-03 is a Thursday
+THURSDAY = date(2030, 1, 3)
+
+INTERVIEWERS = [
+    {
+        'name': 'Alice',
+        'availability': {'thursday': ['14:00-17:00'], 'friday': ['09:00-10:00']},
+        'max_interviews_per_day': 2
+    },
+    {
+        'name': 'Bob',
+        'availability': {'Thursday': ['13:00-14:00', '15:30-16:30']},
+        'max_interviews_per_day': 4,
+        'role': 'Designer'
+    }
+]
+
+class TestScheduler(unittest.TestCase):
+    def test_parse_window(self):
+        """Test availability windows map to whole slots"""
+        self.assertEqual(parse_window('09:00-12:00', 15), (36, 48))
+        self.assertEqual(parse_window('09:10-10:00', 15), (37, 40))
+        self.assertEqual(parse_window('22:00-24:00', 30), (44, 48))
+        with self.assertRaises(ValueError):
+            parse_window('12:00-09:00', 15)
+
+    def test_fit_mask(self):
+        """Test runs of free slots are found for any length"""
+        free = span_mask(2, 7) | span_mask(10, 12)
+        self.assertEqual(fit_mask(free, 1), free)
+        self.assertEqual(fit_mask(free, 2), span_mask(2, 6) | span_mask(10, 11))
+        self.assertEqual(fit_mask(free, 5), span_mask(2, 3))
+        self.assertEqual(fit_mask(free, 6), 0)
+
+    def test_earliest_slots_across_interviewers(self):
+        """Test slots from every interviewer are merged by start time"""
+        finder = SlotFinder(INTERVIEWERS, slot_minutes=30)
+        slots = finder.suggest(60, THURSDAY, THURSDAY, lambda start, end: {}, limit=4)
+        self.assertEqual(
+            [(slot['interviewer'], slot['time']) for slot in slots],
+            [('Bob', '13:00'), ('Alice', '14:00'), ('Alice', '14:30'), ('Alice', '15:00')]
+        )
+        self.assertEqual(slots[0]['end'], '2030-01-03T14:00:00+00:00')
+
+    def test_bookings_and_job_role(self):
+        """Test booked slots are skipped and interviewers are filtered by job role"""
+        finder = SlotFinder(INTERVIEWERS, slot_minutes=30)
+        bookings = {'Alice': [(epoch('2030-01-03T14:30:00'), epoch('2030-01-03T15:30:00'))]}
+        slots = finder.suggest(60, THURSDAY, THURSDAY, lambda start, end: bookings, job_role='Engineer')
+        self.assertEqual([slot['time'] for slot in slots], ['15:30', '16:00'])
+        self.assertTrue(all(slot['interviewer'] == 'Alice' for slot in slots))
+
+    def test_daily_cap(self):
+        """Test interviewers at max_interviews_per_day are skipped for that day"""
+        finder = SlotFinder(INTERVIEWERS, slot_minutes=30)
+        bookings = {'Alice': [
+            (epoch('2030-01-03T08:00:00'), epoch('2030-01-03T08:30:00')),
+            (epoch('2030-01-03T09:00:00'), epoch('2030-01-03T09:30:00'))
+        ]}
+        slots = finder.suggest(30, THURSDAY, date(2030, 1, 4), lambda start, end: bookings, names={'Alice'})
+        self.assertEqual([slot['date'] for slot in slots], ['2030-01-04', '2030-01-04'])
+
+    def test_skips_past_slots(self):
+        """Test slots earlier than now are not offered"""
+        finder = SlotFinder(INTERVIEWERS, slot_minutes=30)
+        now = datetime(2030, 1, 3, 15, 10)
+        slots = finder.suggest(60, THURSDAY, THURSDAY, lambda start, end: {}, names={'Alice'}, now=now)
+        self.assertEqual([slot['time'] for slot in slots], ['15:30', '16:00'])
+
+    def test_timezone(self):
+        """Test days, bookings and now are read in the requested zone and times carry its offset"""
+        finder = SlotFinder(INTERVIEWERS, slot_minutes=30)
+        tokyo = ZoneInfo('Asia/Tokyo')
+        # It is already 15:10 in Tokyo, and 07:00 UTC is 16:00 there
+        bookings = {'Alice': [(epoch('2030-01-03T07:00:00'), epoch('2030-01-03T07:30:00'))]}
+        slots = finder.suggest(
+            30, THURSDAY, THURSDAY, lambda start, end: bookings, names={'Alice'},
+            now=datetime(2030, 1, 3, 6, 10, tzinfo=timezone.utc), tz=tokyo
+        )
+        self.assertEqual([slot['time'] for slot in slots], ['15:30', '16:30'])
+        self.assertEqual(slots[0]['start'], '2030-01-03T15:30:00+09:00')
+
+        # A 30 minute interview booked across the end of DST, 01:30 EDT to 01:00 EST, ends at 01:00
+        new_york = ZoneInfo('America/New_York')
+        finder = SlotFinder([{'name': 'Night', 'availability': {'sunday': ['01:00-02:00']}}], slot_minutes=30)
+        slots = finder.suggest(30, date(2030, 11, 3), date(2030, 11, 3), lambda start, end: {}, tz=new_york)
+        self.assertEqual(slots[1]['start'], '2030-11-03T01:30:00-04:00')
+        self.assertEqual(slots[1]['end'], '2030-11-03T01:00:00-05:00')
+
+    def test_role_matches_interviewer_rows(self):
+        """Test jobRole is matched against the role column of real interviewer rows"""
+        row = {
+            'id': '7', 'name': 'John Smith', 'email': 'john.smith@example.com', 'phone': '+1234567890',
+            'role': 'Technical Lead', 'availability': {'thursday': ['09:00-10:00']}, 'max_interviews_per_day': 4
+        }
+        finder = SlotFinder([row], slot_minutes=30)
+        self.assertEqual(len(finder.suggest(30, THURSDAY, THURSDAY, lambda start, end: {}, job_role='technical lead')), 2)
+        self.assertEqual(finder.suggest(30, THURSDAY, THURSDAY, lambda start, end: {}, job_role='Designer'), [])
+
+    def test_malformed_interviewer_is_ignored(self):
+        """Test a bad availability window doesn't break the search"""
+        finder = SlotFinder(INTERVIEWERS + [{'name': 'Eve', 'availability': {'monday': ['nope']}}])
+        self.assertEqual(len(finder.interviewers), 2)
+
+if __name__ == '__main__':
+    unittest.main()
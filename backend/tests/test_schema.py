@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+from datetime import date
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from utils.schema import Schema, Field, error_message
+from utils.validators import (
+    INTERVIEW_FORM_SCHEMA, DEMO_REQUEST_SCHEMA, DEMO_REQUEST_FORM_SCHEMA, SUGGEST_SLOTS_SCHEMA, validate_email
+)
+
+VALID_INTERVIEW = {
+    'candidateName': 'Jane Doe',
+    'interviewer': 'John Smith',
+    'date': '2099-01-01',
+    'time': '10:00',
+    'duration': '45',
+    'format': 'Video',
+    'jobRole': 'Engineer'
+}
+
+class TestSchema(unittest.TestCase):
+    def test_collects_every_error(self):
+        """Test all errors are reported in one pass"""
+        values, errors = INTERVIEW_FORM_SCHEMA.validate({'date': '2099-13-01', 'time': '25:00', 'duration': 'x'})
+        self.assertIn("Missing required field: candidateName", errors)
+        self.assertIn("Invalid date format. Use YYYY-MM-DD", errors)
+        self.assertIn("Invalid time format. Use HH:MM (24-hour format)", errors)
+        self.assertIn("Duration must be a valid number", errors)
+        self.assertEqual(len(errors), 7)
+
+    def test_converts_values(self):
+        """Test coerced values are returned"""
+        values, errors = INTERVIEW_FORM_SCHEMA.validate(VALID_INTERVIEW)
+        self.assertEqual(errors, [])
+        self.assertEqual(values['duration'], 45)
+
+        values, errors = SUGGEST_SLOTS_SCHEMA.validate({'duration': 30, 'dateFrom': '2030-01-01', 'dateTo': '2030-01-02'})
+        self.assertEqual(errors, [])
+        self.assertEqual(values['dateFrom'], date(2030, 1, 1))
+
+    def test_checks_after_coerce(self):
+        """Test checks see the converted value"""
+        _, errors = INTERVIEW_FORM_SCHEMA.validate(dict(VALID_INTERVIEW, duration='0'))
+        self.assertEqual(errors, ["Duration must be a positive number"])
+
+    def test_optional_fields_and_partial(self):
+        """Test optional fields are only checked when present and partial skips required"""
+        _, errors = DEMO_REQUEST_SCHEMA.validate({'work_email': 'a@b.co', 'phone_number': None}, partial=True)
+        self.assertEqual(errors, [])
+
+        _, errors = DEMO_REQUEST_SCHEMA.validate({
+            'first_name': 'A', 'last_name': 'B', 'work_email': 'nope',
+            'phone_number': '123', 'service_interest': 'Other'
+        })
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(error_message(errors[:1]), "Invalid email format")
+
+    def test_terms_must_be_accepted(self):
+        """Test agrees_to_terms has to be true, not just present"""
+        body = {'first_name': 'A', 'last_name': 'B', 'work_email': 'a@b.co'}
+        for refused in (False, 0):
+            _, errors = DEMO_REQUEST_FORM_SCHEMA.validate(dict(body, agrees_to_terms=refused))
+            self.assertEqual(errors, ["Missing required field: agrees_to_terms"])
+
+        values, errors = DEMO_REQUEST_FORM_SCHEMA.validate(dict(body, agrees_to_terms=True))
+        self.assertEqual(errors, [])
+        self.assertIs(values['agrees_to_terms'], True)
+
+    def test_rejects_non_object(self):
+        """Test a body that isn't an object is rejected"""
+        _, errors = Schema(Field('a', required=True)).validate(['a'])
+        self.assertEqual(errors, ["Request body must be a JSON object"])
+
+    def test_pattern_requires_string(self):
+        """Test patterns reject non-string values instead of raising"""
+        _, errors = DEMO_REQUEST_SCHEMA.validate({'work_email': 42}, partial=True)
+        self.assertEqual(errors, ["Invalid email format"])
+        self.assertEqual(validate_email(None), (False, "Invalid email format"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from utils.snapshot import SnapshotCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestSnapshotCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'snapshots.sqlite3')
+        self.clock = FakeClock()
+        self.rows = [{'id': 1, 'first_name': 'Ada'}]
+        self.calls = 0
+        self.fail = False
+        self.refreshed = threading.Event()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def loader(self, key):
+        self.calls += 1
+        try:
+            if self.fail:
+                raise RuntimeError("Supabase returned 401")
+            return list(self.rows)
+        finally:
+            self.refreshed.set()
+
+    def make_cache(self):
+        return SnapshotCache(self.loader, path=self.path, ttl=30, clock=self.clock)
+
+    def wait_for_refresh(self, cache):
+        self.assertTrue(self.refreshed.wait(5))
+        cache._executor.shutdown(wait=True)
+        cache._executor = None
+
+    def test_fresh_snapshot_served_from_memory(self):
+        """Test a fresh snapshot is served without calling the upstream again"""
+        cache = self.make_cache()
+        self.assertEqual(cache.get('demo_requests').value, self.rows)
+        self.clock.now += 10
+        self.assertEqual(cache.get('demo_requests').age(self.clock()), 10)
+        self.assertEqual(self.calls, 1)
+
+    def test_stale_served_while_refreshing(self):
+        """Test a stale snapshot is returned at once and replaced by the background refresh"""
+        cache = self.make_cache()
+        cache.get('demo_requests')
+        self.rows.append({'id': 2, 'first_name': 'Grace'})
+        self.clock.now += 31
+        self.refreshed.clear()
+
+        self.assertEqual(len(cache.get('demo_requests').value), 1)
+        self.wait_for_refresh(cache)
+        self.assertEqual(len(cache.get('demo_requests').value), 2)
+
+    def test_failed_refresh_keeps_last_good(self):
+        """Test an upstream failure keeps serving the last good rows instead of fake ones"""
+        cache = self.make_cache()
+        cache.get('demo_requests')
+        self.fail = True
+        self.clock.now += 31
+        self.refreshed.clear()
+
+        cache.get('demo_requests')
+        self.wait_for_refresh(cache)
+        snapshot = cache.get('demo_requests')
+        self.assertEqual(snapshot.value, self.rows)
+        self.assertEqual(snapshot.age(self.clock()), 31)
+
+    def test_survives_restart(self):
+        """Test a new process starts from the stored snapshot when the upstream is down"""
+        self.make_cache().get('demo_requests')
+        self.fail = True
+
+        restarted = self.make_cache()
+        self.assertEqual(restarted.get('demo_requests').value, self.rows)
+        self.assertEqual(self.calls, 1)
+
+    def test_cold_start_failure(self):
+        """Test there is no snapshot when the very first fetch fails"""
+        self.fail = True
+        self.assertIsNone(self.make_cache().get('demo_requests'))
+
+    def test_invalidate(self):
+        """Test an invalidated snapshot is still served but refreshed, also by processes starting from disk"""
+        cache = self.make_cache()
+        cache.get('demo_requests')
+        self.refreshed.clear()
+
+        cache.invalidate('demo_requests')
+        self.assertEqual(cache.get('demo_requests').value, self.rows)
+        self.wait_for_refresh(cache)
+        self.assertEqual(self.calls, 2)
+
+        cache.invalidate('demo_requests')
+        self.refreshed.clear()
+        restarted = self.make_cache()
+        self.assertEqual(restarted.get('demo_requests').value, self.rows)
+        self.wait_for_refresh(restarted)
+        self.assertEqual(self.calls, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import io
+import sys
+import os
+
+import requests
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils import storage
+from utils.storage import upload_file_stream
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+class FakeSession:
+    """Records uploads and reads request bodies the way http.client does"""
+
+    def __init__(self, fail_patch_at=None):
+        self.calls = []
+        self.received = b''
+        self.fail_patch_at = fail_patch_at
+
+    def _read_body(self, data):
+        body = b''
+        if hasattr(data, 'read'):
+            while True:
+                block = data.read(8192)
+                if not block:
+                    break
+                body += block
+        else:
+            for block in data:
+                body += block
+        return body
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        self.calls.append(('POST', url, headers))
+        if url.endswith('/upload/resumable'):
+            return FakeResponse(201, {'Location': '/storage/v1/upload/resumable/abc'})
+        self.received = self._read_body(data)
+        return FakeResponse(200)
+
+    def patch(self, url, headers=None, data=None, **kwargs):
+        self.calls.append(('PATCH', url, headers))
+        offset = int(headers['Upload-Offset'])
+        if self.fail_patch_at == offset:
+            self.fail_patch_at = None
+            # Keep half of the part before failing
+            part = self._read_body(data)
+            self.received += part[:len(part) // 2]
+            raise requests.ConnectionError('connection reset')
+        self.received += self._read_body(data)
+        return FakeResponse(204, {'Upload-Offset': str(len(self.received))})
+
+    def head(self, url, headers=None, **kwargs):
+        self.calls.append(('HEAD', url, headers))
+        return FakeResponse(200, {'Upload-Offset': str(len(self.received))})
+
+class FakeFile:
+    def __init__(self, data, content_type='application/pdf'):
+        self.stream = io.BytesIO(data)
+        self.content_type = content_type
+
+class TestStorageUpload(unittest.TestCase):
+    def setUp(self):
+        self.config = storage.config
+        self.saved = (self.config.STORAGE_CHUNK_SIZE, self.config.STORAGE_RESUMABLE_THRESHOLD, self.config.STORAGE_READ_SIZE)
+        self.config.STORAGE_CHUNK_SIZE = 1000
+        self.config.STORAGE_RESUMABLE_THRESHOLD = 1500
+        self.config.STORAGE_READ_SIZE = 256
+
+    def tearDown(self):
+        (self.config.STORAGE_CHUNK_SIZE, self.config.STORAGE_RESUMABLE_THRESHOLD, self.config.STORAGE_READ_SIZE) = self.saved
+
+    def test_small_file_single_post(self):
+        """Test small files are streamed in one POST"""
+        data = os.urandom(1200)
+        session = FakeSession()
+        url = upload_file_stream(FakeFile(data), 'resumes/a.pdf', 'https://x.co', 'key', bucket='docs', session=session)
+
+        self.assertEqual(url, 'https://x.co/storage/v1/object/public/docs/resumes/a.pdf')
+        self.assertEqual(session.received, data)
+        self.assertEqual(len(session.calls), 1)
+        self.assertEqual(session.calls[0][2]['Content-Type'], 'application/pdf')
+
+    def test_large_file_resumable(self):
+        """Test large files are sent as resumable parts"""
+        data = os.urandom(3500)
+        session = FakeSession()
+        upload_file_stream(FakeFile(data), 'resumes/b.pdf', 'https://x.co', 'key', session=session)
+
+        methods = [call[0] for call in session.calls]
+        self.assertEqual(methods, ['POST', 'PATCH', 'PATCH', 'PATCH', 'PATCH'])
+        self.assertEqual(session.calls[1][1], 'https://x.co/storage/v1/upload/resumable/abc')
+        self.assertEqual(session.calls[0][2]['Upload-Length'], '3500')
+        self.assertEqual(session.received, data)
+
+    def test_resume_after_failed_part(self):
+        """Test a failed part resumes from the acknowledged offset"""
+        data = os.urandom(2500)
+        session = FakeSession(fail_patch_at=1000)
+        upload_file_stream(FakeFile(data), 'resumes/c.pdf', 'https://x.co', 'key', session=session)
+
+        self.assertIn('HEAD', [call[0] for call in session.calls])
+        self.assertEqual(session.received, data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import sys
+import os
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# The app's modules import each other from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from unittest.mock import patch
+from services.interviews import update_interview
+
+class TestUpdateInterview(unittest.TestCase):
+    def test_date_and_time_update(self):
+        """Test an update with a new date and time is validated and sent on"""
+        row = {'id': '1', 'interview_date': '2099-01-02', 'interview_time': '11:30'}
+        with patch('services.interviews.supabase_request', return_value={'status_code': 200, 'data': [row]}) as request:
+            data, status_code, _ = update_interview('1', {'interview_date': '2099-01-02', 'interview_time': '11:30'})
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data, row)
+        self.assertEqual(request.call_args[1]['data'], {'interview_date': '2099-01-02', 'interview_time': '11:30'})
+
+    def test_invalid_date(self):
+        """Test a bad date is a 400 and never reaches Supabase"""
+        with patch('services.interviews.supabase_request') as request:
+            data, status_code, message = update_interview('1', {'interview_date': '01/02/2099'})
+        self.assertEqual(status_code, 400)
+        self.assertEqual(message, "Invalid date format. Use YYYY-MM-DD")
+        request.assert_not_called()
+
+        with patch('services.interviews.supabase_request') as request:
+            _, status_code, _ = update_interview('1', ['not', 'an', 'object'])
+        self.assertEqual(status_code, 400)
+        request.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils.upload_queue import UploadQueue, RESUME_PENDING, RESUME_FAILED, upload_status
+
+class FakeFile:
+    def __init__(self, data):
+        self.stream = io.BytesIO(data)
+        self.filename = 'resume.pdf'
+        self.content_type = 'application/pdf'
+
+class TestUploadQueue(unittest.TestCase):
+    def setUp(self):
+        self.spool_dir = tempfile.mkdtemp()
+        self.uploaded = []
+        self.patched = []
+        self.failed = []
+        self.failures = 0
+
+    def upload(self, file, candidate_name):
+        if self.failures:
+            self.failures -= 1
+            raise IOError('storage unavailable')
+        self.uploaded.append((file.stream.read(), candidate_name))
+        return f'https://x.co/{candidate_name}.pdf'
+
+    def complete(self, interview_id, url):
+        self.patched.append((interview_id, url))
+        return True
+
+    def fail(self, interview_id, error):
+        self.failed.append((interview_id, error))
+
+    def wait(self, queue, job_id):
+        for _ in range(200):
+            job = queue.status(job_id)
+            if job['status'] in ('completed', 'failed'):
+                return job
+            time.sleep(0.01)
+        self.fail('Upload job did not finish')
+
+    def test_upload_and_patch(self):
+        """Test a spooled file is uploaded and the row patched"""
+        queue = UploadQueue(self.upload, self.complete, spool_dir=self.spool_dir, workers=1, retries=0)
+        spooled = queue.spool(FakeFile(b'resume bytes'))
+        job = self.wait(queue, queue.submit(spooled, 'abc', 'Jane'))
+
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual(self.uploaded, [(b'resume bytes', 'Jane')])
+        self.assertEqual(self.patched, [('abc', 'https://x.co/Jane.pdf')])
+        self.assertFalse(os.listdir(self.spool_dir))
+
+    def test_retry_then_succeed(self):
+        """Test failed attempts are retried"""
+        self.failures = 2
+        queue = UploadQueue(self.upload, self.complete, spool_dir=self.spool_dir, workers=1, retries=2, backoff=0)
+        job = self.wait(queue, queue.submit(queue.spool(FakeFile(b'x')), 'abc', 'Jane'))
+
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual(job['attempts'], 3)
+
+    def test_give_up_after_retries(self):
+        """Test the job is marked failed once retries run out"""
+        self.failures = 5
+        queue = UploadQueue(
+            self.upload, self.complete, self.fail, spool_dir=self.spool_dir, workers=1, retries=1, backoff=0
+        )
+        job = self.wait(queue, queue.submit(queue.spool(FakeFile(b'x')), 'abc', 'Jane'))
+
+        self.assertEqual(job['status'], 'failed')
+        self.assertIn('storage unavailable', job['error'])
+        self.assertFalse(self.patched)
+        self.assertEqual(self.failed, [('abc', job['error'])])
+        self.assertFalse(os.listdir(self.spool_dir))
+
+    def test_lazy_start(self):
+        """Test the pool and spool directory only appear once a file is queued, under the given job id"""
+        spool_dir = os.path.join(self.spool_dir, 'spool')
+        queue = UploadQueue(self.upload, self.complete, spool_dir=spool_dir, workers=1, retries=0)
+        self.assertIsNone(queue._executor)
+        self.assertFalse(os.path.exists(spool_dir))
+
+        job = self.wait(queue, queue.submit(queue.spool(FakeFile(b'x')), 'abc', 'Jane', job_id='abc'))
+        self.assertEqual(job['job_id'], 'abc')
+        self.assertIsNotNone(queue._executor)
+
+    def test_upload_status(self):
+        """Test the row's resume_url gives the job status"""
+        self.assertEqual(upload_status(RESUME_PENDING), 'pending')
+        self.assertEqual(upload_status(RESUME_FAILED), 'failed')
+        self.assertEqual(upload_status('https://x.co/Jane.pdf'), 'completed')
+        self.assertIsNone(upload_status(None))
+
+if __name__ == '__main__':
+    unittest.main()
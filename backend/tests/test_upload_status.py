@@ -0,0 +1,130 @@
+import unittest
+import io
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+# server.py imports its helpers from the backend directory
+backend_root = os.path.join(project_root, 'backend')
+if backend_root not in sys.path:
+    sys.path.insert(0, backend_root)
+
+from unittest.mock import patch
+from backend.tests.fake_supabase import FakeSupabase
+import server
+
+FORM = {
+    'candidateName': 'Ada', 'interviewer': 'Grace', 'date': '2099-01-01', 'time': '10:00',
+    'duration': '60', 'format': 'Video', 'jobRole': 'Engineer', 'asyncUpload': 'true'
+}
+
+class TestUploadStatus(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fake = FakeSupabase()
+        cls.url = cls.fake.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fake.stop()
+
+    def setUp(self):
+        self.fake.reset()
+        self.started = threading.Event()
+        self.released = threading.Event()
+        self.addCleanup(self.released.set)
+        self.resume_url = 'https://x.co/Ada.pdf'
+        spool = tempfile.TemporaryDirectory()
+        self.addCleanup(spool.cleanup)
+        for target, name, value in (
+            (server, 'SUPABASE_URL', self.url), (server, 'SUPABASE_KEY', 'fake'),
+            (server.upload_queue, 'upload', self.upload), (server.upload_queue, 'retries', 0),
+            (server.config, 'CONFLICT_MODE', 'off'), (server.upload_queue, 'spool_dir', spool.name)
+        ):
+            patcher = patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = server.app.test_client()
+
+    def upload(self, file, candidate_name):
+        self.started.set()
+        self.released.wait(5)
+        return self.resume_url
+
+    def create(self):
+        response = self.client.post('/api/interviews', data=dict(
+            FORM, resume=(io.BytesIO(b'%PDF'), 'resume.pdf', 'application/pdf')
+        ), content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 201)
+        return response.get_json()['upload_job_id']
+
+    def status(self, job_id, forget=True):
+        if forget:
+            # As seen from a worker that didn't run the upload
+            server.upload_queue.jobs.clear()
+        return self.client.get(f'/api/uploads/{job_id}').get_json()['data']
+
+    def wait_for_row(self, resume_url):
+        for _ in range(200):
+            if self.fake.tables['interviews'][0]['resume_url'] == resume_url:
+                return
+            time.sleep(0.01)
+        self.fail('Resume upload did not finish')
+
+    def test_pending_then_completed(self):
+        """Test the row is marked pending at insert and any worker reads the outcome from it"""
+        job_id = self.create()
+        self.assertEqual(self.fake.tables['interviews'][0]['resume_url'], server.RESUME_PENDING)
+        self.assertTrue(self.started.wait(5))
+        self.assertEqual(self.status(job_id)['status'], 'pending')
+
+        self.released.set()
+        self.wait_for_row(self.resume_url)
+        job = self.status(job_id)
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual(job['resume_url'], self.resume_url)
+
+    def test_failed(self):
+        """Test an upload that gives up leaves the row marked failed"""
+        self.resume_url = None
+        self.released.set()
+        job_id = self.create()
+        self.wait_for_row(server.RESUME_FAILED)
+        # The worker that ran it also knows why
+        self.assertEqual(self.status(job_id, forget=False)['error'], "Failed to upload resume file")
+        self.assertEqual(self.status(job_id)['status'], 'failed')
+
+    def test_interrupted(self):
+        """Test a row left pending by a worker that went away is reported, and marked, failed"""
+        self.fake.insert('interviews', [
+            {'candidate_name': 'Ada', 'resume_url': server.RESUME_PENDING, 'updated_at': '2000-01-01T00:00:00+00:00'},
+            {'candidate_name': 'Linus', 'resume_url': server.RESUME_PENDING}
+        ])
+        stale, fresh = (str(row['id']) for row in self.fake.tables['interviews'])
+        self.assertEqual(self.status(stale)['status'], 'failed')
+        self.assertEqual(self.fake.tables['interviews'][0]['resume_url'], server.RESUME_FAILED)
+        # One that may still be uploading on another worker is left alone
+        self.assertEqual(self.status(fresh)['status'], 'pending')
+
+    def test_error_removes_spooled_file(self):
+        """Test a create that fails after spooling doesn't leave the file on disk"""
+        with patch.object(server, 'commit_slot', side_effect=RuntimeError('boom')):
+            response = self.client.post('/api/interviews', data=dict(
+                FORM, resume=(io.BytesIO(b'%PDF'), 'resume.pdf', 'application/pdf')
+            ), content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(os.listdir(server.upload_queue.spool_dir), [])
+
+    def test_unknown_job(self):
+        """Test a job id that isn't an interview with a resume is a 404"""
+        response = self.client.get('/api/uploads/00000000-0000-0000-0000-000000000000')
+        self.assertEqual(response.status_code, 404)
+
+if __name__ == '__main__':
+    unittest.main()
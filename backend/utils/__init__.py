@@ -1,9 +1,13 @@
 from .supabase import supabase_request, upload_file_to_supabase
+from .async_supabase import AsyncSupabaseClient, supabase_request_sync, supabase_request_many
 from .validators import validate_date, validate_time
 
 __all__ = [
     'supabase_request',
     'upload_file_to_supabase',
+    'AsyncSupabaseClient',
+    'supabase_request_sync',
+    'supabase_request_many',
     'validate_date',
     'validate_time'
 ]
@@ -0,0 +1,129 @@
+import heapq
+
+import numpy as np
+
+def skill_bitsets(members, skill_index):
+    """
+    Pack each member's skills into a row of 64-bit words
+
+    Args:
+        members: List of skill id collections, one per row
+        skill_index: Skill id -> bit position
+
+    Returns:
+        numpy.ndarray: uint64 array of shape (len(members), words)
+    """
+    words = max(1, -(-len(skill_index) // 64))
+    bits = np.zeros((len(members), words), dtype=np.uint64)
+
+    rows = []
+    positions = []
+    for row, skills in enumerate(members):
+        for skill in skills:
+            position = skill_index.get(skill)
+            if position is not None:
+                rows.append(row)
+                positions.append(position)
+
+    if rows:
+        positions = np.asarray(positions, dtype=np.uint64)
+        np.bitwise_or.at(
+            bits,
+            (np.asarray(rows, dtype=np.intp), (positions // np.uint64(64)).astype(np.intp)),
+            np.left_shift(np.uint64(1), positions % np.uint64(64))
+        )
+    return bits
+
+def skill_overlap(role_bits, interviewer_bits):
+    """
+    Number of each role's skills every interviewer has
+
+    Returns:
+        numpy.ndarray: int array of shape (roles, interviewers)
+    """
+    return np.bitwise_count(role_bits[:, None, :] & interviewer_bits[None, :, :]).sum(axis=2, dtype=np.int64)
+
+def assign_interviewers(applications, role_skills, interviewer_skills, interviewers, load=None, max_per_interviewer=None):
+    """
+    Assign an interviewer to every application, covering the role's skills and balancing load
+
+    Skills are packed into bitsets so the role x interviewer match matrix is
+    computed in one vectorized pass. An interviewer is eligible for a role
+    when they have all of its skills; when nobody does, the interviewers
+    with the largest overlap are used instead. Roles with the fewest
+    eligible interviewers are filled first, and each application goes to
+    the eligible interviewer with the lowest load.
+
+    Args:
+        applications: Application rows with application_id and role_id
+        role_skills: Role id -> collection of skill ids
+        interviewer_skills: Interviewer id -> collection of skill ids
+        interviewers: Interviewer ids that can be assigned
+        load: Interviewer id -> interviews already assigned
+        max_per_interviewer: Maximum total load per interviewer
+
+    Returns:
+        list: One dict per application, in input order, with interviewer_id
+        (None when nobody could take it), skill_coverage and full_coverage
+    """
+    interviewers = list(dict.fromkeys(interviewers))
+    roles = list(dict.fromkeys(application['role_id'] for application in applications))
+
+    skill_index = {}
+    for skills in list(role_skills.values()) + list(interviewer_skills.values()):
+        for skill in skills:
+            skill_index.setdefault(skill, len(skill_index))
+
+    role_bits = skill_bitsets([role_skills.get(role, ()) for role in roles], skill_index)
+    interviewer_bits = skill_bitsets([interviewer_skills.get(user, ()) for user in interviewers], skill_index)
+
+    required = np.bitwise_count(role_bits).sum(axis=1, dtype=np.int64)
+    overlap = skill_overlap(role_bits, interviewer_bits)
+
+    # Best match per role: full coverage if anyone has it, otherwise the largest partial overlap
+    best = overlap.max(axis=1) if interviewers else np.zeros(len(roles), dtype=np.int64)
+    eligible = (overlap == best[:, None]) & ((best > 0) | (required == 0))[:, None]
+
+    loads = np.array([(load or {}).get(user, 0) for user in interviewers], dtype=np.int64)
+    cap = max_per_interviewer if max_per_interviewer is not None else np.iinfo(np.int64).max
+
+    by_role = {}
+    for position, application in enumerate(applications):
+        by_role.setdefault(application['role_id'], []).append(position)
+
+    results = [None] * len(applications)
+    role_positions = {role: index for index, role in enumerate(roles)}
+
+    # Most constrained roles first so they aren't starved by flexible ones
+    for role in sorted(by_role, key=lambda role: int(eligible[role_positions[role]].sum())):
+        index = role_positions[role]
+        candidates = np.flatnonzero(eligible[index] & (loads < cap))
+        coverage = float(best[index] / required[index]) if required[index] else 1.0
+        heap = [(int(loads[candidate]), int(candidate)) for candidate in candidates]
+        heapq.heapify(heap)
+
+        for position in by_role[role]:
+            application = applications[position]
+            result = {
+                'application_id': application.get('application_id'),
+                'candidate_id': application.get('candidate_id'),
+                'role_id': role,
+                'interviewer_id': None,
+                'skill_coverage': coverage,
+                'full_coverage': bool(best[index] == required[index])
+            }
+
+            if heap:
+                assigned_load, candidate = heapq.heappop(heap)
+                loads[candidate] = assigned_load + 1
+                if assigned_load + 1 < cap:
+                    heapq.heappush(heap, (assigned_load + 1, candidate))
+                result['interviewer_id'] = interviewers[candidate]
+            elif not eligible[index].any():
+                result['reason'] = "No interviewer has any of the role's skills"
+            else:
+                result['reason'] = "Every matching interviewer is at capacity"
+
+            results[position] = result
+
+    return results
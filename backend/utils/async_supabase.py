@@ -0,0 +1,192 @@
+import asyncio
+import functools
+import logging
+import threading
+import traceback
+
+import httpx
+from config import config
+from .supabase import supabase_client, build_headers, build_response, client as resilient_client
+from .request_logging import request_id_var, sampled_var, truncate
+from .metrics import track_supabase_call, table_name
+from .resilience import CircuitOpenError
+from .fast_json import dumps
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class AsyncSupabaseClient:
+    """
+    Asyncio client for the Supabase REST API
+
+    Keeps a single pool of keep-alive HTTP/1.1 connections that every
+    request shares, so one process can hold many PostgREST calls in flight
+    without a blocked thread per call. Calls go through the same timeouts,
+    retries, circuit breakers and hedging as supabase_request.
+
+    Args:
+        url: Supabase project URL
+        key: Supabase API key
+        pool_size: Maximum number of open connections
+        timeout: Default per-request timeout in seconds
+        transport: Optional httpx transport (used by tests)
+        resilient: ResilientClient to send through, by default the one supabase_request shares
+    """
+
+    def __init__(self, url, key, pool_size=None, timeout=None, transport=None, resilient=None):
+        self.url = url.rstrip('/')
+        self.key = key
+        self.pool_size = pool_size or config.SUPABASE_POOL_SIZE
+        self.timeout = timeout or config.SUPABASE_TIMEOUT
+        self._transport = transport
+        self.resilient = resilient or resilient_client
+        self._client = None
+
+    def _get_client(self):
+        # The httpx client binds to the running loop, so create it on first use
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=f"{self.url}/rest/v1/",
+                headers=build_headers(self.key),
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size
+                ),
+                timeout=self.timeout,
+                transport=self._transport,
+                verify=False
+            )
+        return self._client
+
+    async def request(self, endpoint, method='GET', data=None, params=None, timeout=None, prefer=None, count=None):
+        """
+        Make a request to Supabase
+
+        Returns the same dict as supabase_request.
+        """
+        try:
+            client = self._get_client()
+            logger.info("Async Supabase request: %s %s", method, endpoint)
+
+            send = functools.partial(
+                client.request,
+                method,
+                endpoint.lstrip('/'),
+                content=dumps(data) if data is not None else None,
+                params=params,
+                headers=build_headers(self.key, prefer=prefer, count=count),
+                timeout=timeout or self.timeout
+            )
+            response = await self.resilient.request_async(send, method, table_name(endpoint))
+
+            logger.info("Async Supabase response: %s %s -> %s", method, endpoint, response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Async Supabase response body: %s", truncate(response.text))
+            return build_response(response)
+
+        except CircuitOpenError as e:
+            # Fail fast while Supabase recovers
+            logger.warning("Async Supabase request skipped: %s %s: %s", method, endpoint, e)
+            return {
+                'status_code': 503,
+                'error': str(e)
+            }
+        except Exception as e:
+            logger.error("Async Supabase request failed: %s %s: %s", method, endpoint, e)
+            logger.debug("Async Supabase request data=%s\n%s", truncate(data), traceback.format_exc())
+            return {
+                'status_code': 500,
+                'error': str(e)
+            }
+
+    async def request_many(self, calls):
+        """
+        Run several requests concurrently
+
+        Args:
+            calls: List of dicts with supabase_request keyword arguments
+
+        Returns:
+            list: Results in the same order as calls
+        """
+        return await asyncio.gather(*(self._tracked_request(call) for call in calls))
+
+    async def _tracked_request(self, call):
+        with track_supabase_call(call['endpoint'], call.get('method', 'GET')) as tracked:
+            result = await self.request(**call)
+            tracked.status = result.get('status_code')
+        return result
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+# Background event loop used by the sync shim
+_loop = None
+_loop_lock = threading.Lock()
+_client = None
+
+def _get_loop():
+    global _loop, _client
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, name='supabase-async', daemon=True)
+            thread.start()
+            _client = AsyncSupabaseClient(supabase_client['url'], supabase_client['key'])
+    return _loop
+
+async def _in_request_context(coro, request_id, sampled):
+    # Tasks on the loop thread don't inherit the caller's context, carry the log fields over
+    request_id_var.set(request_id)
+    sampled_var.set(sampled)
+    return await coro
+
+def _run(coro, timeout):
+    coro = _in_request_context(coro, request_id_var.get(), sampled_var.get())
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    # Every attempt gets the full timeout and a backoff before it, and the
+    # client's own timeout is left a moment to fire first
+    attempts = _client.resilient.retries + 1
+    try:
+        return future.result(attempts * (timeout + config.SUPABASE_BACKOFF_MAX) + 1)
+    except Exception as e:
+        future.cancel()
+        logger.error("Async Supabase request did not complete: %s", e)
+        return {
+            'status_code': 504,
+            'error': str(e) or 'Supabase request timed out'
+        }
+
+def supabase_request_sync(endpoint, method='GET', data=None, params=None, timeout=None, prefer=None, count=None):
+    """
+    Blocking wrapper around the shared async client
+
+    Drop-in replacement for supabase_request that Flask routes can call.
+    """
+    timeout = timeout or config.SUPABASE_TIMEOUT
+    _get_loop()
+    coro = _client.request(endpoint, method=method, data=data, params=params, timeout=timeout, prefer=prefer, count=count)
+    return _run(coro, timeout)
+
+def supabase_request_many(calls, timeout=None):
+    """
+    Blocking wrapper that runs several requests concurrently on the shared client
+
+    Args:
+        calls: List of dicts with supabase_request keyword arguments
+        timeout: Overall timeout in seconds
+
+    Returns:
+        list: Results in the same order as calls
+    """
+    timeout = timeout or config.SUPABASE_TIMEOUT
+    _get_loop()
+    calls = [dict(call, timeout=call.get('timeout', timeout)) for call in calls]
+    result = _run(_client.request_many(calls), timeout)
+    if isinstance(result, dict):
+        # The whole batch timed out
+        return [result for _ in calls]
+    return result
@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL
+
+    Args:
+        maxsize: Maximum number of entries kept before the least recently used is evicted
+        ttl: Seconds an entry stays valid
+        clock: Time source, overridable for tests
+    """
+
+    def __init__(self, maxsize=256, ttl=10, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every removal, so a load that started before one can be told apart
+        self.generation = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation=None):
+        """
+        Store value, unless generation is given and an invalidation happened since
+
+        Returns:
+            bool: Whether the value was stored
+        """
+        with self._lock:
+            # The value was loaded before a write invalidated the cache, it may be stale
+            if generation is not None and generation != self.generation:
+                return False
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return True
+
+    def pop(self, key):
+        with self._lock:
+            self.generation += 1
+            entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def invalidate(self, predicate):
+        """Drop every entry whose key matches predicate"""
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+class InterviewCache:
+    """
+    Read-through cache for interview list and detail queries
+
+    List results are keyed on the normalized filter set (including any
+    pagination parameters), detail results on the interview id. Writes call
+    invalidate() with the row they touched.
+    """
+
+    def __init__(self, maxsize=256, ttl=10, clock=time.monotonic):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl, clock=clock)
+
+    @classmethod
+    def list_key(cls, filters=None):
+        """Build a cache key that ignores empty filters and argument order"""
+        filters = filters or {}
+        return ('list',) + tuple(
+            (field, str(filters[field]))
+            for field in sorted(filters)
+            if filters[field] not in (None, '')
+        )
+
+    @staticmethod
+    def detail_key(interview_id):
+        return ('detail', str(interview_id))
+
+    def get_list(self, filters, loader, cacheable=None):
+        return self._get_or_load(self.list_key(filters), loader, cacheable)
+
+    def get_detail(self, interview_id, loader, cacheable=None):
+        return self._get_or_load(self.detail_key(interview_id), loader, cacheable)
+
+    def peek_list(self, filters):
+        """
+        Cached list result for callers that fill the cache themselves
+
+        Returns:
+            tuple: (value or None on a miss, generation to pass to set_list)
+        """
+        generation = self._cache.generation
+        return self._cache.get(self.list_key(filters)), generation
+
+    def set_list(self, filters, value, generation):
+        """Store a list result loaded after peek_list, dropped if a write happened meanwhile"""
+        return self._cache.set(self.list_key(filters), value, generation=generation)
+
+    def _get_or_load(self, key, loader, cacheable):
+        # Read the generation before loading, a write during the load makes the result stale
+        generation = self._cache.generation
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+
+        value = loader()
+        if cacheable is None or cacheable(value):
+            self._cache.set(key, value, generation=generation)
+        return value
+
+    def invalidate(self, interview_id=None, row=None):
+        """
+        Drop cached results affected by a write
+
+        Args:
+            interview_id: Id of the updated or deleted interview
+            row: New row values. Without them (updates and deletes, where the
+                previous values are unknown) every list entry is dropped.
+        """
+        if interview_id is not None:
+            self._cache.pop(self.detail_key(interview_id))
+
+        if row is None or interview_id is not None:
+            self._cache.invalidate(lambda key: key[0] == 'list')
+        else:
+            self._cache.invalidate(lambda key: key[0] == 'list' and self._matches(dict(key[1:]), row))
+
+    def clear(self):
+        self._cache.clear()
+
+    @staticmethod
+    def _matches(filters, row):
+        """Check whether a row could appear in a list query with these filters"""
+        scheduled_at = str(row.get('scheduled_at') or '')
+
+        if 'status' in filters and filters['status'] != row.get('status'):
+            return False
+        if 'interviewer' in filters and filters['interviewer'] != row.get('interviewer_name'):
+            return False
+        # ISO timestamps in the same format compare correctly as strings
+        if 'date_start' in filters and scheduled_at and scheduled_at < filters['date_start']:
+            return False
+        if 'date_end' in filters and scheduled_at and scheduled_at[:len(filters['date_end'])] > filters['date_end']:
+            return False
+        return True
@@ -0,0 +1,101 @@
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+from flask import request
+from config import config
+
+# Bodies worth compressing, images and archives are already compressed
+COMPRESSIBLE_TYPES = (
+    'application/json', 'application/x-ndjson', 'application/javascript',
+    'text/csv', 'text/html', 'text/plain', 'text/css'
+)
+
+def supported_encodings():
+    """Encodings this process can produce, in order of preference"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+def compress(data, encoding):
+    """Compress a whole body with the configured level"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=config.COMPRESSION_BROTLI_LEVEL)
+    return gzip.compress(data, compresslevel=config.COMPRESSION_GZIP_LEVEL)
+
+def compress_chunks(chunks, encoding):
+    """
+    Compress a streamed body incrementally
+
+    Output is only yielded once the compressor has a block ready, so small
+    chunks like NDJSON rows still compress as well as a whole body would.
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config.COMPRESSION_BROTLI_LEVEL)
+        process, finish = compressor.process, compressor.finish
+    else:
+        # wbits 16+ writes the gzip header and trailer around the deflate stream
+        compressor = zlib.compressobj(config.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        process, finish = compressor.compress, compressor.flush
+
+    for chunk in chunks:
+        block = process(chunk)
+        if block:
+            yield block
+    yield finish()
+
+def _compressible(response):
+    if response.direct_passthrough or 'Content-Encoding' in response.headers:
+        return False
+    if response.status_code < 200 or response.status_code in (204, 304):
+        return False
+    return response.mimetype in COMPRESSIBLE_TYPES
+
+def compress_response(response):
+    """
+    Compress a response for the encodings the client accepts
+
+    Bodies under COMPRESSION_MIN_SIZE are sent as is, the framing costs
+    more than it saves. Tagged responses get a weak ETag for the
+    compressed bytes, If-None-Match compares weakly so 304s still work.
+    """
+    if not _compressible(response):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(supported_encodings())
+    if encoding is None or request.method == 'HEAD':
+        return response
+
+    if response.is_streamed:
+        length = response.headers.get('Content-Length')
+        if length is not None and int(length) < config.COMPRESSION_MIN_SIZE:
+            return response
+        original = response.response
+        response.response = compress_chunks(response.iter_encoded(), encoding)
+        # Keep the original iterable's cleanup, e.g. closing an upstream connection
+        if hasattr(original, 'close'):
+            response.call_on_close(original.close)
+        del response.headers['Content-Length']
+    else:
+        data = response.get_data()
+        if len(data) < config.COMPRESSION_MIN_SIZE:
+            return response
+        response.set_data(compress(data, encoding))
+
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+def init_compression(app):
+    """Compress responses with brotli or gzip, as negotiated through Accept-Encoding"""
+    if not config.COMPRESSION_ENABLED:
+        return
+
+    @app.after_request
+    def compress_after_request(response):
+        return compress_response(response)
@@ -0,0 +1,405 @@
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from config import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Interviews in these states don't hold their slot
+INACTIVE_STATUSES = {'cancelled', 'canceled', 'completed'}
+
+class _Node:
+    __slots__ = ('key', 'end', 'value', 'priority', 'max_end', 'left', 'right')
+
+    def __init__(self, key, end, value):
+        self.key = key
+        self.end = end
+        self.value = value
+        self.priority = random.random()
+        self.max_end = end
+        self.left = None
+        self.right = None
+
+    def update(self):
+        self.max_end = max(
+            self.end,
+            self.left.max_end if self.left else self.end,
+            self.right.max_end if self.right else self.end
+        )
+
+class IntervalTree:
+    """
+    Half-open [start, end) intervals in a treap ordered by start
+
+    Every node also keeps the largest end in its subtree, so an overlap
+    lookup only walks one root-to-leaf path: O(log n) expected for insert,
+    remove and overlap.
+    """
+
+    def __init__(self):
+        self._root = None
+        self._seq = itertools.count()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, start, end, value):
+        """
+        Add an interval
+
+        Returns:
+            Handle to pass to remove()
+        """
+        key = (start, next(self._seq))
+        self._root = self._insert(self._root, _Node(key, end, value))
+        self._size += 1
+        return key
+
+    def remove(self, handle):
+        self._root, removed = self._remove(self._root, handle)
+        if removed:
+            self._size -= 1
+        return removed
+
+    def overlap(self, start, end):
+        """Value of any interval overlapping [start, end), or None"""
+        node = self._root
+        while node is not None:
+            if node.key[0] < end and start < node.end:
+                return node.value
+            # Anything in the left subtree that ends after start may overlap, and
+            # if none of it does, nothing to the right (starting later) can either
+            if node.left is not None and node.left.max_end > start:
+                node = node.left
+            else:
+                node = node.right
+        return None
+
+    def search(self, start, end):
+        """(start, end, value) of every interval overlapping [start, end), ordered by start"""
+        found = []
+        self._search(self._root, start, end, found)
+        return found
+
+    def _search(self, node, start, end, found):
+        # Nothing below a node ends after start once max_end <= start
+        if node is None or node.max_end <= start:
+            return
+        self._search(node.left, start, end, found)
+        if node.key[0] < end:
+            if start < node.end:
+                found.append((node.key[0], node.end, node.value))
+            self._search(node.right, start, end, found)
+
+    def _insert(self, node, new):
+        if node is None:
+            return new
+        if new.key < node.key:
+            node.left = self._insert(node.left, new)
+            if node.left.priority > node.priority:
+                node = self._rotate_right(node)
+        else:
+            node.right = self._insert(node.right, new)
+            if node.right.priority > node.priority:
+                node = self._rotate_left(node)
+        node.update()
+        return node
+
+    def _remove(self, node, key):
+        if node is None:
+            return None, False
+        if key < node.key:
+            node.left, removed = self._remove(node.left, key)
+        elif key > node.key:
+            node.right, removed = self._remove(node.right, key)
+        else:
+            return self._merge(node.left, node.right), True
+        node.update()
+        return node, removed
+
+    def _merge(self, left, right):
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        right.left = self._merge(left, right.left)
+        right.update()
+        return right
+
+    @staticmethod
+    def _rotate_right(node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        node.update()
+        pivot.update()
+        return pivot
+
+    @staticmethod
+    def _rotate_left(node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        node.update()
+        pivot.update()
+        return pivot
+
+def interview_span(row):
+    """
+    (start, end) of an interview row in epoch seconds, or None if the row doesn't hold a slot
+
+    Naive timestamps are taken as UTC, which is how the API writes them.
+    """
+    if str(row.get('status') or '').lower() in INACTIVE_STATUSES:
+        return None
+    try:
+        start = datetime.fromisoformat(row['scheduled_at'])
+        duration = int(row['duration_minutes'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start.timestamp(), (start + timedelta(minutes=duration)).timestamp()
+
+class Reservation:
+    """A slot held in the index while its write is in flight"""
+
+    __slots__ = ('interviewer', 'span', 'interview_id', 'handle', 'replaced')
+
+    def __init__(self, interviewer, span, interview_id=None):
+        self.interviewer = interviewer
+        self.span = span
+        self.interview_id = interview_id
+        self.handle = None
+        # (interviewer, span) of the row an update is moving, restored on release
+        self.replaced = None
+
+class ConflictIndex:
+    """
+    In-process index of booked slots, one interval tree per interviewer
+
+    Built from the interviews table on first use and rebuilt in the
+    background every CONFLICT_INDEX_TTL seconds to pick up writes made by
+    other processes. The loader runs outside the index lock, so bookings
+    aren't held up behind a reload.
+    Writes from this process update it directly: reserve() checks for an
+    overlap and holds the slot, then commit() or release() once Supabase
+    has answered, so two concurrent bookings can't both pass the check.
+
+    Args:
+        loader: Callable returning all interview rows, or None if they couldn't be read
+        ttl: Seconds before the index is rebuilt
+        clock: Monotonic time source (used by tests)
+    """
+
+    def __init__(self, loader, ttl=None, clock=time.monotonic):
+        self.loader = loader
+        self.ttl = config.CONFLICT_INDEX_TTL if ttl is None else ttl
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._trees = {}
+        self._entries = {}
+        self._pending = set()
+        self._loaded_at = None
+        # Serializes loads, and the first load makes callers wait for it
+        self._load_lock = threading.Lock()
+        # Writes made while a load is running, replayed over its rows
+        self._journal = None
+        self._refreshing = False
+        self._executor = None
+
+    def load(self, rows):
+        """Replace the index with the given rows, keeping in-flight reservations"""
+        with self._lock:
+            self._trees = {}
+            self._entries = {}
+            for row in rows:
+                self._add(row.get('id'), row)
+
+            for reservation in self._pending:
+                # An update in flight still hides the row it is moving
+                if reservation.interview_id is not None:
+                    self._remove(reservation.interview_id)
+                if reservation.span is not None and reservation.interviewer:
+                    reservation.handle = self._tree(reservation.interviewer).insert(*reservation.span, reservation)
+            self._loaded_at = self.clock()
+
+    def reserve(self, row, interview_id=None, reject=True):
+        """
+        Check a booking for overlaps and hold its slot
+
+        Args:
+            row: Interview row with interviewer_name, scheduled_at and duration_minutes
+            interview_id: Id of the interview being updated, its current slot is ignored
+            reject: Don't hold the slot when it overlaps
+
+        Returns:
+            tuple: (reservation, conflict) where conflict is the id of an
+            overlapping interview ('pending' for a booking still being
+            written) or None. reservation is None only when rejected.
+        """
+        loaded = self._ensure_loaded()
+        with self._lock:
+            interviewer = row.get('interviewer_name')
+            span = interview_span(row)
+
+            if interview_id is not None:
+                interview_id = str(interview_id)
+            reservation = Reservation(interviewer, span, interview_id)
+            if interview_id is not None:
+                replaced = self._remove(interview_id)
+                if replaced:
+                    reservation.replaced = replaced[0], replaced[2]
+
+            if not loaded or span is None or not interviewer:
+                # Nothing to check against, or the booking holds no slot
+                self._pending.add(reservation)
+                return reservation, None
+
+            conflict = self._tree(interviewer).overlap(*span)
+            if isinstance(conflict, Reservation):
+                conflict = conflict.interview_id if conflict.interview_id is not None else 'pending'
+
+            if conflict is not None and reject:
+                self._restore(reservation)
+                return None, conflict
+
+            reservation.handle = self._tree(interviewer).insert(*span, reservation)
+            self._pending.add(reservation)
+            return reservation, conflict
+
+    def booked(self, start, end):
+        """
+        Booked and reserved slots overlapping [start, end)
+
+        Returns:
+            dict: interviewer name -> list of (start, end) in epoch seconds
+        """
+        self._ensure_loaded()
+        with self._lock:
+            booked = {}
+            for interviewer, tree in self._trees.items():
+                spans = [(s, e) for s, e, _ in tree.search(start, end)]
+                if spans:
+                    booked[interviewer] = spans
+            return booked
+
+    def commit(self, reservation, row):
+        """Replace a reservation with the row Supabase stored"""
+        with self._lock:
+            self._drop(reservation)
+            interview_id = row.get('id', reservation.interview_id)
+            if interview_id is not None:
+                self._remove(str(interview_id))
+                self._add(interview_id, row)
+                self._record(str(interview_id), row)
+
+    def release(self, reservation):
+        """Give up a reservation whose write failed"""
+        with self._lock:
+            self._drop(reservation)
+            self._restore(reservation)
+
+    def discard(self, interview_id):
+        """Forget a deleted interview"""
+        with self._lock:
+            self._remove(str(interview_id))
+            self._record(str(interview_id), None)
+
+    def refresh(self):
+        """Rebuild the index from the loader now, returning False if it failed"""
+        with self._load_lock:
+            with self._lock:
+                self._journal = []
+            # Supabase is read without the index lock, bookings carry on meanwhile
+            rows = self.loader()
+            with self._lock:
+                journal, self._journal = self._journal, None
+                if rows is None:
+                    logger.warning("Could not load interviews for conflict checks")
+                    return False
+                self.load(rows)
+                # The rows may predate writes this process made while they loaded
+                for interview_id, row in journal:
+                    self._remove(interview_id)
+                    if row is not None:
+                        self._add(interview_id, row)
+                logger.info("Conflict index loaded with %s interviews", len(self._entries))
+                return True
+
+    def _ensure_loaded(self):
+        if self._loaded_at is None:
+            # Cold start, there is nothing to check against until the first load
+            with self._load_lock:
+                if self._loaded_at is not None:
+                    return True
+            return self.refresh()
+        if self.clock() - self._loaded_at >= self.ttl:
+            self._refresh_later()
+        return True
+
+    def _refresh_later(self):
+        with self._lock:
+            # One reload at a time, however many bookings see the index stale
+            if self._refreshing:
+                return
+            self._refreshing = True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='conflict-refresh')
+        self._executor.submit(self._run_refresh)
+
+    def _run_refresh(self):
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _record(self, interview_id, row):
+        if self._journal is not None:
+            self._journal.append((interview_id, row))
+
+    def _tree(self, interviewer):
+        tree = self._trees.get(interviewer)
+        if tree is None:
+            tree = self._trees[interviewer] = IntervalTree()
+        return tree
+
+    def _add(self, interview_id, row):
+        span = interview_span(row)
+        interviewer = row.get('interviewer_name')
+        if span is None or not interviewer or interview_id is None:
+            return
+        self._insert(str(interview_id), interviewer, span)
+
+    def _insert(self, interview_id, interviewer, span):
+        handle = self._tree(interviewer).insert(*span, interview_id)
+        self._entries[interview_id] = (interviewer, handle, span)
+
+    def _remove(self, interview_id):
+        entry = self._entries.pop(interview_id, None)
+        if entry:
+            interviewer, handle, _ = entry
+            self._trees[interviewer].remove(handle)
+        return entry
+
+    def _drop(self, reservation):
+        self._pending.discard(reservation)
+        if reservation.handle is not None:
+            self._trees[reservation.interviewer].remove(reservation.handle)
+            reservation.handle = None
+
+    def _restore(self, reservation):
+        if reservation.replaced and reservation.interview_id not in self._entries:
+            self._insert(reservation.interview_id, *reservation.replaced)
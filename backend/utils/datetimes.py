@@ -0,0 +1,105 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+from datetime import time as time_of_day
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from config import config
+
+DATE_ERROR = "Invalid date format. Use YYYY-MM-DD"
+TIME_ERROR = "Invalid time format. Use HH:MM (24-hour format)"
+TIMEZONE_ERROR = "Unknown timezone. Use an IANA name like Europe/London"
+
+def resolve_timezone(name=None):
+    """
+    tzinfo for an IANA timezone name, DEFAULT_TIMEZONE when no name is given
+
+    Raises:
+        ValueError: If the name isn't a string naming a known timezone
+    """
+    name = name or config.DEFAULT_TIMEZONE
+    # Checked before the cache, which raises TypeError on unhashable JSON values
+    if not isinstance(name, str):
+        raise ValueError(TIMEZONE_ERROR)
+    return _resolve_timezone(name)
+
+@lru_cache(maxsize=256)
+def _resolve_timezone(name):
+    if name.upper() in ('UTC', 'Z'):
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, TypeError):
+        raise ValueError(TIMEZONE_ERROR)
+
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    """
+    Parse a YYYY-MM-DD date
+
+    Cached, bulk imports repeat the same few dates many times over.
+
+    Raises:
+        ValueError: If the value isn't a valid YYYY-MM-DD date
+    """
+    # fromisoformat also takes YYYYMMDD and week dates, keep the API to one form
+    if not isinstance(value, str) or len(value) != 10 or value[4] != '-' or value[7] != '-':
+        raise ValueError(DATE_ERROR)
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(DATE_ERROR)
+
+@lru_cache(maxsize=4096)
+def parse_time(value):
+    """
+    Parse an HH:MM time, H:MM is accepted as strptime did
+
+    Raises:
+        ValueError: If the value isn't a valid 24-hour time
+    """
+    if not isinstance(value, str):
+        raise ValueError(TIME_ERROR)
+    hours, separator, minutes = value.partition(':')
+    if (
+        not separator or not 1 <= len(hours) <= 2 or not 1 <= len(minutes) <= 2
+        or not hours.isdigit() or not minutes.isdigit()
+        or not hours.isascii() or not minutes.isascii()
+    ):
+        raise ValueError(TIME_ERROR)
+    try:
+        return time_of_day(int(hours), int(minutes))
+    except ValueError:
+        raise ValueError(TIME_ERROR)
+
+# tz -> (today, epoch second at which it stops being today)
+_today_cache = {}
+
+def today(tz=None):
+    """
+    Current date in a timezone
+
+    The date is cached until the next local midnight, so most calls cost a
+    dict lookup and a time.time() instead of building a datetime.
+    """
+    tz = tz or resolve_timezone()
+    now = time.time()
+    cached = _today_cache.get(tz)
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
+    current = datetime.fromtimestamp(now, tz)
+    midnight = datetime.combine(current.date() + timedelta(days=1), time_of_day(), tzinfo=tz)
+    _today_cache[tz] = (current.date(), midnight.timestamp())
+    return current.date()
+
+def to_utc(day, clock, tz=None):
+    """Combine a local date and time in tz into an aware UTC datetime"""
+    local = datetime.combine(day, clock, tzinfo=tz or resolve_timezone())
+    return local.astimezone(timezone.utc)
+
+def check_not_past(day, tz=None):
+    """Error message if day is before today in tz, else None"""
+    if day < today(tz):
+        return "Date must be in the future"
+    return None
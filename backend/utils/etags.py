@@ -0,0 +1,40 @@
+from functools import wraps
+
+from flask import current_app, request
+from werkzeug.http import generate_etag, quote_etag
+
+def etag_for(body):
+    """Strong ETag header value for a response body"""
+    return quote_etag(generate_etag(body))
+
+def make_conditional(response):
+    """
+    Tag a successful GET response and turn it into a 304 when the client's copy is current
+
+    Responses that already carry an ETag (forwarded from Supabase or
+    computed when their body was cached) keep it, so a cache hit doesn't
+    hash the body again. Streamed responses without one go out untagged.
+    """
+    if request.method not in ('GET', 'HEAD') or response.status_code != 200:
+        return response
+
+    if 'ETag' not in response.headers and not response.is_streamed:
+        response.add_etag()
+    if 'ETag' in response.headers:
+        # Let browsers keep the body but revalidate on every poll
+        response.headers.setdefault('Cache-Control', 'no-cache')
+    return response.make_conditional(request)
+
+def conditional(view):
+    """
+    Answer If-None-Match requests to a read endpoint with 304 Not Modified
+
+    The tables have no row version column (created_at and a count miss
+    updates), so tags are digests of the response body. That still saves
+    the transfer and the client-side re-render on unchanged polls.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        return make_conditional(current_app.make_response(view(*args, **kwargs)))
+    return wrapper
@@ -0,0 +1,74 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+from flask.json import JSONEncoder as FlaskJSONEncoder, JSONDecoder as FlaskJSONDecoder
+
+# Datetimes go through default() so responses keep Flask's HTTP-date format
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+def dumps(obj, default=None):
+    """
+    Serialize to JSON bytes, with orjson when it is installed
+
+    Args:
+        obj: Value to serialize
+        default: Called for values JSON can't represent, e.g. str
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Out of range integers and other edge cases orjson refuses
+            pass
+    return json.dumps(obj, default=default, separators=(',', ':')).encode()
+
+def loads(data):
+    """Parse JSON from bytes or str, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class JSONEncoder(FlaskJSONEncoder):
+    """
+    Flask JSON encoder that serializes with orjson
+
+    Flask still calls json.dumps(cls=app.json_encoder), which hands the work
+    to encode(), so every jsonify() goes through orjson. Unsupported values
+    fall back to Flask's default() and then to the stdlib encoder.
+    """
+
+    def encode(self, o):
+        if orjson is None:
+            return super().encode(o)
+
+        option = _ORJSON_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(o, default=self.default, option=option).decode()
+        except TypeError:
+            return super().encode(o)
+
+class JSONDecoder(FlaskJSONDecoder):
+    """Flask JSON decoder that parses request bodies with orjson"""
+
+    def decode(self, s):
+        if orjson is None:
+            return super().decode(s)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Let the stdlib produce its usual error (or accept NaN and friends)
+            return super().decode(s)
+
+def init_json(app):
+    """Serialize responses and parse request bodies with orjson when it is installed"""
+    if orjson is not None:
+        app.json_encoder = JSONEncoder
+        app.json_decoder = JSONDecoder
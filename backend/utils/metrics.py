@@ -0,0 +1,211 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, request, has_request_context
+from config import config
+from .profiling import section
+
+# Default latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in pairs
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(label, '')) for label in self.labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value):
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"]
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, description, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def _render_sample(self, key, value):
+        counts, total = value
+        lines = [
+            f"{self.name}_bucket{_format_labels(self.labels, key, ('le', _format_value(bound)))} {count}"
+            for bound, count in zip(self.buckets, counts)
+        ]
+        lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {total!r}")
+        lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {counts[-1]}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    'http_request_duration_seconds', 'Time spent handling a request', ('method', 'route', 'status')
+))
+SUPABASE_CALLS_PER_REQUEST = REGISTRY.register(Histogram(
+    'http_request_supabase_calls', 'Supabase calls made while handling a request', ('method', 'route'),
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100)
+))
+SUPABASE_REQUEST_DURATION = REGISTRY.register(Histogram(
+    'supabase_request_duration_seconds', 'Latency of Supabase calls', ('table', 'method')
+))
+SUPABASE_REQUESTS = REGISTRY.register(Counter(
+    'supabase_requests_total', 'Supabase calls by outcome', ('table', 'method', 'status')
+))
+SUPABASE_RESILIENCE = REGISTRY.register(Counter(
+    'supabase_resilience_events_total', 'Supabase retries, hedges and circuit breaker events', ('table', 'event')
+))
+SUPABASE_IN_FLIGHT = REGISTRY.register(Gauge(
+    'supabase_requests_in_flight', 'Supabase calls currently waiting on a response'
+))
+SUPABASE_POOL_SIZE = REGISTRY.register(Gauge(
+    'supabase_pool_size', 'Configured Supabase connection pool size'
+))
+SUPABASE_POOL_SIZE.set(config.SUPABASE_POOL_SIZE)
+
+def table_name(endpoint):
+    """Table (or storage) name of a Supabase endpoint, e.g. '/rest/v1/interviews?id=eq.1' -> 'interviews'"""
+    path = endpoint.split('?', 1)[0].strip('/')
+    if path.startswith('rest/v1/'):
+        path = path[len('rest/v1/'):]
+    elif path.startswith('storage/'):
+        return 'storage'
+    return path.split('/', 1)[0] or 'unknown'
+
+class SupabaseCall:
+    """Outcome of a tracked call, set status once the response arrives"""
+
+    __slots__ = ('status',)
+
+    def __init__(self):
+        self.status = None
+
+@contextmanager
+def track_supabase_call(endpoint, method):
+    """
+    Time a Supabase call and count it against the current request
+
+        with track_supabase_call('interviews', 'GET') as call:
+            response = ...
+            call.status = response.status_code
+    """
+    labels = {'table': table_name(endpoint), 'method': method}
+    call = SupabaseCall()
+    started = time.perf_counter()
+    SUPABASE_IN_FLIGHT.inc()
+
+    number = 0
+    if has_request_context():
+        number = g.supabase_calls = g.get('supabase_calls', 0) + 1
+
+    try:
+        # Profiles show every call of the request on its own
+        with section(f"supabase {method} {labels['table']} #{number}"):
+            yield call
+    except Exception:
+        call.status = 'error'
+        raise
+    finally:
+        SUPABASE_IN_FLIGHT.dec()
+        SUPABASE_REQUEST_DURATION.observe(time.perf_counter() - started, **labels)
+        status = call.status
+        if isinstance(status, int):
+            status = f"{status // 100}xx"
+        SUPABASE_REQUESTS.inc(status=status or 'error', **labels)
+
+def init_metrics(app):
+    """Record latency and upstream call counts for every request"""
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_started = time.perf_counter()
+        g.supabase_calls = 0
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.get('metrics_started')
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=request.method, route=route, status=response.status_code
+            )
+            SUPABASE_CALLS_PER_REQUEST.observe(g.get('supabase_calls', 0), method=request.method, route=route)
+        return response
@@ -0,0 +1,100 @@
+import base64
+import json
+
+# Columns of public.interviews that clients may project with fields=
+INTERVIEW_COLUMNS = (
+    'id', 'candidate_name', 'interviewer_name', 'scheduled_at', 'duration_minutes',
+    'format', 'job_role', 'status', 'feedback_submitted', 'resume_url',
+    'use_question_bank', 'created_at'
+)
+
+# Keyset columns, always selected so the next cursor can be built
+CURSOR_COLUMNS = ('scheduled_at', 'id')
+
+def parse_fields(fields, allowed=INTERVIEW_COLUMNS, required=CURSOR_COLUMNS):
+    """
+    Turn a comma-separated fields= value into a PostgREST select
+
+    Returns:
+        str: Select clause, '*' when no fields were requested
+
+    Raises:
+        ValueError: If an unknown column is requested
+    """
+    if not fields:
+        return '*'
+
+    columns = [column.strip() for column in fields.split(',') if column.strip()]
+    unknown = [column for column in columns if column not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    for column in required:
+        if column not in columns:
+            columns.append(column)
+    return ','.join(columns)
+
+def parse_limit(value, maximum):
+    """
+    Validate a limit= value
+
+    Returns:
+        int or None: Page size, None when no limit was requested
+
+    Raises:
+        ValueError: If the limit is not a positive integer
+    """
+    if value in (None, ''):
+        return None
+
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("Limit must be a valid number")
+
+    if limit <= 0:
+        raise ValueError("Limit must be a positive number")
+    return min(limit, maximum)
+
+def encode_cursor(row):
+    """Build an opaque cursor pointing just after row"""
+    payload = json.dumps([row['scheduled_at'], row['id']], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """
+    Read the (scheduled_at, id) pair back out of a cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        scheduled_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(scheduled_at), str(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def quote_value(value):
+    """
+    Double-quote a value for a PostgREST logic filter
+
+    Reserved characters like ',', '(' and ')' lose their meaning inside the
+    quotes, and backslashes and quotes in the value are escaped so a crafted
+    cursor can't close the quotes early.
+    """
+    escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+def keyset_filter(cursor):
+    """
+    PostgREST or= filter selecting rows after the cursor in (scheduled_at, id) order
+    """
+    scheduled_at, row_id = (quote_value(value) for value in decode_cursor(cursor))
+    return f'(scheduled_at.gt.{scheduled_at},and(scheduled_at.eq.{scheduled_at},id.gt.{row_id}))'
+
+def next_cursor(rows, limit):
+    """Cursor for the following page, None once the last page has been read"""
+    if not limit or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1])
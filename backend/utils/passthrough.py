@@ -0,0 +1,98 @@
+import logging
+
+from flask import Response
+
+logger = logging.getLogger(__name__)
+
+# Bytes written around the upstream JSON, same as jsonify({'success': True, 'data': ...})
+ENVELOPE_PREFIX = b'{"success":true,"data":'
+ENVELOPE_SUFFIX = b'}'
+
+# Upstream read size, requests' default of 1 byte would mean a generator step per byte
+CHUNK_SIZE = 64 * 1024
+
+def envelope_length(body_length):
+    """Content-Length of the envelope around a body of body_length bytes"""
+    return len(ENVELOPE_PREFIX) + body_length + len(ENVELOPE_SUFFIX)
+
+def wrap_chunks(chunks, on_complete=None, max_buffer=None):
+    """
+    Yield the success envelope around an upstream JSON body, chunk by chunk
+
+    The body is never parsed, so memory and CPU don't grow with the row
+    count. An empty body is sent as [] so the envelope stays valid JSON.
+
+    Args:
+        chunks: Iterable of body bytes
+        on_complete: Called with the list of body chunks once every chunk has
+            been sent, e.g. to cache the body. Not called if the client or
+            upstream goes away mid-stream.
+        max_buffer: Most body bytes held for on_complete. Past it the chunks
+            are let go as they're sent and on_complete isn't called.
+    """
+    seen = [] if on_complete is not None else None
+    buffered = 0
+    empty = True
+    yield ENVELOPE_PREFIX
+    for chunk in chunks:
+        if chunk:
+            empty = False
+            if seen is not None:
+                buffered += len(chunk)
+                if max_buffer is not None and buffered > max_buffer:
+                    seen = None
+                else:
+                    seen.append(chunk)
+            yield chunk
+    if empty:
+        yield b'[]'
+    yield ENVELOPE_SUFFIX
+
+    if seen is not None:
+        on_complete(seen)
+
+def _close_after(chunks, upstream):
+    try:
+        yield from chunks
+    except Exception as e:
+        # Headers are already out, all that's left is to cut the body short
+        logger.error(f"Upstream stream failed: {str(e)}")
+        raise
+    finally:
+        upstream.close()
+
+def passthrough_response(upstream, on_complete=None, max_buffer=None):
+    """
+    Stream a requests response opened with stream=True inside the success envelope
+
+    Content-Length is forwarded (grown by the envelope) when the upstream
+    body isn't content-encoded, since requests decodes gzip while reading
+    and the decoded length isn't known up front. ETag is forwarded as is:
+    the envelope is a fixed function of the body, so equal upstream tags
+    still mean equal bytes.
+
+    Args:
+        upstream: requests.Response with a successful status
+        on_complete: See wrap_chunks
+        max_buffer: See wrap_chunks
+    """
+    headers = {}
+    length = upstream.headers.get('Content-Length')
+    if length and length.isdigit() and int(length) > 0 and not upstream.headers.get('Content-Encoding'):
+        headers['Content-Length'] = str(envelope_length(int(length)))
+    if upstream.headers.get('ETag'):
+        headers['ETag'] = upstream.headers['ETag']
+
+    chunks = wrap_chunks(upstream.iter_content(chunk_size=CHUNK_SIZE), on_complete, max_buffer)
+    response = Response(_close_after(chunks, upstream), mimetype='application/json', headers=headers)
+    # A 304 never starts the generator, release the connection anyway
+    response.call_on_close(upstream.close)
+    return response
+
+def body_response(body, etag=None):
+    """Success envelope around a body already held in memory, without copying it"""
+    body = body or b'[]'
+    headers = {'Content-Length': str(envelope_length(len(body)))}
+    if etag:
+        headers['ETag'] = etag
+    return Response([ENVELOPE_PREFIX, body, ENVELOPE_SUFFIX], mimetype='application/json', headers=headers)
@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+
+from werkzeug.wsgi import ClosingIterator
+from config import config
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILER_FILE = os.path.abspath(__file__)
+
+# Files whose frames count as validation or JSON work when they are the innermost ones we recognise
+VALIDATION_FILES = tuple(
+    os.path.join(BACKEND_DIR, 'utils', name) for name in ('schema.py', 'validators.py', 'datetimes.py')
+)
+JSON_PATTERN = re.compile(r'[/\\](json|orjson|simplejson)[/\\]|fast_json\.py$')
+DISPATCH_PATTERN = re.compile(r'[/\\](flask|werkzeug|flask_cors)[/\\]')
+
+# Section labels per profiled thread, e.g. 'supabase GET interviews #2'
+_sections = {}
+
+@contextmanager
+def section(label):
+    """
+    Attribute the samples taken inside the block to label
+
+    Costs a dict lookup when the current request isn't being profiled.
+    """
+    labels = _sections.get(threading.get_ident())
+    if labels is None:
+        yield
+        return
+    labels.append(label)
+    try:
+        yield
+    finally:
+        labels.pop()
+
+def _frame_name(code):
+    path = code.co_filename
+    if path.startswith(BACKEND_DIR):
+        path = os.path.relpath(path, BACKEND_DIR)
+    else:
+        path = os.path.join(*path.replace('\\', '/').split('/')[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+def classify(codes, labels):
+    """
+    Phase a sample belongs to: the innermost Supabase call, else validation,
+    json, view (our own code) or dispatch (Flask and werkzeug)
+    """
+    if labels:
+        return labels[-1]
+    for code in reversed(codes):
+        path = code.co_filename
+        if path.startswith(VALIDATION_FILES):
+            return 'validation'
+        if JSON_PATTERN.search(path):
+            return 'json'
+        if path.startswith(BACKEND_DIR) and path != PROFILER_FILE and 'site-packages' not in path:
+            return 'view'
+        if DISPATCH_PATTERN.search(path):
+            return 'dispatch'
+    return 'dispatch'
+
+class Sampler:
+    """
+    Samples the stack of one thread from a background thread
+
+    Nothing runs on the profiled thread itself, so the request pays only
+    for the GIL the sampler takes every `interval` seconds. Each sample is
+    weighted by the wall time since the previous one.
+    """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = []
+        self.started = self.stopped = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+
+    def start(self):
+        _sections[self.thread_id] = []
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.stopped = time.perf_counter()
+        _sections.pop(self.thread_id, None)
+
+    def _run(self):
+        last = self.started
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = tuple(_sections.get(self.thread_id) or ())
+            now = time.perf_counter()
+            if frame is None:
+                continue
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+            self.samples.append((classify(codes, labels), tuple(codes), now - last))
+            last = now
+
+    def phases(self):
+        """Seconds spent per phase"""
+        totals = Counter()
+        for phase, _, weight in self.samples:
+            totals[phase] += weight
+        return totals
+
+    def collapsed(self):
+        """Brendan Gregg's folded format, one 'phase;outer;...;inner microseconds' line per stack"""
+        stacks = Counter()
+        for phase, codes, weight in self.samples:
+            stacks[';'.join([phase] + [_frame_name(code) for code in codes])] += weight
+        return ''.join(f"{stack} {round(weight * 1e6)}\n" for stack, weight in stacks.items())
+
+    def speedscope(self, name):
+        """Sampled profile in speedscope's JSON format, with the phase as the root frame"""
+        frames, index = [], {}
+
+        def frame_id(key, frame):
+            if key not in index:
+                index[key] = len(frames)
+                frames.append(frame)
+            return index[key]
+
+        samples, weights = [], []
+        for phase, codes, weight in self.samples:
+            stack = [frame_id(('phase', phase), {'name': phase})]
+            for code in codes:
+                stack.append(frame_id(code, {
+                    'name': code.co_name, 'file': code.co_filename, 'line': code.co_firstlineno
+                }))
+            samples.append(stack)
+            weights.append(weight)
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'interview-platform-backend',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': (self.stopped or time.perf_counter()) - self.started,
+                'samples': samples,
+                'weights': weights
+            }]
+        }
+
+class ProfilerMiddleware:
+    """
+    WSGI middleware that profiles requests on demand
+
+    A request is profiled when it carries the PROFILE_HEADER header or is
+    picked at PROFILE_SAMPLE_RATE. The profile covers the whole WSGI call,
+    routing and after_request hooks included, and runs until the body has
+    been sent so streamed responses are covered too. It is written to
+    PROFILE_DIR as speedscope JSON or collapsed stacks (PROFILE_FORMAT), and
+    the file name is returned in the X-Profile header.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+        self.header = 'HTTP_' + config.PROFILE_HEADER.upper().replace('-', '_')
+
+    def wanted(self, environ):
+        value = environ.get(self.header, '')
+        if value and value.lower() not in ('0', 'false', 'no'):
+            return True
+        return config.PROFILE_SAMPLE_RATE > 0 and random.random() < config.PROFILE_SAMPLE_RATE
+
+    def __call__(self, environ, start_response):
+        if not self.wanted(environ):
+            return self.wsgi_app(environ, start_response)
+
+        method, path = environ.get('REQUEST_METHOD', 'GET'), environ.get('PATH_INFO', '/')
+        request_id = environ.get('HTTP_X_REQUEST_ID') or uuid.uuid4().hex
+        extension = 'txt' if config.PROFILE_FORMAT == 'collapsed' else 'speedscope.json'
+        slug = re.sub(r'[^A-Za-z0-9]+', '-', path).strip('-') or 'root'
+        filename = f"{time.strftime('%Y%m%dT%H%M%S')}-{method}-{slug}-{re.sub(r'[^A-Za-z0-9]', '', request_id)[:32]}.{extension}"
+
+        def profiled_start_response(status, headers, exc_info=None):
+            return start_response(status, headers + [('X-Profile', filename)], exc_info)
+
+        sampler = Sampler(threading.get_ident(), config.PROFILE_INTERVAL)
+        sampler.start()
+        try:
+            app_iter = self.wsgi_app(environ, profiled_start_response)
+        except BaseException:
+            sampler.stop()
+            raise
+
+        def finish():
+            sampler.stop()
+            self.write(sampler, f"{method} {path}", filename)
+
+        return ClosingIterator(app_iter, [finish])
+
+    def write(self, sampler, name, filename):
+        try:
+            os.makedirs(config.PROFILE_DIR, exist_ok=True)
+            target = os.path.join(config.PROFILE_DIR, filename)
+            with open(target, 'w') as output:
+                if config.PROFILE_FORMAT == 'collapsed':
+                    output.write(sampler.collapsed())
+                else:
+                    json.dump(sampler.speedscope(name), output)
+        except OSError as e:
+            logger.warning("Could not write profile %s: %s", filename, e)
+            return
+
+        phases = sorted(sampler.phases().items(), key=lambda item: -item[1])
+        logger.info(
+            "Profiled %s in %.1fms (%s) -> %s",
+            name, (sampler.stopped - sampler.started) * 1000,
+            ', '.join(f"{phase} {seconds * 1000:.1f}ms" for phase, seconds in phases), target
+        )
+
+def init_profiling(app):
+    """Install the profiler middleware when PROFILE_ENABLED is set"""
+    if config.PROFILE_ENABLED:
+        app.wsgi_app = ProfilerMiddleware(app.wsgi_app)
@@ -0,0 +1,335 @@
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import httpx
+import requests
+from config import config
+from .metrics import SUPABASE_RESILIENCE
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the upstream is struggling rather than the request being wrong
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling an endpoint whose circuit is open"""
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint after repeated failures
+
+    After `threshold` consecutive failures the circuit opens and calls fail
+    fast for `reset_timeout` seconds. Then a single probe is let through:
+    success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, threshold=5, reset_timeout=10, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0
+        self._probing = False
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """Returns True when this failure opened the circuit"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.OPEN:
+                return False
+            if self.state == self.HALF_OPEN or self._failures >= self.threshold:
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+                return True
+            return False
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent traffic
+
+    Over the last `window` seconds, retries may add at most `ratio` of the
+    requests made, plus `min_per_second` so a quiet process can still
+    retry. In a brownout every request fails, and this keeps retries from
+    multiplying the load on the upstream.
+    """
+
+    def __init__(self, ratio=0.1, min_per_second=1, window=10, clock=time.monotonic):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests = deque()
+        self._retries = deque()
+
+    def _trim(self, now):
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] <= cutoff:
+                events.popleft()
+
+    def record_request(self):
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_retry(self):
+        """Take a retry from the budget, False when it is spent"""
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            allowed = self.min_per_second * self.window + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+def backoff_delay(attempt, base, maximum, rng=random.random):
+    """Full-jitter exponential backoff: uniform between 0 and base * 2**attempt, capped"""
+    return rng() * min(maximum, base * (2 ** attempt))
+
+def _close(future):
+    # The losing hedge is still read to the end by requests unless it is closed
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+class ResilientClient:
+    """
+    Sends Supabase requests through timeouts, retries, circuit breakers and hedging
+
+    Every call gets a (connect, read) timeout. Failed idempotent calls are
+    retried with jittered exponential backoff while the shared retry budget
+    allows it. Each endpoint has its own circuit breaker. With hedge_delay
+    set, a GET still unanswered after that many seconds gets a second copy
+    sent, and the first response to arrive wins. request_async applies the
+    same policy, breakers and budget to the asyncio client.
+
+    Args:
+        session: requests.Session to send with
+        retries: Retries after the first attempt
+        hedge_delay: Seconds before a GET is hedged, 0 to disable
+    """
+
+    def __init__(self, session, retries=None, hedge_delay=None, budget=None, clock=time.monotonic, sleep=time.sleep):
+        self.session = session
+        self.retries = config.SUPABASE_RETRIES if retries is None else retries
+        self.hedge_delay = config.SUPABASE_HEDGE_DELAY if hedge_delay is None else hedge_delay
+        self.timeout = (config.SUPABASE_CONNECT_TIMEOUT, config.SUPABASE_TIMEOUT)
+        self.budget = budget or RetryBudget(
+            config.SUPABASE_RETRY_BUDGET_RATIO, config.SUPABASE_RETRY_BUDGET_MIN, clock=clock
+        )
+        self._clock = clock
+        self._sleep = sleep
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def breaker(self, key):
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(
+                    config.SUPABASE_BREAKER_THRESHOLD, config.SUPABASE_BREAKER_RESET, clock=self._clock
+                )
+            return breaker
+
+    def request(self, method, url, key, **kwargs):
+        """
+        Send a request, returning the final requests.Response
+
+        Args:
+            key: Endpoint the circuit breaker and metrics are kept for, e.g. the table name
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            requests.exceptions.RequestException: If the last attempt failed to connect or timed out
+        """
+        breaker = self._admit(key)
+
+        # A single number from the caller is the read timeout, connecting keeps its own limit
+        timeout = kwargs.get('timeout')
+        if isinstance(timeout, (int, float)):
+            timeout = (min(config.SUPABASE_CONNECT_TIMEOUT, timeout), timeout)
+        kwargs['timeout'] = timeout or self.timeout
+        attempt = 0
+
+        while True:
+            response = error = None
+            try:
+                response = self._send(method, url, key, kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+            except Exception:
+                # Never leave a half-open circuit waiting on a probe that won't report back
+                breaker.record_failure()
+                raise
+
+            if error is None and response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+
+            if not self._retry(breaker, key, method, attempt, isinstance(error, requests.exceptions.ConnectTimeout)):
+                break
+            if response is not None:
+                response.close()
+            self._sleep(backoff_delay(attempt, config.SUPABASE_BACKOFF_BASE, config.SUPABASE_BACKOFF_MAX))
+            attempt += 1
+
+        if error is not None:
+            raise error
+        return response
+
+    async def request_async(self, send, method, key):
+        """
+        Send a request from the asyncio client, returning the final httpx.Response
+
+        Args:
+            send: Coroutine function that makes one attempt
+            key: Endpoint the circuit breaker and metrics are kept for, e.g. the table name
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            httpx.TransportError: If the last attempt failed to connect or timed out
+        """
+        breaker = self._admit(key)
+        attempt = 0
+
+        while True:
+            response = error = None
+            try:
+                response = await self._send_async(send, method, key)
+            except httpx.TransportError as e:
+                error = e
+            except Exception:
+                breaker.record_failure()
+                raise
+
+            if error is None and response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+
+            if not self._retry(breaker, key, method, attempt, isinstance(error, httpx.ConnectTimeout)):
+                break
+            await asyncio.sleep(backoff_delay(attempt, config.SUPABASE_BACKOFF_BASE, config.SUPABASE_BACKOFF_MAX))
+            attempt += 1
+
+        if error is not None:
+            raise error
+        return response
+
+    def _admit(self, key):
+        breaker = self.breaker(key)
+        if not breaker.allow():
+            SUPABASE_RESILIENCE.inc(table=key, event='rejected')
+            raise CircuitOpenError(f"Circuit open for {key}, Supabase is failing")
+        self.budget.record_request()
+        return breaker
+
+    def _retry(self, breaker, key, method, attempt, connect_timeout):
+        """Record a failed attempt, True when it should be tried again"""
+        if breaker.record_failure():
+            SUPABASE_RESILIENCE.inc(table=key, event='opened')
+            logger.warning("Circuit opened for %s after repeated Supabase failures", key)
+
+        # Writes are only repeated when they can't have reached the server
+        retryable = method in IDEMPOTENT_METHODS or connect_timeout
+        if attempt >= self.retries or not retryable or not breaker.allow():
+            return False
+        if not self.budget.try_retry():
+            SUPABASE_RESILIENCE.inc(table=key, event='budget_exhausted')
+            return False
+
+        SUPABASE_RESILIENCE.inc(table=key, event='retry')
+        return True
+
+    def _send(self, method, url, key, kwargs):
+        if method != 'GET' or not self.hedge_delay:
+            return self.session.request(method, url, **kwargs)
+
+        first = self._submit(method, url, kwargs)
+        done, _ = wait([first], timeout=self.hedge_delay)
+        # Hedges are extra load too, they come out of the retry budget
+        if done or not self.budget.try_retry():
+            return first.result()
+
+        SUPABASE_RESILIENCE.inc(table=key, event='hedge')
+        second = self._submit(method, url, kwargs)
+        pending = {first, second}
+        failed = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # A failed copy only loses while the other one can still answer
+                if future.exception() is None:
+                    for loser in (done | pending) - {future}:
+                        loser.add_done_callback(_close)
+                    return future.result()
+                failed = future
+        return failed.result()
+
+    def _submit(self, method, url, kwargs):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=config.SUPABASE_POOL_SIZE, thread_name_prefix='supabase-hedge'
+                )
+        # Carry the request id over so the copies log under the right request
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, self.session.request, method, url, **kwargs)
+
+    async def _send_async(self, send, method, key):
+        if method != 'GET' or not self.hedge_delay:
+            return await send()
+
+        first = asyncio.ensure_future(send())
+        done, _ = await asyncio.wait([first], timeout=self.hedge_delay)
+        if done or not self.budget.try_retry():
+            return await first
+
+        SUPABASE_RESILIENCE.inc(table=key, event='hedge')
+        pending = {first, asyncio.ensure_future(send())}
+        failed = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return task.result()
+                failed = task
+        return failed.result()
@@ -0,0 +1,227 @@
+import re
+from itertools import islice
+from datetime import datetime, time, timedelta, timezone
+
+from config import config
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+WINDOW_PATTERN = re.compile(r'^\s*(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*$')
+
+def parse_window(window, slot_minutes):
+    """
+    Slot range covered by an availability window like '09:00-12:00'
+
+    Partial slots at either end are dropped, '24:00' closes the day.
+
+    Raises:
+        ValueError: If the window isn't HH:MM-HH:MM or ends before it starts
+    """
+    match = WINDOW_PATTERN.match(window)
+    if not match:
+        raise ValueError(f"Invalid availability window: {window}")
+    start_hour, start_minute, end_hour, end_minute = (int(part) for part in match.groups())
+    start = start_hour * 60 + start_minute
+    end = end_hour * 60 + end_minute
+    if start_minute > 59 or end_minute > 59 or end > 24 * 60 or start >= end:
+        raise ValueError(f"Invalid availability window: {window}")
+    return -(-start // slot_minutes), end // slot_minutes
+
+def span_mask(first, last):
+    """Bitmap with slots first..last-1 set"""
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+def fit_mask(free, length):
+    """
+    Bitmap of the slots where `length` consecutive free slots start
+
+    Shifting by the run length found so far doubles it each step, so this
+    takes O(log length) big-int operations instead of one per slot.
+    """
+    fits = free
+    covered = 1
+    while covered < length:
+        step = min(covered, length - covered)
+        fits &= fits >> step
+        covered += step
+    return fits
+
+def iter_bits(mask):
+    """Indexes of the set bits, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class Interviewer:
+    """An interviewer's weekly availability, precomputed as one bitmap per weekday"""
+
+    __slots__ = ('name', 'weekly', 'max_per_day', 'role')
+
+    def __init__(self, record, slot_minutes):
+        self.name = record['name']
+        self.max_per_day = record.get('max_interviews_per_day')
+        self.role = (record.get('role') or '').strip().lower()
+        self.weekly = [0] * 7
+
+        availability = record.get('availability') or {}
+        for day, windows in availability.items():
+            if day.lower() not in WEEKDAYS:
+                continue
+            weekday = WEEKDAYS.index(day.lower())
+            for window in windows or []:
+                self.weekly[weekday] |= span_mask(*parse_window(window, slot_minutes))
+
+    def interviews_for(self, job_role):
+        # Matched on the interviewers.role column, interviewers without one take every role
+        return not self.role or not job_role or job_role.strip().lower() == self.role
+
+class SlotFinder:
+    """
+    Finds the earliest open interview slots across many interviewers
+
+    Days are split into SCHEDULER_SLOT_MINUTES slots and every interviewer's
+    weekly availability is turned into bitmaps once. Days, availability
+    windows and suggested times are wall-clock times in the search's
+    timezone. A search then clears
+    the booked slots for each day and finds runs long enough for the
+    interview with a handful of shifts and ANDs per interviewer-day.
+
+    Args:
+        interviewers: Interviewer rows with name, role, availability and max_interviews_per_day
+        slot_minutes: Slot granularity, suggested start times are multiples of it
+    """
+
+    def __init__(self, interviewers, slot_minutes=None):
+        self.slot_minutes = slot_minutes or config.SCHEDULER_SLOT_MINUTES
+        self.slots_per_day = 24 * 60 // self.slot_minutes
+        self.interviewers = []
+        for record in interviewers:
+            try:
+                self.interviewers.append(Interviewer(record, self.slot_minutes))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                # One malformed record shouldn't take the whole search down
+                continue
+
+    def busy_masks(self, bookings, date, tz=timezone.utc):
+        """
+        Bitmaps of booked slots and booking counts for one day
+
+        Args:
+            bookings: Interviewer name -> list of (start, end) in epoch seconds
+            date: The day to map
+            tz: Timezone the day is in
+
+        Returns:
+            tuple: ({name: mask}, {name: bookings starting that day})
+        """
+        slot_seconds = self.slot_minutes * 60
+        busy = {}
+        counts = {}
+
+        def wall_seconds(epoch):
+            # Seconds from local midnight on the wall clock, so DST days still line up with the slots
+            local = datetime.fromtimestamp(epoch, tz)
+            return (local.date() - date).days * 86400 + local.hour * 3600 + local.minute * 60 + local.second
+
+        for name, spans in bookings.items():
+            mask = 0
+            for start, end in spans:
+                # Bookings running in from the day before or past midnight are clipped
+                first = int(wall_seconds(start) // slot_seconds)
+                last = -int(-wall_seconds(end) // slot_seconds)
+                mask |= span_mask(max(first, 0), min(last, self.slots_per_day))
+                if 0 <= first < self.slots_per_day:
+                    counts[name] = counts.get(name, 0) + 1
+            busy[name] = mask
+
+        return busy, counts
+
+    def suggest(self, duration, date_from, date_to, booked, job_role=None, names=None, limit=10, now=None,
+                tz=None):
+        """
+        Earliest feasible slots, ordered by start time then interviewer
+
+        Args:
+            duration: Interview length in minutes
+            date_from: First date to search
+            date_to: Last date to search (inclusive)
+            booked: Callable taking (start, end) epoch seconds and returning
+                interviewer name -> list of booked (start, end)
+            job_role: Only interviewers taking this role
+            names: Only these interviewers
+            limit: Maximum number of slots returned
+            now: Slots starting before this datetime are skipped, naive means UTC
+            tz: Timezone of the dates and suggestions, UTC by default
+
+        Returns:
+            list: Dicts with interviewer, local date and time, and offset-aware
+            ISO start and end
+        """
+        tz = tz or timezone.utc
+        if now is not None:
+            if now.tzinfo is None:
+                now = now.replace(tzinfo=timezone.utc)
+            now = now.astimezone(tz)
+
+        length = -(-duration // self.slot_minutes)
+        days = (date_to - date_from).days + 1
+        if length > self.slots_per_day or days <= 0 or limit <= 0:
+            return []
+
+        candidates = [
+            interviewer for interviewer in self.interviewers
+            if interviewer.interviews_for(job_role) and (not names or interviewer.name in names)
+        ]
+
+        suggestions = []
+        for day in range(days):
+            date = date_from + timedelta(days=day)
+            weekday = date.weekday()
+
+            # Slots that are already over today can't be offered
+            past = 0
+            if now is not None and date <= now.date():
+                if date < now.date():
+                    continue
+                elapsed = now.hour * 60 + now.minute
+                past = span_mask(0, -(-elapsed // self.slot_minutes))
+
+            # Bookings are looked up a day at a time, the search usually stops early
+            midnight = datetime.combine(date, time(), tzinfo=tz)
+            next_midnight = datetime.combine(date + timedelta(days=1), time(), tzinfo=tz)
+            busy, counts = self.busy_masks(booked(midnight.timestamp(), next_midnight.timestamp()), date, tz)
+
+            day_slots = []
+            for interviewer in candidates:
+                free = interviewer.weekly[weekday]
+                if not free:
+                    continue
+                if interviewer.max_per_day is not None and counts.get(interviewer.name, 0) >= interviewer.max_per_day:
+                    continue
+                free &= ~(busy.get(interviewer.name, 0) | past)
+                # Only an interviewer's first `limit` starts can make the cut
+                fits = fit_mask(free, length)
+                for slot in islice(iter_bits(fits), limit):
+                    day_slots.append((slot, interviewer.name))
+
+            day_slots.sort()
+            for slot, name in day_slots[:limit - len(suggestions)]:
+                start = midnight + timedelta(minutes=slot * self.slot_minutes)
+                # Added in UTC so an interview across a DST change still lasts `duration`
+                end = (start.astimezone(timezone.utc) + timedelta(minutes=duration)).astimezone(tz)
+                suggestions.append({
+                    'interviewer': name,
+                    'date': start.strftime('%Y-%m-%d'),
+                    'time': start.strftime('%H:%M'),
+                    'start': start.isoformat(),
+                    'end': end.isoformat()
+                })
+
+            # Every later day starts after everything found so far
+            if len(suggestions) >= limit:
+                break
+
+        return suggestions
@@ -0,0 +1,120 @@
+import re
+
+class Field:
+    """
+    One field of a request schema
+
+    Every rule is turned into a check function when the field is created,
+    so patterns are compiled and choice lists hashed once at import time.
+
+    Args:
+        name: Key in the request body
+        required: Reject the body when the field is missing, None or ''
+        truthy: Treat any falsy value (false, 0, []) as missing too, e.g. for a consent flag
+        coerce: Callable converting the value, e.g. int; TypeError/ValueError become an error
+        pattern: Regex the (string) value must match in full
+        choices: Allowed values
+        checks: Callables taking the value and returning an error message or None
+        message: Error for a failed coerce, pattern or choices rule
+    """
+
+    __slots__ = ('name', 'required', 'truthy', 'coerce', 'message', '_checks')
+
+    def __init__(self, name, required=False, truthy=False, coerce=None, pattern=None, choices=None, checks=(),
+                 message=None):
+        self.name = name
+        self.required = required
+        self.truthy = truthy
+        self.coerce = coerce
+        self.message = message or f"Invalid {name}"
+        self._checks = []
+
+        if pattern is not None:
+            match = re.compile(pattern).fullmatch
+            self._checks.append(lambda value: None if isinstance(value, str) and match(value) else self.message)
+
+        if choices is not None:
+            allowed = frozenset(choices)
+            self._checks.append(lambda value: None if value in allowed else self.message)
+
+        self._checks.extend(checks)
+
+    def validate(self, value):
+        """
+        Returns:
+            tuple: (converted value, error message or None)
+        """
+        if self.coerce is not None:
+            try:
+                value = self.coerce(value)
+            except (TypeError, ValueError):
+                return value, self.message
+
+        for check in self._checks:
+            error = check(value)
+            if error:
+                return value, error
+        return value, None
+
+class Schema:
+    """
+    A request body schema, validated in one pass that collects every error
+
+    Usage:
+        DEMO_REQUEST_SCHEMA = Schema(
+            Field('first_name', required=True),
+            Field('work_email', required=True, pattern=EMAIL_PATTERN, message="Invalid email format")
+        )
+        values, errors = DEMO_REQUEST_SCHEMA.validate(request.json)
+    """
+
+    def __init__(self, *fields, checks=()):
+        self.fields = fields
+        # Cross-field checks take the converted values and return an error or None
+        self.checks = checks
+
+    def validate(self, data, partial=False):
+        """
+        Check a request body against every field
+
+        Args:
+            data: The request body
+            partial: Skip required checks, for updates that send only some fields
+
+        Returns:
+            tuple: (dict of the converted values that were present, list of error messages)
+        """
+        if not isinstance(data, dict):
+            return {}, ["Request body must be a JSON object"]
+
+        values = {}
+        errors = []
+        for field in self.fields:
+            value = data.get(field.name)
+            if value is None or value == '' or (field.truthy and not value):
+                if field.required and not partial:
+                    errors.append(f"Missing required field: {field.name}")
+                continue
+
+            value, error = field.validate(value)
+            if error:
+                errors.append(error)
+            else:
+                values[field.name] = value
+
+        # Cross-field checks only make sense once every field is valid
+        if not errors:
+            for check in self.checks:
+                error = check(values)
+                if error:
+                    errors.append(error)
+
+        return values, errors
+
+    def validate_many(self, items, partial=False):
+        """Validate a list of bodies, returning one (values, errors) pair per item"""
+        return [self.validate(item, partial) for item in items]
+
+def error_message(errors):
+    """All validation errors as a single message"""
+    return '; '.join(errors)
@@ -0,0 +1,158 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+
+from config import config
+from .fast_json import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+class Snapshot:
+    """A last-known-good value and when it was fetched"""
+
+    __slots__ = ('value', 'fetched_at')
+
+    def __init__(self, value, fetched_at):
+        self.value = value
+        self.fetched_at = fetched_at
+
+    def age(self, now=None):
+        return max(0.0, (now if now is not None else time.time()) - self.fetched_at)
+
+class SnapshotCache:
+    """
+    Stale-while-revalidate cache that keeps the last good result on disk
+
+    Reads are answered from memory. Once an entry is older than `ttl`, it
+    is still returned, and a refresh is started on a background thread. So
+    readers only ever wait on the upstream when there is no snapshot at all.
+    Snapshots are kept in SQLite, so they survive restarts and are shared
+    between gunicorn workers. A failed refresh keeps the previous snapshot.
+
+    Args:
+        loader: Callable taking the key and returning the fresh value, raises on failure
+        path: SQLite file the snapshots are stored in
+        ttl: Seconds a snapshot counts as fresh
+        clock: Wall clock, since snapshots outlive the process
+    """
+
+    def __init__(self, loader, path=None, ttl=None, clock=time.time):
+        self.loader = loader
+        self.path = path or config.SNAPSHOT_PATH
+        self.ttl = config.SNAPSHOT_TTL if ttl is None else ttl
+        self._clock = clock
+        self._memory = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = None
+        self._ready = False
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # WAL lets workers read while another one writes a refresh
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS snapshots (key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL)'
+            )
+            self._ready = True
+        return connection
+
+    def _read(self, key):
+        try:
+            with closing(self._connect()) as connection, connection:
+                row = connection.execute('SELECT body, fetched_at FROM snapshots WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Could not read snapshot %s: %s", key, e)
+            return None
+        return Snapshot(loads(row[0]), row[1]) if row else None
+
+    def _write(self, key, snapshot):
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO snapshots (key, body, fetched_at) VALUES (?, ?, ?)',
+                    (key, dumps(snapshot.value, default=str), snapshot.fetched_at)
+                )
+        except sqlite3.Error as e:
+            # The in-memory copy still works, only persistence is lost
+            logger.warning("Could not store snapshot %s: %s", key, e)
+
+    def get(self, key):
+        """
+        Current snapshot for key, refreshing in the background when it is stale
+
+        Returns:
+            Snapshot or None: None only when nothing was ever fetched and the
+            first fetch failed
+        """
+        snapshot = self._memory.get(key)
+        if snapshot is None or snapshot.age(self._clock()) >= self.ttl:
+            # Another worker may have refreshed it already
+            stored = self._read(key)
+            if stored is not None and (snapshot is None or stored.fetched_at > snapshot.fetched_at):
+                snapshot = self._memory[key] = stored
+
+        if snapshot is None:
+            # Cold start, there is nothing to serve until the first fetch
+            return self.refresh(key)
+
+        if snapshot.age(self._clock()) >= self.ttl:
+            self._refresh_later(key)
+        return snapshot
+
+    def refresh(self, key):
+        """Fetch key now, returning the new snapshot or the previous one if the fetch fails"""
+        try:
+            value = self.loader(key)
+        except Exception as e:
+            logger.warning("Snapshot refresh failed for %s, keeping the last good copy: %s", key, e)
+            return self._memory.get(key)
+
+        snapshot = Snapshot(value, self._clock())
+        self._memory[key] = snapshot
+        self._write(key, snapshot)
+        return snapshot
+
+    def invalidate(self, key):
+        """
+        Mark a snapshot stale so the next read refreshes it, it is still served meanwhile
+
+        Other workers notice once their in-memory copy expires and they look at the disk.
+        """
+        expired = self._clock() - self.ttl
+        snapshot = self._memory.get(key)
+        if snapshot is not None:
+            self._memory[key] = Snapshot(snapshot.value, min(snapshot.fetched_at, expired))
+        # On disk too, or the stored copy would look fresh again
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    'UPDATE snapshots SET fetched_at = MIN(fetched_at, ?) WHERE key = ?', (expired, key)
+                )
+        except sqlite3.Error as e:
+            logger.warning("Could not invalidate snapshot %s: %s", key, e)
+
+    def _refresh_later(self, key):
+        with self._lock:
+            # One refresh per key at a time, however many readers see it stale
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot-refresh')
+        self._executor.submit(self._run_refresh, key)
+
+    def _run_refresh(self, key):
+        try:
+            self.refresh(key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
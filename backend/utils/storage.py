@@ -0,0 +1,167 @@
+import base64
+import logging
+from urllib.parse import urljoin
+
+import requests
+from config import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+TUS_VERSION = '1.0.0'
+
+class _ChunkReader:
+    """
+    File-like view over the next `length` bytes of a stream
+
+    requests reads it in small blocks while sending, so at most one block of
+    the upload is in memory at a time.
+    """
+
+    def __init__(self, stream, length):
+        self._stream = stream
+        self._remaining = length
+
+    def __len__(self):
+        return self._remaining
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._stream.read(min(size, config.STORAGE_READ_SIZE))
+        self._remaining -= len(data)
+        return data
+
+def _stream_size(stream):
+    # werkzeug spools uploads to a seekable file, so the size is one seek away
+    try:
+        position = stream.tell()
+        stream.seek(0, 2)
+        size = stream.tell() - position
+        stream.seek(position)
+        return size
+    except (AttributeError, OSError):
+        return None
+
+def _encode_metadata(metadata):
+    return ','.join(
+        f"{name} {base64.b64encode(str(value).encode()).decode()}"
+        for name, value in metadata.items()
+    )
+
+def public_url(url, object_path, bucket=None):
+    bucket = bucket or config.STORAGE_BUCKET
+    return f"{url}/storage/v1/object/public/{bucket}/{object_path}"
+
+def upload_file_stream(file, object_path, url, key, bucket=None, session=None, cache_control='3600'):
+    """
+    Stream an uploaded file to Supabase storage without reading it into memory
+
+    Files up to STORAGE_RESUMABLE_THRESHOLD go up in a single streamed POST.
+    Larger files use the resumable (TUS) endpoint in STORAGE_CHUNK_SIZE parts,
+    and a failed part resumes from the offset the server acknowledged.
+
+    Args:
+        file: werkzeug FileStorage or any object with .stream/.read
+        object_path: Path of the object inside the bucket
+        url: Supabase project URL
+        key: Supabase API key
+        bucket: Storage bucket, defaults to STORAGE_BUCKET
+        session: requests session to reuse pooled connections
+        cache_control: Cache-Control max-age for the stored object
+
+    Returns:
+        str: Public URL of the uploaded file
+
+    Raises:
+        requests.RequestException: If the upload fails
+    """
+    bucket = bucket or config.STORAGE_BUCKET
+    session = session or requests.Session()
+    stream = getattr(file, 'stream', file)
+    content_type = getattr(file, 'content_type', None) or 'application/octet-stream'
+    size = _stream_size(stream)
+
+    headers = {
+        'apikey': key,
+        'Authorization': f'Bearer {key}'
+    }
+
+    if size is not None and size > config.STORAGE_RESUMABLE_THRESHOLD:
+        _upload_resumable(session, stream, size, url, headers, bucket, object_path, content_type, cache_control)
+    else:
+        if size is None:
+            # Unknown length, fall back to chunked transfer encoding
+            body = iter(lambda: stream.read(config.STORAGE_READ_SIZE), b'')
+        else:
+            body = _ChunkReader(stream, size)
+
+        logger.info("Uploading %s to storage (%s bytes)", object_path, size)
+        response = session.post(
+            f"{url}/storage/v1/object/{bucket}/{object_path}",
+            headers=dict(headers, **{'Content-Type': content_type, 'Cache-Control': f'max-age={cache_control}'}),
+            data=body,
+            verify=False,
+            timeout=config.SUPABASE_TIMEOUT
+        )
+        response.raise_for_status()
+
+    return public_url(url, object_path, bucket)
+
+def _upload_resumable(session, stream, size, url, headers, bucket, object_path, content_type, cache_control):
+    headers = dict(headers, **{'Tus-Resumable': TUS_VERSION})
+
+    # Create the upload
+    endpoint = f"{url}/storage/v1/upload/resumable"
+    response = session.post(
+        endpoint,
+        headers=dict(headers, **{
+            'Upload-Length': str(size),
+            'Upload-Metadata': _encode_metadata({
+                'bucketName': bucket,
+                'objectName': object_path,
+                'contentType': content_type,
+                'cacheControl': cache_control
+            })
+        }),
+        verify=False,
+        timeout=config.SUPABASE_TIMEOUT
+    )
+    response.raise_for_status()
+    location = urljoin(endpoint, response.headers['Location'])
+
+    start = stream.tell()
+    offset = 0
+    retries = 0
+    logger.info("Uploading %s to storage in parts (%s bytes)", object_path, size)
+
+    while offset < size:
+        length = min(config.STORAGE_CHUNK_SIZE, size - offset)
+        try:
+            response = session.patch(
+                location,
+                headers=dict(headers, **{
+                    'Upload-Offset': str(offset),
+                    'Content-Type': 'application/offset+octet-stream',
+                    'Content-Length': str(length)
+                }),
+                data=_ChunkReader(stream, length),
+                verify=False,
+                timeout=config.SUPABASE_TIMEOUT
+            )
+            response.raise_for_status()
+            offset = int(response.headers.get('Upload-Offset', offset + length))
+        except requests.RequestException as e:
+            retries += 1
+            if retries > config.STORAGE_UPLOAD_RETRIES:
+                raise
+            logger.warning("Upload part at offset %s failed, resuming: %s", offset, e)
+
+            # Ask the server how much it kept and continue from there
+            response = session.head(location, headers=headers, verify=False, timeout=config.SUPABASE_TIMEOUT)
+            response.raise_for_status()
+            offset = int(response.headers['Upload-Offset'])
+
+        stream.seek(start + offset)
@@ -5,6 +5,11 @@ from datetime import datetime
 import os
 from config import config
 from config.ssl_config import *
+from .storage import upload_file_stream
+from .request_logging import truncate
+from .metrics import track_supabase_call, table_name
+from .resilience import ResilientClient, CircuitOpenError
+from .fast_json import dumps, loads
 from dotenv import load_dotenv
 import traceback
 
@@ -14,9 +19,15 @@ logger = logging.getLogger(__name__)
 
 # Configure requests session for better connection handling
 session = requests.Session()
-adapter = requests.adapters.HTTPAdapter(max_retries=3)
+adapter = requests.adapters.HTTPAdapter(
+    pool_connections=config.SUPABASE_POOL_SIZE,
+    pool_maxsize=config.SUPABASE_POOL_SIZE
+)
 session.mount('https://', adapter)
 
+# Timeouts, backoff retries, circuit breakers and hedging, in place of the adapter's blind retries
+client = ResilientClient(session)
+
 # Disable SSL verification globally for requests
 requests.packages.urllib3.disable_warnings()
 
@@ -38,63 +49,172 @@ def init_supabase():
 # Initialize Supabase client
 supabase_client = init_supabase()
 
-def supabase_request(endpoint, method='GET', data=None, params=None):
+def build_headers(key, prefer=None, count=None):
+    """
+    Headers for a PostgREST request
+
+    Args:
+        key: Supabase API key
+        prefer: Prefer return option, e.g. 'representation' or 'minimal'
+        count: Prefer count option, e.g. 'exact', 'planned' or 'estimated'
+    """
+    headers = {
+        'apikey': key,
+        'Authorization': f'Bearer {key}',
+        'Content-Type': 'application/json'
+    }
+
+    preferences = []
+    if prefer:
+        preferences.append(f'return={prefer}')
+    if count:
+        preferences.append(f'count={count}')
+    if preferences:
+        headers['Prefer'] = ','.join(preferences)
+
+    return headers
+
+def parse_count(content_range):
+    """Read the total out of a Content-Range header like '0-24/3573'"""
+    if not content_range or '/' not in content_range:
+        return None
+    total = content_range.rsplit('/', 1)[1]
+    return int(total) if total.isdigit() else None
+
+def build_response(response):
+    """
+    Convert an HTTP response into the dict returned by supabase_request
+
+    Works with both requests and httpx responses so the sync and async
+    clients hand the same shape back to the services. When a count was
+    requested the total is returned under 'count'.
+    """
+    # Check if the response was successful
+    if response.status_code >= 200 and response.status_code < 300:
+        try:
+            response_data = loads(response.content)
+            if isinstance(response_data, list) and len(response_data) == 1:
+                response_data = response_data[0]
+        except json.JSONDecodeError:
+            response_data = None
+
+        result = {
+            'status_code': response.status_code,
+            'data': response_data,
+            'error': None
+        }
+
+        count = parse_count(response.headers.get('Content-Range'))
+        if count is not None:
+            result['count'] = count
+        return result
+
+    # If the response was not successful, return an error
+    return {
+        'status_code': response.status_code,
+        'data': None,
+        'error': response.text
+    }
+
+def supabase_request(endpoint, method='GET', data=None, params=None, timeout=None, prefer=None, count=None):
+    with track_supabase_call(endpoint, method) as call:
+        result = _supabase_request(endpoint, method, data, params, timeout, prefer, count)
+        call.status = result.get('status_code')
+    return result
+
+def _supabase_request(endpoint, method, data, params, timeout, prefer, count):
+    if config.SUPABASE_ASYNC_CLIENT:
+        # Route through the shared event loop so threads don't each hold a connection
+        from .async_supabase import supabase_request_sync
+        return supabase_request_sync(
+            endpoint, method=method, data=data, params=params, timeout=timeout, prefer=prefer, count=count
+        )
+
     try:
         # Build full URL
         url = f"{supabase_client['url']}/rest/v1/{endpoint.lstrip('/')}"
         
         # Prepare headers
-        headers = {
-            'apikey': supabase_client['key'],
-            'Authorization': f'Bearer {supabase_client["key"]}',
-            'Content-Type': 'application/json'
-        }
+        headers = build_headers(supabase_client['key'], prefer=prefer, count=count)
         
-        # Log the request details
-        logger.info(f"Making Supabase request: {method} {url}")
-        logger.info(f"Headers: {headers}")
-        logger.info(f"Data: {data}")
-        logger.info(f"Params: {params}")
+        # Log the request, bodies only at DEBUG and never the headers (they carry the key)
+        logger.info("Supabase request: %s %s", method, url)
+        logger.debug("Supabase request params=%s data=%s", params, truncate(data))
         
         # Make the request with SSL verification disabled
-        response = session.request(method, url, headers=headers, json=data, params=params, verify=False)
+        response = client.request(
+            method, url, table_name(endpoint), headers=headers, data=dumps(data) if data is not None else None,
+            params=params, verify=False, timeout=timeout
+        )
         
         # Log the response
-        logger.info(f"Response status: {response.status_code}")
-        logger.info(f"Response content: {response.text}")
+        logger.info("Supabase response: %s %s -> %s", method, url, response.status_code)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Supabase response body: %s", truncate(response.text))
         
-        # Check if the response was successful
-        if response.status_code >= 200 and response.status_code < 300:
-            try:
-                response_data = response.json()
-                if isinstance(response_data, list) and len(response_data) == 1:
-                    response_data = response_data[0]
-            except json.JSONDecodeError:
-                response_data = None
-            
-            return {
-                'status_code': response.status_code,
-                'data': response_data,
-                'error': None
-            }
-        else:
-            # If the response was not successful, return an error
-            return {
-                'status_code': response.status_code,
-                'data': None,
-                'error': response.text
-            }
+        return build_response(response)
         
+    except CircuitOpenError as e:
+        # Fail fast while Supabase recovers
+        logger.warning("Supabase request skipped: %s %s: %s", method, endpoint, e)
+        return {
+            'status_code': 503,
+            'error': str(e)
+        }
     except Exception as e:
-        logger.error(f"Supabase request failed: {str(e)}")
-        logger.error(f"Method: {method}")
-        logger.error(f"Data: {data}")
-        logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.error("Supabase request failed: %s %s: %s", method, endpoint, e)
+        logger.debug("Supabase request data=%s\n%s", truncate(data), traceback.format_exc())
         return {
             'status_code': 500,
             'error': str(e)
         }
 
+def iter_rows(endpoint, params=None, page_size=None, timeout=None):
+    """
+    Yield every row of a Supabase query, one page at a time
+
+    Pages are requested with PostgREST Range headers so only one page is held
+    in memory. The query should have a stable order for paging to be exact.
+
+    Args:
+        endpoint: Table name, e.g. 'interviews'
+        params: Query parameters (filters, select, order)
+        page_size: Rows per request
+        timeout: Per-page timeout in seconds
+
+    Raises:
+        requests.HTTPError: If Supabase rejects a page
+    """
+    url = f"{supabase_client['url']}/rest/v1/{endpoint.lstrip('/')}"
+    page_size = page_size or config.EXPORT_PAGE_SIZE
+    start = 0
+
+    while True:
+        headers = {
+            'apikey': supabase_client['key'],
+            'Authorization': f'Bearer {supabase_client["key"]}',
+            'Range-Unit': 'items',
+            'Range': f'{start}-{start + page_size - 1}'
+        }
+
+        logger.info("Fetching Supabase page: GET %s rows %s-%s", url, start, start + page_size - 1)
+        with track_supabase_call(endpoint, 'GET') as call:
+            response = client.request(
+                'GET', url, table_name(endpoint), headers=headers, params=params, verify=False, timeout=timeout
+            )
+            call.status = response.status_code
+        # 416 means the offset is past the last row
+        if response.status_code == 416:
+            return
+        response.raise_for_status()
+
+        rows = response.json()
+        yield from rows
+
+        if len(rows) < page_size:
+            return
+        start += page_size
+
 def upload_file_to_supabase(file, candidate_name):
     """
     Upload a file to Supabase storage
@@ -112,19 +232,16 @@ def upload_file_to_supabase(file, candidate_name):
         file_extension = os.path.splitext(file.filename)[1]
         file_name = f"{candidate_name}_{timestamp}{file_extension}"
         
-        # Upload file to storage
-        url = f"{config.SUPABASE_URL}/storage/v1/object/{config.STORAGE_BUCKET}/{file_name}"
-        response = supabase_request(
-            f"/storage/v1/object/{config.STORAGE_BUCKET}/{file_name}",
-            method='POST',
-            data=file.read(),
-            headers={'Content-Type': file.content_type}
+        # Stream the file to storage
+        return upload_file_stream(
+            file,
+            file_name,
+            supabase_client['url'],
+            supabase_client['key'],
+            bucket=config.STORAGE_BUCKET,
+            session=session
         )
         
-        # Get public URL
-        public_url = f"{config.SUPABASE_URL}/storage/v1/object/public/{config.STORAGE_BUCKET}/{file_name}"
-        return public_url
-        
     except Exception as e:
-        logger.error(f"Failed to upload file to Supabase: {str(e)}")
+        logger.error("Failed to upload file to Supabase: %s", e)
         raise
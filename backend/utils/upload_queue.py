@@ -0,0 +1,171 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from config import config
+from .cache import TTLCache
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# resume_url values standing in for a background upload, so every worker can report on it
+RESUME_PENDING = 'upload:pending'
+RESUME_FAILED = 'upload:failed'
+
+def upload_status(resume_url):
+    """Status of a background upload from the interview's resume_url, None if the row has no resume"""
+    if not resume_url:
+        return None
+    if resume_url == RESUME_PENDING:
+        return 'pending'
+    if resume_url == RESUME_FAILED:
+        return 'failed'
+    return 'completed'
+
+def pending_expired(updated_at, now=None):
+    """
+    True when a row has been pending for longer than UPLOAD_PENDING_TIMEOUT
+
+    No upload takes that long, so the worker holding it has gone away, e.g.
+    in a restart, and its spooled file with it.
+
+    Args:
+        updated_at: The row's updated_at timestamp
+    """
+    try:
+        changed = datetime.fromisoformat(updated_at)
+    except (TypeError, ValueError):
+        return False
+    if changed.tzinfo is None:
+        changed = changed.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return (now - changed).total_seconds() > config.UPLOAD_PENDING_TIMEOUT
+
+class SpooledFile:
+    """A file saved to local disk, shaped like the werkzeug FileStorage it came from"""
+
+    def __init__(self, path, filename, content_type):
+        self.path = path
+        self.filename = filename
+        self.content_type = content_type
+        self.stream = None
+
+    def open(self):
+        self.stream = open(self.path, 'rb')
+        return self
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def remove(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+class UploadQueue:
+    """
+    Finishes resume uploads in the background
+
+    Files are spooled to local disk while the request is still open, then a
+    worker pool uploads them and patches the interview row, retrying with
+    exponential backoff. The row is the shared record of the outcome. This
+    process's attempts and errors are kept for UPLOAD_JOB_TTL seconds. The
+    pool and spool directory are only created once a file is queued.
+
+    Args:
+        upload: Callable taking (file, candidate_name) and returning the public URL or None
+        complete: Callable taking (interview_id, url) and returning True once the row is patched
+        fail: Callable taking (interview_id, error) once every attempt has failed
+        spool_dir: Directory for spooled files
+        workers: Number of upload threads
+        retries: Attempts after the first failure
+        backoff: Seconds before the first retry, doubled on each attempt
+    """
+
+    def __init__(self, upload, complete, fail=None, spool_dir=None, workers=None, retries=None, backoff=None):
+        self.upload = upload
+        self.complete = complete
+        self.fail = fail
+        self.spool_dir = spool_dir or config.UPLOAD_SPOOL_DIR
+        self.workers = workers or config.UPLOAD_WORKERS
+        self.retries = config.UPLOAD_RETRIES if retries is None else retries
+        self.backoff = config.UPLOAD_RETRY_BACKOFF if backoff is None else backoff
+        self.jobs = TTLCache(maxsize=config.UPLOAD_JOB_LIMIT, ttl=config.UPLOAD_JOB_TTL)
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def spool(self, file):
+        """Copy an uploaded file to disk so it outlives the request"""
+        os.makedirs(self.spool_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=self.spool_dir, suffix=os.path.splitext(file.filename or '')[1])
+        with os.fdopen(fd, 'wb') as spooled:
+            shutil.copyfileobj(getattr(file, 'stream', file), spooled, config.STORAGE_READ_SIZE)
+        return SpooledFile(path, file.filename, file.content_type)
+
+    def submit(self, spooled, interview_id, candidate_name, job_id=None):
+        """
+        Queue a spooled file for upload
+
+        Args:
+            job_id: Id to track the job under, a new one by default
+
+        Returns:
+            str: Job id for status()
+        """
+        job_id = job_id or uuid.uuid4().hex
+        self._set_status(job_id, interview_id, 'pending')
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='resume-upload')
+        self._executor.submit(self._run, job_id, spooled, interview_id, candidate_name)
+        return job_id
+
+    def status(self, job_id):
+        return self.jobs.get(job_id)
+
+    def _set_status(self, job_id, interview_id, status, **extra):
+        self.jobs.set(job_id, dict({
+            'job_id': job_id,
+            'interview_id': interview_id,
+            'status': status
+        }, **extra))
+
+    def _run(self, job_id, spooled, interview_id, candidate_name):
+        error = None
+        try:
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    time.sleep(self.backoff * 2 ** (attempt - 1))
+                self._set_status(job_id, interview_id, 'uploading', attempts=attempt + 1)
+
+                try:
+                    url = self.upload(spooled.open(), candidate_name)
+                    if url and self.complete(interview_id, url):
+                        self._set_status(job_id, interview_id, 'completed', attempts=attempt + 1, resume_url=url)
+                        return
+                    error = "Failed to upload resume file"
+                except Exception as e:
+                    error = str(e)
+                finally:
+                    spooled.close()
+
+                logger.warning("Resume upload %s attempt %s failed: %s", job_id, attempt + 1, error)
+
+            self._set_status(job_id, interview_id, 'failed', attempts=self.retries + 1, error=error)
+            if self.fail is not None:
+                try:
+                    self.fail(interview_id, error)
+                except Exception as e:
+                    logger.error("Could not record failed resume upload %s: %s", job_id, e)
+        finally:
+            spooled.remove()
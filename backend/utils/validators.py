@@ -1,36 +1,113 @@
-from datetime import datetime
 import re
 
-def validate_date(date_string):
+from .schema import Schema, Field
+from .datetimes import (
+    parse_date, parse_time, resolve_timezone, check_not_past, DATE_ERROR, TIME_ERROR, TIMEZONE_ERROR
+)
+
+# Patterns are compiled once at import and shared by every schema below
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'\+\d{10,}')
+
+SERVICE_INTERESTS = ('Job Interview', 'Career Coaching', 'Technical Assessment')
+
+def validate_date(date_string, tz=None):
     try:
-        date_format = "%Y-%m-%d"
-        date_obj = datetime.strptime(date_string, date_format)
-        current_date = datetime.now()
-        
-        # Set time to midnight for comparison
-        current_date = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        date_obj = date_obj.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        if date_obj < current_date:
-            return False, "Date must be in the future"
-        
-        return True, None
-    
-    except ValueError:
-        return False, "Invalid date format. Use YYYY-MM-DD"
+        date_obj = parse_date(date_string)
+    except (TypeError, ValueError):
+        return False, DATE_ERROR
+
+    # Compare with today in the caller's timezone
+    error = check_not_past(date_obj, tz)
+    return error is None, error
 
 def validate_time(time_string):
     try:
-        time_format = "%H:%M"
-        datetime.strptime(time_string, time_format)
+        parse_time(time_string)
         return True, None
-    
-    except ValueError:
-        return False, "Invalid time format. Use HH:MM (24-hour format)"
+    except (TypeError, ValueError):
+        return False, TIME_ERROR
 
 def validate_email(email):
     # Simple email validation using regex
-    email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if re.match(email_regex, email):
+    if isinstance(email, str) and EMAIL_PATTERN.fullmatch(email):
         return True, None
     return False, "Invalid email format"
+
+def _check(validator, message):
+    # Adapt a (valid, error) validator to a schema check
+    def check(value):
+        if not isinstance(value, str):
+            return message
+        return validator(value)[1]
+    return check
+
+def _positive(message):
+    return lambda value: None if value > 0 else message
+
+def _date_not_past(values):
+    return check_not_past(values['date'], values.get('timezone'))
+
+# Interview form posted to the monolith (server.py), date and time are local to timezone
+INTERVIEW_FORM_SCHEMA = Schema(
+    Field('candidateName', required=True),
+    Field('interviewer', required=True),
+    Field('date', required=True, coerce=parse_date, message=DATE_ERROR),
+    Field('time', required=True, coerce=parse_time, message=TIME_ERROR),
+    Field('timezone', coerce=resolve_timezone, message=TIMEZONE_ERROR),
+    Field(
+        'duration', required=True, coerce=int, message="Duration must be a valid number",
+        checks=(_positive("Duration must be a positive number"),)
+    ),
+    Field('format', required=True),
+    Field('jobRole', required=True),
+    checks=(_date_not_past,)
+)
+
+# Interview body accepted by the blueprint app (services/interviews.py)
+INTERVIEW_SCHEMA = Schema(
+    Field('candidate_name', required=True),
+    Field('interviewer_name', required=True),
+    Field('interview_date', required=True, checks=(_check(validate_date, "Invalid interview date format"),)),
+    Field('interview_time', required=True, checks=(_check(validate_time, "Invalid interview time format"),))
+)
+
+# Demo request form posted to the monolith
+DEMO_REQUEST_FORM_SCHEMA = Schema(
+    Field('first_name', required=True),
+    Field('last_name', required=True),
+    Field('work_email', required=True, pattern=EMAIL_PATTERN, message="Invalid email format"),
+    Field('agrees_to_terms', required=True, truthy=True)
+)
+
+# Demo request body accepted by the blueprint app
+DEMO_REQUEST_SCHEMA = Schema(
+    Field('first_name', required=True),
+    Field('last_name', required=True),
+    Field('work_email', required=True, pattern=EMAIL_PATTERN, message="Invalid email format"),
+    Field('phone_number', pattern=PHONE_PATTERN, message="Invalid phone number format"),
+    Field(
+        'service_interest', choices=SERVICE_INTERESTS,
+        message=f"Invalid service interest. Valid options are: {', '.join(SERVICE_INTERESTS)}"
+    )
+)
+
+# Slot search posted to /api/interviews/suggest-slots
+SUGGEST_SLOTS_SCHEMA = Schema(
+    Field(
+        'duration', required=True, coerce=int, message="duration must be a number",
+        checks=(_positive("duration must be positive"),)
+    ),
+    Field('dateFrom', required=True, coerce=parse_date, message="dateFrom must be YYYY-MM-DD"),
+    Field('dateTo', required=True, coerce=parse_date, message="dateTo must be YYYY-MM-DD"),
+    Field('limit', coerce=int, message="limit must be a number", checks=(_positive("limit must be positive"),)),
+    Field('jobRole'),
+    Field('interviewers'),
+    Field('timezone', coerce=resolve_timezone, message=TIMEZONE_ERROR)
+)
+
+# Login form
+LOGIN_SCHEMA = Schema(
+    Field('email', required=True, pattern=EMAIL_PATTERN, message="Invalid email format"),
+    Field('password', required=True)
+)
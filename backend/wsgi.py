@@ -0,0 +1,4 @@
+# Production entry point: gunicorn wsgi:app (settings are read from gunicorn.conf.py)
+from app import create_app
+
+app = create_app()
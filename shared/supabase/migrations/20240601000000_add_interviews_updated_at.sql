@@ -0,0 +1,20 @@
+-- Track when each interview last changed, so list responses can be validated without reading every row
+ALTER TABLE public.interviews ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL;
+
+-- Bump updated_at on every update
+CREATE OR REPLACE FUNCTION public.set_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.updated_at = now();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS interviews_set_updated_at ON public.interviews;
+CREATE TRIGGER interviews_set_updated_at
+  BEFORE UPDATE ON public.interviews
+  FOR EACH ROW
+  EXECUTE FUNCTION public.set_updated_at();
+
+-- Newest-first lookups for the list validator
+CREATE INDEX IF NOT EXISTS interviews_updated_at_idx ON public.interviews (updated_at DESC);